@@ -0,0 +1,102 @@
+"""
+Benchmark de arranque en frío por página.
+Cada medición corre en un proceso nuevo. Con `python -X importtime` suma el
+tiempo de importación del script y del módulo de la página, y con AppTest mide
+el primer render completo de la página (primer pintado). Para comparar, el caso
+"antes" importa además las librerías pesadas que el script cargaba completas
+(matplotlib, seaborn, plotly, wordcloud, requests) aunque la página no las use.
+Streamlit importa plotly por su cuenta, así que aparece en todas las páginas.
+
+Uso: python benchmarks/bench_arranque.py [repeticiones]
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+from epiclab.paginas import PAGINAS
+
+# Importaciones del encabezado de chidomad.py antes de separar las páginas
+IMPORTACIONES_ANTES = (
+    "import matplotlib.pyplot, seaborn, plotly.express, plotly.graph_objects, wordcloud, json, random, requests"
+)
+PESADAS = ("matplotlib", "seaborn", "plotly", "wordcloud", "openai", "requests", "PIL")
+
+IMPORTACION = """
+import os, runpy, sys, importlib, warnings, logging
+warnings.filterwarnings("ignore"); logging.disable(logging.CRITICAL)
+sys.path.insert(0, {raiz!r}); os.chdir({raiz!r})
+{antes}
+runpy.run_path("chidomad.py", run_name="arranque")
+importlib.import_module("epiclab.paginas.{modulo}")
+"""
+
+PRIMER_RENDER = """
+import os, sys, time, warnings, logging
+warnings.filterwarnings("ignore"); logging.disable(logging.CRITICAL)
+from streamlit.testing.v1 import AppTest
+script = '''
+import os, sys, runpy
+sys.path.insert(0, {raiz!r}); os.chdir({raiz!r})
+{antes}
+import streamlit_option_menu
+streamlit_option_menu.option_menu = lambda *a, **k: {pagina!r}
+runpy.run_path("chidomad.py", run_name="__main__")
+'''
+at = AppTest.from_string(script, default_timeout=120)
+at.secrets["openai"] = {{"api_key": "x"}}
+inicio = time.perf_counter()
+at.run()
+print((time.perf_counter() - inicio) * 1000)
+"""
+
+
+def importtime(codigo):
+    """(ms totales, {paquete pesado: ms}) a partir de la salida de -X importtime."""
+    proceso = subprocess.run([sys.executable, "-X", "importtime", "-c", codigo],
+                             capture_output=True, text=True, cwd=RAIZ, check=True)
+    total, pesadas = 0, {}
+    for linea in proceso.stderr.splitlines():
+        if not linea.startswith("import time:") or "cumulative" in linea:
+            continue
+        _, acumulado, nombre = linea[len("import time:"):].split("|")
+        paquete = nombre.strip()
+        if nombre[1:2] != " ":  # nivel superior: su tiempo acumulado incluye a sus dependencias
+            total += int(acumulado)
+        if paquete in PESADAS:
+            pesadas[paquete] = int(acumulado) / 1000
+    return total / 1000, pesadas
+
+
+def primer_render(pagina, antes):
+    codigo = PRIMER_RENDER.format(raiz=RAIZ, antes=antes, pagina=pagina)
+    proceso = subprocess.run([sys.executable, "-c", codigo], capture_output=True, text=True, cwd=RAIZ, check=True)
+    return float(proceso.stdout.strip().splitlines()[-1])
+
+
+def medir(pagina, modulo, antes, repeticiones):
+    importacion = [importtime(IMPORTACION.format(raiz=RAIZ, antes=antes, modulo=modulo)) for _ in range(repeticiones)]
+    render = [primer_render(pagina, antes) for _ in range(repeticiones)]
+    pesadas = sorted(importacion[-1][1])
+    return statistics.median(t for t, _ in importacion), statistics.median(render), pesadas
+
+
+def main():
+    repeticiones = int(sys.argv[1]) if len(sys.argv) > 1 else 3
+    print(f"Mediana de {repeticiones} procesos nuevos por página\n")
+    print(f"{'página':>19} | {'import antes':>12} | {'import ahora':>12} | {'render antes':>12} | "
+          f"{'render ahora':>12} | pesadas al importar (ahora)")
+    print("-" * 112)
+    for pagina, (modulo, _) in PAGINAS.items():
+        importacion_antes, render_antes, _ = medir(pagina, modulo, IMPORTACIONES_ANTES, repeticiones)
+        importacion, render, pesadas = medir(pagina, modulo, "", repeticiones)
+        print(f"{pagina:>19} | {importacion_antes:>9.0f} ms | {importacion:>9.0f} ms | {render_antes:>9.0f} ms | "
+              f"{render:>9.0f} ms | {', '.join(pesadas) or '-'}")
+
+
+if __name__ == "__main__":
+    main()
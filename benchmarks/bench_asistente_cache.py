@@ -0,0 +1,80 @@
+"""
+Benchmark del caché de respuestas del asistente contra el servidor OpenAI simulado.
+Simula clics de muchos usuarios en las sugerencias rápidas (con los tres tonos)
+y compara peticiones al modelo y latencia por clic sin caché contra con caché.
+
+Uso: python benchmarks/bench_asistente_cache.py [clics] [primer_token_s]
+"""
+
+import os
+import sys
+import time
+
+import numpy as np
+import openai
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from epiclab.asistente import (
+    TONOS,
+    construir_mensajes,
+    estadisticas_respuestas,
+    guardar_respuesta,
+    llave_respuesta,
+    respuesta_en_cache,
+    responder,
+)
+from fake_openai import iniciar_fake
+
+SUGERENCIAS = [
+    "¿Cómo mejorar viralidad?",
+    "Dame una idea para un post sobre innovación",
+    "¿Qué significa el score de inclusividad?",
+    "¿Cómo usar esta plataforma?",
+]
+
+
+def clic(cliente, prompt, tono, cache):
+    llave = llave_respuesta(prompt, tono) if cache else None
+    if llave is not None:
+        texto = respuesta_en_cache(llave)
+        if texto is not None:
+            return texto
+    texto = responder(construir_mensajes([{"role": "user", "content": prompt}], tono), cliente)
+    if llave is not None:
+        guardar_respuesta(llave, texto)
+    return texto
+
+
+def main():
+    clics = int(sys.argv[1]) if len(sys.argv) > 1 else 60
+    primer_token = float(sys.argv[2]) if len(sys.argv) > 2 else 0.3
+    servidor, base_url = iniciar_fake(primer_token, 0.002)
+    cliente = openai.OpenAI(api_key="x", base_url=base_url)
+    rng = np.random.default_rng(0)
+    secuencia = [(SUGERENCIAS[rng.integers(len(SUGERENCIAS))], list(TONOS)[rng.integers(len(TONOS))])
+                 for _ in range(clics)]
+
+    resultados = {}
+    for nombre, cache in [("sin caché", False), ("con caché", True)]:
+        antes = servidor.contador["peticiones"]
+        tiempos = []
+        for prompt, tono in secuencia:
+            inicio = time.perf_counter()
+            clic(cliente, prompt, tono, cache)
+            tiempos.append((time.perf_counter() - inicio) * 1000)
+        resultados[nombre] = (servidor.contador["peticiones"] - antes, np.array(tiempos))
+    servidor.shutdown()
+
+    print(f"{clics} clics en {len(SUGERENCIAS)} sugerencias × {len(TONOS)} tonos, primer token {primer_token * 1000:.0f} ms\n")
+    print(f"{'modo':>10} | {'peticiones':>10} | {'ms p50':>8} | {'ms total':>9}")
+    print("-" * 48)
+    for nombre, (peticiones, tiempos) in resultados.items():
+        print(f"{nombre:>10} | {peticiones:>10} | {np.percentile(tiempos, 50):>8.2f} | {tiempos.sum():>9.0f}")
+    print(f"\nCaché: {estadisticas_respuestas()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+Benchmark del armado de contexto del asistente.
+Compara los tokens de entrada por petición del armado anterior (prompt de sistema
+con el texto analizado completo y los últimos 6 mensajes sin importar su tamaño)
+contra el armado con presupuesto, en conversaciones con un post largo pegado.
+
+Uso: python benchmarks/bench_asistente_contexto.py [presupuesto_tokens]
+"""
+
+import os
+import sys
+import time
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+from epiclab.asistente import SYSTEM_PROMPT, TONOS, construir_mensajes, contar_mensajes
+
+POST = ("Este semestre el EPIC Lab lanzó el MAD Challenge para que estudiantes del ITAM "
+        "diseñen soluciones de impacto social con mentoras y mentores de la comunidad emprendedora. ") * 60
+SCORE = {"viralidad": 62, "relevancia_social": 74, "inclusividad": 55, "claridad": 81, "tono_positivo": 88}
+
+
+def construir_anterior(historial, tono, ultimo_score, ultimo_texto):
+    # Referencia: el armado original sin presupuesto
+    sistema = SYSTEM_PROMPT + f"\n\n{TONOS[tono]}"
+    sistema += "\nContexto adicional - Último análisis de impacto social:\n"
+    for clave, valor in ultimo_score.items():
+        sistema += f"- {clave}: {valor}/100\n"
+    sistema += f"\nÚltimo texto analizado: '{ultimo_texto}'\n"
+    return [{"role": "system", "content": sistema}] + [dict(m) for m in historial[-6:]]
+
+
+def conversacion(turnos):
+    historial = [{"role": "assistant", "content": "¡Hola! Soy tu Asesor de Contenido Inteligente del EPIC Lab."}]
+    for i in range(turnos):
+        historial.append({"role": "user", "content": f"Mejora este post: {POST}" if i == 0 else f"¿Y qué tal la versión {i}?"})
+        historial.append({"role": "assistant", "content": f"Aquí tienes una versión mejorada: {POST[:1500]}"})
+    historial.append({"role": "user", "content": "¿Qué hashtags me recomiendas?"})
+    return historial
+
+
+def main():
+    presupuesto = int(sys.argv[1]) if len(sys.argv) > 1 else None
+    print(f"{'turnos':>6} | {'tokens antes':>12} | {'tokens después':>14} | {'ahorro':>6} | {'ms armado':>9}")
+    print("-" * 62)
+    for turnos in (1, 3, 6, 12):
+        historial = conversacion(turnos)
+        antes = contar_mensajes(construir_anterior(historial, "profesional", SCORE, POST))
+        inicio = time.perf_counter()
+        for _ in range(20):
+            mensajes = construir_mensajes(historial, "profesional", SCORE, POST, presupuesto=presupuesto)
+        ms = (time.perf_counter() - inicio) / 20 * 1000
+        despues = contar_mensajes(mensajes)
+        print(f"{turnos:>6} | {antes:>12} | {despues:>14} | {1 - despues / antes:>6.0%} | {ms:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
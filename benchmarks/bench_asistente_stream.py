@@ -0,0 +1,49 @@
+"""
+Benchmark del asistente contra el servidor OpenAI simulado.
+Compara la respuesta bloqueante (la página queda congelada hasta recibir todo)
+contra la respuesta en streaming: tiempo al primer token visible y latencia total.
+
+Uso: python benchmarks/bench_asistente_stream.py [primer_token_s] [entre_tokens_s] [peticiones]
+"""
+
+import os
+import sys
+
+import numpy as np
+import openai
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from epiclab.asistente import construir_mensajes, responder, responder_stream, ultimas_latencias
+from fake_openai import iniciar_fake
+
+
+def main():
+    primer_token = float(sys.argv[1]) if len(sys.argv) > 1 else 0.5
+    entre_tokens = float(sys.argv[2]) if len(sys.argv) > 2 else 0.02
+    peticiones = int(sys.argv[3]) if len(sys.argv) > 3 else 10
+    servidor, base_url = iniciar_fake(primer_token, entre_tokens)
+    cliente = openai.OpenAI(api_key="x", base_url=base_url)
+    mensajes = construir_mensajes([{"role": "user", "content": "¿Cómo mejorar viralidad?"}], "profesional")
+
+    resultados = {}
+    for nombre, funcion in [("bloqueante", lambda: responder(mensajes, cliente)),
+                            ("streaming", lambda: "".join(responder_stream(mensajes, cliente)))]:
+        textos = [funcion() for _ in range(peticiones)]
+        assert all(textos) and len(set(textos)) == 1
+        metricas = ultimas_latencias(peticiones)
+        resultados[nombre] = (np.array([m["primer_token"] for m in metricas]) * 1000,
+                              np.array([m["total"] for m in metricas]) * 1000)
+    servidor.shutdown()
+
+    print(f"Servidor simulado: primer token {primer_token * 1000:.0f} ms, {entre_tokens * 1000:.0f} ms entre tokens, {peticiones} peticiones\n")
+    print(f"{'modo':>12} | {'1er token p50':>13} | {'1er token p99':>13} | {'total p50':>10}")
+    print("-" * 58)
+    for nombre, (primero, total) in resultados.items():
+        print(f"{nombre:>12} | {np.percentile(primero, 50):>10.0f} ms | {np.percentile(primero, 99):>10.0f} ms | {np.percentile(total, 50):>7.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Microbenchmark del servicio de imágenes.
+Compara, para las imágenes de `assets/` que muestran el Dashboard y Analytics,
+los bytes enviados y el tiempo de preparación por render de página:
+antes (st.image con la ruta: se lee el PNG completo en cada rerun) contra
+después (variante reducida servida desde el LRU en memoria).
+
+Uso: python benchmarks/bench_assets.py [ancho]
+"""
+
+import os
+import sys
+import time
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+from epiclab.assets import limpiar_cache, variante_imagen
+
+IMAGENES = [
+    "assets/publicadoresmasinflu.png",
+    "assets/publicacionesporusuariosentimiento.png",
+    "assets/publicacionesporgenero.png",
+]
+RENDERS = 200
+
+
+def render_antes():
+    enviados = 0
+    for ruta in IMAGENES:
+        with open(ruta, "rb") as f:
+            enviados += len(f.read())
+    return enviados
+
+
+def render_despues(ancho):
+    return sum(len(variante_imagen(ruta, ancho)) for ruta in IMAGENES)
+
+
+def medir(funcion):
+    inicio = time.perf_counter()
+    for _ in range(RENDERS):
+        enviados = funcion()
+    return (time.perf_counter() - inicio) / RENDERS, enviados
+
+
+def main():
+    os.chdir(RAIZ)
+    ancho = int(sys.argv[1]) if len(sys.argv) > 1 else 1200
+
+    limpiar_cache()
+    inicio = time.perf_counter()
+    render_despues(ancho)
+    t_frio = time.perf_counter() - inicio
+
+    t_antes, bytes_antes = medir(render_antes)
+    t_despues, bytes_despues = medir(lambda: render_despues(ancho))
+
+    print(f"{len(IMAGENES)} imágenes por render, ancho de contenedor {ancho}px\n")
+    print(f"{'escenario':>30} | {'KB enviados':>11} | {'ms por render':>13}")
+    print("-" * 62)
+    print(f"{'antes (PNG completo)':>30} | {bytes_antes / 1024:>11.1f} | {t_antes * 1000:>13.3f}")
+    print(f"{'después (primer render)':>30} | {bytes_despues / 1024:>11.1f} | {t_frio * 1000:>13.3f}")
+    print(f"{'después (desde LRU)':>30} | {bytes_despues / 1024:>11.1f} | {t_despues * 1000:>13.3f}")
+    print(f"\nReducción de bytes por render: {100 * (1 - bytes_despues / bytes_antes):.0f}%")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+Backtest de precisión y latencia de los modelos de pronóstico de menciones.
+Evalúa con origen rodante (en un pool de procesos si el trabajo lo amerita) todas las series del cubo
+(total, plataformas y temas) y muestra MAPE, sMAPE y tiempos por modelo. Al
+final mide la latencia de `simular_forecast_impacto`, que no tiene historia
+observada contra la cual medir precisión.
+
+Uso: python benchmarks/bench_backtest.py [dias] [procesos] [ruta_export]
+"""
+
+import os
+import sys
+import time
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+from epiclab.backtest import backtest
+from epiclab.contenido import simular_forecast_impacto
+from epiclab.cubo import CuboAgregado
+from epiclab.datos import generar_datos_social_listening
+from epiclab.pronostico import HORIZONTE, series_cubo
+
+
+def main():
+    dias = int(sys.argv[1]) if len(sys.argv) > 1 else 120
+    procesos = int(sys.argv[2]) if len(sys.argv) > 2 else None
+    if len(sys.argv) > 3:
+        from epiclab.ingesta import cargar_export
+
+        df = cargar_export(sys.argv[3])
+    else:
+        df, _ = generar_datos_social_listening(dias, rng=2025)
+    _, Y = series_cubo(CuboAgregado.desde_dataframe(df))
+
+    inicio = time.perf_counter()
+    tabla = backtest(Y, horizonte=HORIZONTE, procesos=procesos)
+    total = time.perf_counter() - inicio
+    secuencial = time.perf_counter()
+    backtest(Y, horizonte=HORIZONTE, procesos=1)
+    secuencial = time.perf_counter() - secuencial
+
+    print(f"{len(Y)} series × {Y.shape[1]} días, horizonte {HORIZONTE} días\n")
+    print(f"{'modelo':>18} | {'ventanas':>8} | {'MAPE %':>7} | {'sMAPE %':>7} | {'ajuste ms':>9} | {'predicción ms':>13}")
+    print("-" * 78)
+    for nombre, fila in tabla.iterrows():
+        print(f"{nombre:>18} | {int(fila['ventanas']):>8} | {fila['mape']:>7.1f} | {fila['smape']:>7.1f} | "
+              f"{fila['ajuste_ms']:>9.2f} | {fila['prediccion_ms']:>13.3f}")
+    modo = f"{procesos} procesos" if procesos else "procesos automáticos"
+    print(f"\nBacktest completo: {total:.2f} s con {modo}, {secuencial:.2f} s secuencial")
+
+    inicio = time.perf_counter()
+    for score in range(0, 101, 5):
+        simular_forecast_impacto(score, rng=score)
+    print(f"simular_forecast_impacto: {(time.perf_counter() - inicio) / 21 * 1000:.2f} ms por llamada")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Benchmark de la actualización incremental del cubo de agregados.
+Primero verifica que `agregar_dias` deja el mismo cubo que reconstruirlo desde el
+DataFrame completo: días nuevos contiguos, días ya existentes, días nuevos después
+de un hueco, días anteriores al inicio y categorías nuevas. Después compara el
+tiempo de agregar un día contra reconstruir el cubo completo.
+
+Uso: python benchmarks/bench_cubo.py [dias] [repeticiones]
+"""
+
+import os
+import statistics
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+from epiclab.cubo import CuboAgregado
+from epiclab.datos import generar_datos_social_listening
+
+
+def mismo_cubo(a, b):
+    """Compara dos cubos por sus menciones, sin depender del orden de las categorías."""
+    if not a.fechas.equals(b.fechas) or any(sorted(a.categorias[d]) != sorted(b.categorias[d]) for d in a.categorias):
+        return False
+    orden = [np.array([a.categorias[d].index(v) for v in b.categorias[d]]) for d in ('plataforma', 'sentimiento', 'tema')]
+    conteos_a = a.conteos[np.ix_(np.arange(len(a.fechas)), *orden)]
+    matriz_a = a.matriz()[np.ix_(*orden)]
+    return np.array_equal(conteos_a, b.conteos) and np.array_equal(matriz_a, b.matriz()) \
+        and a.serie_diaria().equals(b.serie_diaria())
+
+
+def verificar(df):
+    fin = df['fecha_dt'].max().normalize()
+    dias = lambda desde, hasta: df[(df['fecha_dt'] >= fin - pd.Timedelta(days=desde)) & (df['fecha_dt'] < fin - pd.Timedelta(days=hasta))]
+    base = dias(29, -1)
+    desplazado = lambda parte, dias_extra: parte.assign(fecha_dt=parte['fecha_dt'] + pd.Timedelta(days=dias_extra))
+    nueva_plataforma = base.tail(5).assign(plataforma='Mastodon')
+    casos = {
+        'días contiguos': (dias(29, 3), dias(3, -1)),
+        'días existentes': (base, dias(5, 2)),
+        'después de un hueco': (base, desplazado(dias(1, -1), 4)),
+        'antes del inicio': (base, desplazado(dias(1, -1), -40)),
+        'categoría nueva': (base, nueva_plataforma),
+    }
+    for nombre, (previo, nuevo) in casos.items():
+        incremental = CuboAgregado.desde_dataframe(previo).agregar_dias(nuevo)
+        completo = CuboAgregado.desde_dataframe(pd.concat([previo, nuevo], ignore_index=True))
+        assert mismo_cubo(incremental, completo), nombre
+        print(f"  ok: {nombre}")
+
+
+def main():
+    dias = int(sys.argv[1]) if len(sys.argv) > 1 else 365
+    repeticiones = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    df, _ = generar_datos_social_listening(dias, rng=2025)
+
+    print("Verificación de agregar_dias contra reconstruir el cubo:")
+    verificar(df)
+
+    ultimo = df['fecha_dt'].max().normalize()
+    previo, dia = df[df['fecha_dt'] < ultimo], df[df['fecha_dt'] >= ultimo]
+    incremental, completo = [], []
+    for _ in range(repeticiones):
+        cubo = CuboAgregado.desde_dataframe(previo)
+        inicio = time.perf_counter()
+        cubo.agregar_dias(dia)
+        incremental.append((time.perf_counter() - inicio) * 1000)
+        inicio = time.perf_counter()
+        CuboAgregado.desde_dataframe(df)
+        completo.append((time.perf_counter() - inicio) * 1000)
+
+    print(f"\n{len(df):,} filas, {dias} días; mediana de {repeticiones} repeticiones")
+    print(f"  agregar un día:       {statistics.median(incremental):8.2f} ms")
+    print(f"  reconstruir el cubo:  {statistics.median(completo):8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
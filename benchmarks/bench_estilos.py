@@ -0,0 +1,104 @@
+"""
+Bytes que viajan por el websocket en cada rerun, por página.
+Captura los ForwardMsg que produce cada ejecución del script con AppTest y
+emula el caché de mensajes del navegador de Streamlit. Un mensaje que ya se
+envió en la sesión y mide al menos `global.minCachedMessageSize` viaja solo
+como referencia a su hash. Compara el umbral por omisión (10 KB) con el de
+.streamlit/config.toml y muestra cuánto pesa la hoja de estilos.
+
+Uso: python benchmarks/bench_estilos.py [reruns]
+"""
+
+import os
+import sys
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+os.chdir(RAIZ)  # Streamlit lee .streamlit/config.toml del directorio actual
+
+from streamlit import config
+from streamlit.runtime.forward_msg_cache import create_reference_msg
+from streamlit.testing.v1 import AppTest
+from streamlit.testing.v1.local_script_runner import LocalScriptRunner
+
+from epiclab.paginas import PAGINAS
+
+UMBRAL_OMISION = 10 * 1000
+
+PAGINA = f"""
+import os, sys, runpy
+sys.path.insert(0, {RAIZ!r})
+os.chdir({RAIZ!r})
+import streamlit_option_menu
+streamlit_option_menu.option_menu = lambda *a, **k: {{pagina!r}}
+runpy.run_path({os.path.join(RAIZ, 'chidomad.py')!r}, run_name="__main__")
+"""
+
+_capturados = []
+_forward_msgs = LocalScriptRunner.forward_msgs
+
+
+def _capturar(self):
+    mensajes = _forward_msgs(self)
+    _capturados.append(list(mensajes))
+    return mensajes
+
+
+LocalScriptRunner.forward_msgs = _capturar
+
+
+def es_estilo(mensaje):
+    if mensaje.WhichOneof("type") != "delta" or mensaje.delta.WhichOneof("type") != "new_element":
+        return False
+    elemento = mensaje.delta.new_element
+    cuerpo = elemento.html.body if elemento.WhichOneof("type") == "html" else elemento.markdown.body
+    return cuerpo.lstrip().startswith("<style>")
+
+
+def bytes_enviados(corridas, umbral):
+    """Bytes por corrida con el caché de mensajes del navegador emulado para `umbral`."""
+    vistos, totales = set(), []
+    for mensajes in corridas:
+        total = 0
+        for mensaje in mensajes:
+            tamano = mensaje.ByteSize()
+            cacheable = tamano >= umbral and mensaje.WhichOneof("type") == "delta" \
+                and mensaje.delta.WhichOneof("type") == "new_element"
+            if cacheable and mensaje.hash in vistos:
+                tamano = create_reference_msg(mensaje).ByteSize()
+            elif cacheable:
+                vistos.add(mensaje.hash)
+            total += tamano
+        totales.append(total)
+    return totales
+
+
+def medir(pagina, reruns):
+    _capturados.clear()
+    at = AppTest.from_string(PAGINA.format(pagina=pagina), default_timeout=120)
+    at.secrets["openai"] = {"api_key": "x"}
+    for _ in range(reruns + 1):
+        at.run()
+    corridas = list(_capturados)
+    estilos = sum(m.ByteSize() for m in corridas[0] if es_estilo(m))
+    return corridas, estilos
+
+
+def main():
+    reruns = int(sys.argv[1]) if len(sys.argv) > 1 else 3
+    umbral = int(config.get_option("global.minCachedMessageSize"))
+    print(f"Bytes de ForwardMsg por corrida; umbral del caché: {UMBRAL_OMISION} B por omisión, {umbral} B configurado\n")
+    print(f"{'página':>19} | {'mensajes':>8} | {'hoja estilos':>12} | {'primera':>9} | "
+          f"{'rerun (10 KB)':>13} | {'rerun (config)':>14}")
+    print("-" * 92)
+    for pagina in PAGINAS:
+        corridas, estilos = medir(pagina, reruns)
+        primera, *resto = bytes_enviados(corridas, umbral)
+        rerun_omision = sum(bytes_enviados(corridas, UMBRAL_OMISION)[1:]) / reruns
+        rerun = sum(resto) / reruns
+        print(f"{pagina:>19} | {len(corridas[-1]):>8} | {estilos:>10} B | {primera:>7} B | "
+              f"{rerun_omision:>11.0f} B | {rerun:>12.0f} B")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""
+Benchmark de la caché de figuras de Plotly (epiclab.graficas).
+Para cada gráfica mide lo que cuesta en un rerun lo mismo que hace
+`st.plotly_chart`: obtener la figura, convertirla a dict y serializarla a JSON.
+"fría" construye la figura desde cero (caché vacía), como antes en cada rerun;
+"caché" la toma ya construida con su especificación memoizada. Al final corre la
+página de Predicciones con AppTest con la caché llena y vaciándola antes de
+cada rerun; con fijar_semilla la curva de alcance de la página se memoiza por
+(score, día), como en modo determinista (EPICLAB_SEMILLA).
+
+Uso: python benchmarks/bench_figuras.py [repeticiones]
+"""
+
+import os
+import statistics
+import sys
+import time
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+import plotly.io
+import plotly.tools
+from streamlit.testing.v1 import AppTest
+
+from epiclab import graficas
+from epiclab.aleatorio import fijar_semilla
+from epiclab.contenido import simular_forecast_impacto
+from epiclab.cubo import CuboAgregado
+from epiclab.datos import generar_datos_social_listening
+from epiclab.impacto import analizar_impacto_social
+from epiclab.paginas.tema import EPIC_COLORS
+from epiclab.pronostico import generar_forecast_menciones
+
+TEXTO = "El EPIC Lab lanza su programa de mentoría para emprendedoras con impacto social en la comunidad"
+
+PAGINA = f"""
+import os, sys, runpy
+sys.path.insert(0, {RAIZ!r})
+os.chdir({RAIZ!r})
+import streamlit_option_menu
+streamlit_option_menu.option_menu = lambda *a, **k: "Predicciones"
+runpy.run_path({os.path.join(RAIZ, 'chidomad.py')!r}, run_name="__main__")
+"""
+
+
+def especificacion(fig):
+    # Lo que hace st.plotly_chart con la figura antes de armar el mensaje
+    return plotly.io.to_json(plotly.tools.return_figure_from_figure_or_data(fig, validate_figure=True), validate=False)
+
+
+def cronometrar(obtener, repeticiones, vaciar):
+    tiempos = []
+    for _ in range(repeticiones):
+        if vaciar:
+            graficas._cache.clear()
+        inicio = time.perf_counter()
+        especificacion(obtener())
+        tiempos.append((time.perf_counter() - inicio) * 1000)
+    return statistics.median(tiempos)
+
+
+def rerun_pagina(repeticiones, vaciar):
+    at = AppTest.from_string(PAGINA, default_timeout=120)
+    at.secrets["openai"] = {"api_key": "x"}
+    at.run()
+    tiempos = []
+    for _ in range(repeticiones):
+        if vaciar:
+            graficas._cache.clear()
+        inicio = time.perf_counter()
+        at.run()
+        tiempos.append((time.perf_counter() - inicio) * 1000)
+        assert not at.exception, [e.value for e in at.exception]
+    return statistics.median(tiempos)
+
+
+def main():
+    repeticiones = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    fijar_semilla(2025)
+    df, _ = generar_datos_social_listening(120, rng=2025)
+    cubo = CuboAgregado.desde_dataframe(df)
+    resultado = analizar_impacto_social(TEXTO)
+    categorias = ['Viralidad', 'Relevancia Social', 'Inclusividad', 'Claridad', 'Tono Positivo']
+    valores = [resultado[c] for c in ('viralidad', 'relevancia_social', 'inclusividad', 'claridad', 'tono_positivo')]
+    forecast = generar_forecast_menciones(cubo)
+    impacto = simular_forecast_impacto(50, rng=50)
+
+    figuras = {
+        'radar_impacto': lambda: graficas.grafica_radar_impacto(categorias, valores, EPIC_COLORS),
+        'forecast_menciones': lambda: graficas.grafica_forecast_menciones(forecast, EPIC_COLORS),
+        'alcance_impacto': lambda: graficas.grafica_alcance_impacto(impacto, EPIC_COLORS),
+        'sentimiento': lambda: graficas.grafica_sentimiento(cubo, EPIC_COLORS),
+        'plataforma_sentimiento': lambda: graficas.grafica_plataforma_sentimiento(cubo, EPIC_COLORS),
+        'tema_sentimiento': lambda: graficas.grafica_tema_sentimiento(cubo, EPIC_COLORS),
+        'sentimiento_diario': lambda: graficas.grafica_sentimiento_diario(cubo, EPIC_COLORS),
+    }
+
+    print(f"Mediana de {repeticiones} llamadas: figura + to_dict + to_json, como en st.plotly_chart\n")
+    print(f"{'figura':>22} | {'fría ms':>8} | {'caché ms':>8} | {'aceleración':>11} | {'JSON':>9}")
+    print("-" * 72)
+    for nombre, obtener in figuras.items():
+        fria = cronometrar(obtener, repeticiones, vaciar=True)
+        cache = cronometrar(obtener, repeticiones, vaciar=False)
+        tamano = len(especificacion(obtener()))
+        print(f"{nombre:>22} | {fria:>8.2f} | {cache:>8.3f} | {fria / cache:>10.0f}x | {tamano:>7} B")
+
+    sin_cache = rerun_pagina(max(3, repeticiones // 4), vaciar=True)
+    con_cache = rerun_pagina(max(3, repeticiones // 4), vaciar=False)
+    print(f"\nRerun de Predicciones: {sin_cache:.1f} ms vaciando la caché, {con_cache:.1f} ms con la caché llena")
+    print(f"Caché de figuras: {graficas.estadisticas_cache()}")
+
+
+if __name__ == "__main__":
+    main()
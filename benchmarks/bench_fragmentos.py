@@ -0,0 +1,89 @@
+"""
+Benchmark de los paneles interactivos como fragmentos de Streamlit.
+Para cada interacción (analizar un post, mover el slider de hashtags y el de
+viralidad) compara el rerun completo de la página contra ejecutar solo el
+cuerpo del fragmento, que es lo que Streamlit vuelve a correr en el navegador
+cuando el widget vive dentro de `@st.fragment`. AppTest siempre vuelve a
+ejecutar el script completo, así que el segundo caso se mide con un script que
+solo llama al panel.
+
+Uso: python benchmarks/bench_fragmentos.py [repeticiones]
+"""
+
+import os
+import statistics
+import sys
+import time
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+from streamlit.testing.v1 import AppTest
+
+TEXTO = "El EPIC Lab lanza su programa de mentoría para emprendedoras con impacto social en la comunidad"
+
+# Página completa: el menú de navegación se sustituye para elegir la página sin clics
+PAGINA = f"""
+import os, sys, runpy
+sys.path.insert(0, {RAIZ!r})
+os.chdir({RAIZ!r})
+import streamlit_option_menu
+streamlit_option_menu.option_menu = lambda *a, **k: {{pagina!r}}
+runpy.run_path({os.path.join(RAIZ, 'chidomad.py')!r}, run_name="__main__")
+"""
+
+# Solo el fragmento: el módulo de la página se importa una vez y cada rerun llama al panel
+FRAGMENTO = f"""
+import importlib, os, sys
+sys.path.insert(0, {RAIZ!r})
+os.chdir({RAIZ!r})
+from epiclab.paginas.tema import aplicar_estilos
+aplicar_estilos()
+getattr(importlib.import_module("epiclab.paginas.{{modulo}}"), {{panel!r}})()
+"""
+
+INTERACCIONES = [
+    # (nombre, página, módulo, panel, preparar, cambiar(at, i))
+    ("analizar post", "Contenido", "contenido", "panel_impacto_social",
+     lambda at: at.text_area(key="texto_impacto").input(TEXTO).run(),
+     lambda at, i: at.button(key="btn_analizar_impacto").click()),
+    ("slider hashtags", "Contenido", "contenido", "panel_hashtags", None,
+     lambda at, i: at.slider(key="slider_cantidad").set_value(5 + i % 10)),
+    ("slider viralidad", "Predicciones", "predicciones", "panel_impacto_contenido", None,
+     lambda at, i: at.slider(key="slider_viralidad").set_value(10 + (i * 7) % 90)),
+]
+
+
+def cronometrar(script, preparar, cambiar, repeticiones):
+    at = AppTest.from_string(script, default_timeout=120)
+    at.secrets["openai"] = {"api_key": "x"}
+    at.run()
+    if preparar:
+        preparar(at)
+    tiempos = []
+    for i in range(repeticiones):
+        cambiar(at, i)
+        inicio = time.perf_counter()
+        at.run()
+        tiempos.append((time.perf_counter() - inicio) * 1000)
+        assert not at.exception, [e.value for e in at.exception]
+    return statistics.median(tiempos)
+
+
+def main():
+    repeticiones = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    filas = []
+    for nombre, pagina, modulo, panel, preparar, cambiar in INTERACCIONES:
+        completo = cronometrar(PAGINA.format(pagina=pagina), preparar, cambiar, repeticiones)
+        fragmento = cronometrar(FRAGMENTO.format(modulo=modulo, panel=panel), preparar, cambiar, repeticiones)
+        filas.append((nombre, pagina, completo, fragmento))
+
+    print(f"Mediana de {repeticiones} reruns por interacción\n")
+    print(f"{'interacción':>17} | {'página':>12} | {'página ms':>9} | {'fragmento ms':>12} | {'aceleración':>11}")
+    print("-" * 74)
+    for nombre, pagina, completo, fragmento in filas:
+        print(f"{nombre:>17} | {pagina:>12} | {completo:>9.1f} | {fragmento:>12.1f} | {completo / fragmento:>10.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""
+Benchmark del generador de datos de social listening.
+Compara el generador vectorizado contra la versión original con ciclos anidados
+y verifica que ambos producen el mismo esquema.
+
+Uso: python benchmarks/bench_generador.py
+"""
+
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from epiclab.datos import COLUMNAS, PLATAFORMAS, SENTIMIENTOS, TEMAS, TERMINOS_BASE, generar_datos_social_listening
+
+
+# Versión original (día x plataforma x sentimiento x tema), conservada como referencia
+def generar_datos_original(dias=30):
+    fechas = [(datetime.now() - timedelta(days=i)).strftime('%Y-%m-%d') for i in range(dias)]
+    fechas.reverse()
+
+    base_menciones = np.linspace(50, 150, dias)
+    ruido = np.random.normal(0, 15, dias)
+    menciones = np.maximum(5, base_menciones + ruido).astype(int)
+
+    medias = {'Twitter/X': (0.35, 0.05), 'Instagram': (0.25, 0.05), 'LinkedIn': (0.20, 0.03),
+              'Facebook': (0.15, 0.03), 'TikTok': (0.05, 0.02)}
+    distribucion_plataforma = {p: np.random.normal(m, s, dias) for p, (m, s) in medias.items()}
+    for i in range(dias):
+        total = sum(distribucion_plataforma[p][i] for p in PLATAFORMAS)
+        for p in PLATAFORMAS:
+            distribucion_plataforma[p][i] /= total
+    menciones_plataforma = {p: (menciones * distribucion_plataforma[p]).astype(int) for p in PLATAFORMAS}
+
+    sentimiento_base = {'Positivo': 0.6, 'Neutral': 0.3, 'Negativo': 0.1}
+    desv_sentimiento = {'Positivo': 0.05, 'Neutral': 0.03, 'Negativo': 0.02}
+    sentimiento_diario = []
+    for i in range(dias):
+        sent_dia = {k: max(0.01, sentimiento_base[k] + np.random.normal(0, desv_sentimiento[k])) for k in sentimiento_base}
+        total = sum(sent_dia.values())
+        sentimiento_diario.append({k: v / total for k, v in sent_dia.items()})
+
+    medias_tema = [(0.25, 0.05), (0.20, 0.04), (0.15, 0.04), (0.12, 0.03), (0.10, 0.03), (0.10, 0.03), (0.08, 0.02)]
+    tema_diario = []
+    for i in range(dias):
+        tema_dia = {t: max(0.01, np.random.normal(m, s)) for t, (m, s) in zip(TEMAS, medias_tema)}
+        total = sum(tema_dia.values())
+        tema_diario.append({k: v / total for k, v in tema_dia.items()})
+
+    data = []
+    for i in range(dias):
+        for p in PLATAFORMAS:
+            menciones_p = menciones_plataforma[p][i]
+            for sentimiento, proporcion in sentimiento_diario[i].items():
+                menciones_s = int(menciones_p * proporcion)
+                for tema, prop_tema in tema_diario[i].items():
+                    menciones_t = int(menciones_s * prop_tema)
+                    if menciones_t > 0:
+                        data.append({'fecha': fechas[i], 'plataforma': p, 'menciones': menciones_t,
+                                     'sentimiento': sentimiento, 'tema': tema})
+
+    df = pd.DataFrame(data)
+    df['fecha_dt'] = pd.to_datetime(df['fecha'])
+    return df, dict(TERMINOS_BASE)
+
+
+def medir(funcion, repeticiones=5):
+    tiempos = []
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        resultado = funcion()
+        tiempos.append(time.perf_counter() - inicio)
+    return min(tiempos), resultado
+
+
+def verificar_esquema(df_original, df_nuevo):
+    assert list(df_nuevo.columns) == COLUMNAS, df_nuevo.columns
+    assert list(df_original.columns) == COLUMNAS, df_original.columns
+    assert set(df_nuevo['plataforma'].unique()) <= set(PLATAFORMAS)
+    assert set(df_nuevo['sentimiento'].unique()) <= set(SENTIMIENTOS)
+    assert set(df_nuevo['tema'].unique()) <= set(TEMAS)
+    assert (df_nuevo['menciones'] > 0).all()
+    assert pd.api.types.is_datetime64_any_dtype(df_nuevo['fecha_dt'])
+    assert (pd.to_datetime(df_nuevo['fecha'].astype(str)) == df_nuevo['fecha_dt']).all()
+
+    # Misma semilla -> mismo resultado
+    a, _ = generar_datos_social_listening(90, rng=np.random.default_rng(7), fecha_fin='2025-03-23')
+    b, _ = generar_datos_social_listening(90, rng=np.random.default_rng(7), fecha_fin='2025-03-23')
+    pd.testing.assert_frame_equal(a, b)
+
+
+def main():
+    np.random.seed(0)
+    df_original, _ = generar_datos_original(30)
+    df_nuevo, _ = generar_datos_social_listening(30, rng=np.random.default_rng(0))
+    verificar_esquema(df_original, df_nuevo)
+    print("Esquema verificado:", ", ".join(COLUMNAS))
+    print()
+
+    print(f"{'días':>6} | {'original (ms)':>14} | {'vectorizado (ms)':>16} | {'aceleración':>11} | {'memoria orig/nueva (KB)':>24}")
+    print("-" * 84)
+    for dias in (30, 365, 1095):
+        t_orig, (df_o, _) = medir(lambda: generar_datos_original(dias), repeticiones=3)
+        rng = np.random.default_rng(0)
+        t_nuevo, (df_n, _) = medir(lambda: generar_datos_social_listening(dias, rng=rng))
+        mem_o = df_o.memory_usage(deep=True).sum() / 1024
+        mem_n = df_n.memory_usage(deep=True).sum() / 1024
+        print(f"{dias:>6} | {t_orig * 1000:>14.1f} | {t_nuevo * 1000:>16.2f} | {t_orig / t_nuevo:>10.0f}x | {mem_o:>11.0f} / {mem_n:<10.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Benchmark del medidor de impacto social.
+Compara el tiempo por texto de la versión original (un texto por llamada,
+búsquedas lineales en listas y time.sleep(1)) contra `analizar_impacto_lote`.
+La versión original se mide sin el sleep sobre el lote completo y el sleep se
+suma aparte, para no esperar un segundo por texto.
+
+Uso: python benchmarks/bench_impacto.py [textos]
+"""
+
+import os
+import random
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from epiclab.impacto import DIMENSIONES, PALABRAS_CLAVE, analizar_impacto_lote
+
+RETRASO_ORIGINAL = 1.0  # time.sleep(1) al final de cada llamada
+
+
+# Versión original sin el time.sleep(1), conservada como referencia
+def analizar_impacto_original(texto):
+    if not texto or len(texto) < 10:
+        return [30, 25, 40, 35, 45]
+    palabras = texto.lower().split()
+    longitud = len(palabras)
+    palabras_viralidad = ['innovación', 'disruptivo', 'revolucionario', 'increíble', 'sorprendente', 'único', 'exclusivo']
+    palabras_relevancia = ['impacto', 'comunidad', 'sociedad', 'problema', 'solución', 'futuro', 'cambio', 'transformación']
+    palabras_inclusividad = ['todos', 'todas', 'diversidad', 'inclusión', 'accesible', 'oportunidad', 'equidad']
+    palabras_claridad = ['simple', 'claro', 'directo', 'específico', 'concreto', 'ejemplo', 'paso']
+    palabras_positivo = ['éxito', 'logro', 'beneficio', 'ventaja', 'positivo', 'mejora', 'crecimiento', 'desarrollo']
+    base = [random.randint(40, 60), random.randint(45, 65), random.randint(35, 55), random.randint(50, 70), random.randint(45, 65)]
+    factor = 0.8 if longitud < 20 else 0.9 if longitud > 200 else 1.0
+    for palabra in palabras:
+        for i, lista in enumerate([palabras_viralidad, palabras_relevancia, palabras_inclusividad, palabras_claridad, palabras_positivo]):
+            if palabra in lista:
+                base[i] += 5
+    return [min(100, max(0, int(b * factor))) for b in base]
+
+
+def generar_textos(n, semilla=7):
+    rng = np.random.default_rng(semilla)
+    clave = sorted(set().union(*PALABRAS_CLAVE.values()))
+    relleno = ["el", "lab", "emprendedores", "programa", "nuevo", "ideas", "proyecto", "mentoría", "itam", "startup"]
+    vocabulario = np.array(clave + relleno * 4)
+    longitudes = rng.integers(5, 60, size=n)
+    return [" ".join(rng.choice(vocabulario, size=k)) for k in longitudes]
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    textos = generar_textos(n)
+
+    inicio = time.perf_counter()
+    for texto in textos:
+        analizar_impacto_original(texto)
+    t_original = (time.perf_counter() - inicio) / n
+
+    analizar_impacto_lote(textos[:100])  # calentamiento
+    inicio = time.perf_counter()
+    resultado = analizar_impacto_lote(textos)
+    t_lote = (time.perf_counter() - inicio) / n
+    assert list(resultado.columns) == list(DIMENSIONES) and len(resultado) == n
+    # Modo determinista: mismas entradas y semilla -> mismas puntuaciones
+    assert analizar_impacto_lote(textos, rng=2025).equals(analizar_impacto_lote(textos, rng=2025))
+
+    print(f"{n:,} textos\n")
+    print(f"{'versión':>32} | {'µs por texto':>13} | {'aceleración':>11}")
+    print("-" * 62)
+    filas = [
+        ("original (con sleep de 1 s)", t_original + RETRASO_ORIGINAL),
+        ("original (sin sleep)", t_original),
+        ("analizar_impacto_lote", t_lote),
+    ]
+    for nombre, t in filas:
+        print(f"{nombre:>32} | {t * 1e6:>13.2f} | {(t_original + RETRASO_ORIGINAL) / t:>10.0f}x")
+
+
+if __name__ == "__main__":
+    main()
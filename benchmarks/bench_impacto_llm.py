@@ -0,0 +1,85 @@
+"""
+Benchmark del puntuador de impacto con modelo de lenguaje contra el servidor
+OpenAI simulado. Compara una petición por publicación contra lotes de 20 en
+un solo prompt JSON, la segunda pasada desde el caché y los respaldos con la
+heurística (servidor más lento que el timeout y presupuesto agotado).
+
+Uso: python benchmarks/bench_impacto_llm.py [publicaciones] [latencia_servidor_s]
+"""
+
+import os
+import sys
+import time
+
+import numpy as np
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from epiclab.impacto import DIMENSIONES
+from epiclab.impacto_llm import PuntuadorImpactoLLM
+from epiclab.pasarela_llm import PasarelaLLM
+from fake_openai import iniciar_fake
+
+FRASES = [
+    "El EPIC Lab lanza su programa de mentoría para emprendedoras con impacto social en la comunidad",
+    "Únete al MAD Challenge: soluciones innovadoras y accesibles para todos los estudiantes del ITAM",
+    "Nuestro equipo logró un crecimiento increíble gracias a la diversidad de ideas y al trabajo en comunidad",
+    "Paso a paso: cómo validar tu idea de startup con ejemplos concretos y simples",
+]
+
+
+def publicaciones(cantidad):
+    rng = np.random.default_rng(7)
+    return [f"{FRASES[rng.integers(len(FRASES))]} #{i} edición {rng.integers(1000)}" for i in range(cantidad)]
+
+
+def cronometrar(puntuador, textos):
+    inicio = time.perf_counter()
+    resultado = puntuador.analizar_lote(textos)
+    assert list(resultado.columns) == list(DIMENSIONES) and len(resultado) == len(textos)
+    return (time.perf_counter() - inicio) * 1000
+
+
+def main():
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    latencia = float(sys.argv[2]) if len(sys.argv) > 2 else 0.4
+    textos = publicaciones(cantidad)
+    servidor, base_url = iniciar_fake(latencia, 0.0, tokens=2000)
+    pasarela = PasarelaLLM(api_key="x", base_url=base_url, concurrencia=8, peticiones_minuto=6000, tokens_minuto=10 ** 7)
+    filas = []
+
+    uno = PuntuadorImpactoLLM(pasarela, por_peticion=1, tokens_minuto=10 ** 7, timeout=600)
+    antes = servidor.contador["peticiones"]
+    filas.append(("una petición por post", cronometrar(uno, textos), servidor.contador["peticiones"] - antes, uno.estadisticas()))
+
+    lotes = PuntuadorImpactoLLM(pasarela, tokens_minuto=10 ** 7, timeout=60)
+    antes = servidor.contador["peticiones"]
+    filas.append(("lotes de 20", cronometrar(lotes, textos), servidor.contador["peticiones"] - antes, lotes.estadisticas()))
+    antes = servidor.contador["peticiones"]
+    filas.append(("lotes (caché)", cronometrar(lotes, textos), servidor.contador["peticiones"] - antes, lotes.estadisticas()))
+
+    lento = PuntuadorImpactoLLM(pasarela, tokens_minuto=10 ** 7, timeout=latencia / 4)
+    antes = servidor.contador["peticiones"]
+    filas.append(("timeout -> heurística", cronometrar(lento, textos), servidor.contador["peticiones"] - antes, lento.estadisticas()))
+
+    sin_presupuesto = PuntuadorImpactoLLM(pasarela, tokens_minuto=2000, timeout=60)
+    antes = servidor.contador["peticiones"]
+    filas.append(("presupuesto agotado", cronometrar(sin_presupuesto, textos), servidor.contador["peticiones"] - antes,
+                  sin_presupuesto.estadisticas()))
+
+    time.sleep(latencia * 2)  # deja terminar las peticiones que siguen en segundo plano
+    pasarela.cerrar()
+    servidor.shutdown()
+
+    print(f"{cantidad} publicaciones, servidor con {latencia * 1000:.0f} ms por petición\n")
+    print(f"{'escenario':>22} | {'ms':>8} | {'peticiones':>10} | {'llm':>5} | {'caché':>5} | {'heurística':>10}")
+    print("-" * 76)
+    for nombre, ms, peticiones, e in filas:
+        heuristica = e["sin_presupuesto"] + e["timeout"]
+        print(f"{nombre:>22} | {ms:>8.0f} | {peticiones:>10} | {e['llm']:>5} | {e['cache']:>5} | {heuristica:>10}")
+
+
+if __name__ == "__main__":
+    main()
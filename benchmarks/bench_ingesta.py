@@ -0,0 +1,111 @@
+"""
+Benchmark de ingesta de exportaciones de social listening.
+Genera una exportación CSV sintética (una fila por mención) y compara:
+lectura completa con pandas.read_csv, primera conversión a Parquet,
+carga desde Parquet en frío y carga memoizada en el mismo proceso. Antes de
+medir, verifica que los textos leídos por bloques den los mismos conteos de
+términos que leídos de una vez.
+
+Uso: python benchmarks/bench_ingesta.py [filas]
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+
+def crear_export(ruta, filas, rng):
+    # Exportación con nombres de columna en inglés, como la entregan las herramientas
+    plataformas = np.array(['twitter', 'Instagram', 'LinkedIn', 'facebook', 'TikTok'])
+    sentimientos = np.array(['positive', 'neutral', 'negative'])
+    temas = np.array(['Emprendimiento', 'Innovación', 'Tecnología', 'Finanzas', 'Negocios', 'Educación', 'Eventos'])
+    bloque = 1_000_000
+    inicio = np.datetime64('2024-01-01T00:00:00')
+    for i, desde in enumerate(range(0, filas, bloque)):
+        n = min(bloque, filas - desde)
+        pd.DataFrame({
+            'Date': inicio + rng.integers(0, 450 * 86400, n).astype('timedelta64[s]'),
+            'Source': plataformas[rng.integers(0, len(plataformas), n)],
+            'Sentiment': sentimientos[rng.choice(3, n, p=[0.6, 0.3, 0.1])],
+            'Topic': temas[rng.integers(0, len(temas), n)],
+            'Author': 'usuario_' + pd.Series(rng.integers(0, 50_000, n)).astype(str),
+            'Text': 'Mención sobre el EPIC Lab y el emprendimiento en México',
+        }).to_csv(ruta, mode='w' if i == 0 else 'a', header=i == 0, index=False)
+
+
+def verificar_textos_por_bloques(ruta):
+    # Los bloques de leer_textos_export conservan la numeración de filas del archivo
+    from epiclab.ingesta import leer_textos_export
+    from epiclab.nube_palabras import MotorTerminos
+
+    pd.DataFrame({
+        'Sentiment': ['positive', 'negative', 'neutral', 'positive', 'negative'] * 2,
+        'Text': [f'Mentoría número {n} de emprendimiento social en México' for n in 'abcdefghij'],
+    }).to_csv(ruta, index=False)
+    por_bloques, completo = MotorTerminos(), MotorTerminos()
+    for textos, sentimientos in leer_textos_export(ruta, tamano_bloque=4):
+        por_bloques.agregar(textos, sentimientos)
+    for textos, sentimientos in leer_textos_export(ruta):
+        completo.agregar(textos, sentimientos)
+    for sentimiento in ('Positivo', 'Neutral', 'Negativo'):
+        assert por_bloques.top(sentimiento) == completo.top(sentimiento), sentimiento
+
+
+def cronometrar(funcion):
+    inicio = time.perf_counter()
+    resultado = funcion()
+    return time.perf_counter() - inicio, resultado
+
+
+def carga_en_frio(ruta):
+    # Un proceso nuevo no tiene la memoización en memoria: mide solo la lectura del Parquet
+    codigo = (
+        "import sys, time; sys.path.insert(0, %r); from epiclab.ingesta import cargar_export; "
+        "t = time.perf_counter(); cargar_export(%r); print(time.perf_counter() - t)"
+    ) % (RAIZ, ruta)
+    salida = subprocess.run([sys.executable, '-c', codigo], capture_output=True, text=True, check=True)
+    return float(salida.stdout.strip().splitlines()[-1])
+
+
+def main():
+    filas = int(sys.argv[1]) if len(sys.argv) > 1 else 5_000_000
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ['EPICLAB_CACHE_DIR'] = tmp
+        from epiclab import ingesta
+        ingesta.DIR_CACHE = tmp
+
+        verificar_textos_por_bloques(os.path.join(tmp, 'textos.csv'))
+
+        ruta = os.path.join(tmp, 'export.csv')
+        print(f"Generando exportación de {filas:,} filas...")
+        crear_export(ruta, filas, np.random.default_rng(0))
+        print(f"Tamaño: {os.path.getsize(ruta) / 1024 ** 2:.0f} MB\n")
+
+        t_csv, _ = cronometrar(lambda: pd.read_csv(ruta))
+        t_conv, _ = cronometrar(lambda: ingesta.convertir_a_parquet(ruta))
+        t_frio = carga_en_frio(ruta)
+        ingesta.cargar_export(ruta)
+        t_memo, df = cronometrar(lambda: ingesta.cargar_export(ruta))
+
+        assert list(df.columns) == ['fecha', 'plataforma', 'menciones', 'sentimiento', 'tema', 'fecha_dt']
+        assert int(df['menciones'].sum()) == filas
+
+        print(f"{'operación':>36} | {'tiempo (s)':>10}")
+        print("-" * 50)
+        print(f"{'pandas.read_csv (cada arranque)':>36} | {t_csv:>10.2f}")
+        print(f"{'conversión a Parquet (una vez)':>36} | {t_conv:>10.2f}")
+        print(f"{'carga desde Parquet (proceso nuevo)':>36} | {t_frio:>10.3f}")
+        print(f"{'carga memoizada (mismo proceso)':>36} | {t_memo:>10.5f}")
+        print(f"\nFilas agregadas en el dashboard: {len(df):,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+Benchmark de memoria residente por sesión.
+Simula N sesiones con una copia privada del dataset cada una (antes) contra
+N vistas del dataset compartido (después). Cada escenario corre en un
+subproceso para medir el RSS sin interferencias.
+
+Uso: python benchmarks/bench_memoria_sesiones.py [sesiones] [dias]
+"""
+
+import os
+import subprocess
+import sys
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+
+def escenario(modo, sesiones, dias):
+    import numpy as np
+
+    from epiclab.compartido import memoria_residente_mb
+    from epiclab.datos import generar_datos_social_listening
+
+    # Calentamiento: excluye del conteo la memoria de imports y cachés internas
+    generar_datos_social_listening(dias, rng=np.random.default_rng(12345))
+    base = memoria_residente_mb()
+    vistas = []
+    if modo == "antes":
+        # Cada sesión construye y guarda su propio DataFrame
+        for i in range(sesiones):
+            df, _ = generar_datos_social_listening(dias, rng=np.random.default_rng(i))
+            vistas.append(df)
+    else:
+        # Un único DataFrame compartido y una vista superficial por sesión
+        compartido, _ = generar_datos_social_listening(dias, rng=np.random.default_rng(0))
+        for _ in range(sesiones):
+            vistas.append(compartido.copy(deep=False))
+    total = memoria_residente_mb() - base
+    print(f"{total:.3f}")
+
+
+def main():
+    sesiones = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    dias = int(sys.argv[2]) if len(sys.argv) > 2 else 365
+
+    resultados = {}
+    for modo in ("antes", "despues"):
+        salida = subprocess.run(
+            [sys.executable, __file__, "--escenario", modo, str(sesiones), str(dias)],
+            capture_output=True, text=True, check=True
+        )
+        resultados[modo] = float(salida.stdout.strip().splitlines()[-1])
+
+    print(f"{sesiones} sesiones, dataset de {dias} días")
+    print(f"{'escenario':>22} | {'memoria total (MB)':>18} | {'por sesión (MB)':>15}")
+    print("-" * 62)
+    for modo, etiqueta in (("antes", "copia por sesión"), ("despues", "dataset compartido")):
+        print(f"{etiqueta:>22} | {resultados[modo]:>18.2f} | {resultados[modo] / sesiones:>15.3f}")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "--escenario":
+        escenario(sys.argv[2], int(sys.argv[3]), int(sys.argv[4]))
+    else:
+        main()
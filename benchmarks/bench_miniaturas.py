@@ -0,0 +1,74 @@
+"""
+Benchmark de las imágenes de la página de Noticias.
+Con el stub local (imágenes de portada JPEG de ~1.4 MB) compara, para los 8
+artículos de un render, los bytes que recibe el navegador y el tiempo de preparar
+las imágenes: antes (st.image con la URL remota: se descarga la imagen completa
+en cada rerun) contra después (CacheMiniaturas: primera vez, desde memoria y
+desde disco en un proceso nuevo).
+
+Uso: python benchmarks/bench_miniaturas.py [retraso_segundos]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+import requests
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from epiclab.miniaturas import CacheMiniaturas
+from stub_newsapi import articulos, iniciar_stub
+
+RENDERS = 50
+
+
+def render_antes(urls):
+    return sum(len(requests.get(url, timeout=10).content) for url in urls)
+
+
+def render_despues(cache, urls, espera=10):
+    miniaturas = cache.obtener(urls, espera=espera)
+    return sum(len(m) for m in miniaturas.values() if m)
+
+
+def cronometrar(funcion, repeticiones=1):
+    inicio = time.perf_counter()
+    for _ in range(repeticiones):
+        enviados = funcion()
+    return (time.perf_counter() - inicio) / repeticiones * 1000, enviados
+
+
+def main():
+    retraso = float(sys.argv[1]) if len(sys.argv) > 1 else 0.1
+    servidor, url = iniciar_stub(retraso)
+    host = url.split("/")[2]
+    urls = [a["urlToImage"] for a in articulos("emprendimiento", cantidad=8, host=host)]
+
+    t_antes, bytes_antes = cronometrar(lambda: render_antes(urls), 3)
+    with tempfile.TemporaryDirectory() as directorio:
+        cache = CacheMiniaturas(directorio)
+        t_frio, bytes_despues = cronometrar(lambda: render_despues(cache, urls))
+        t_memoria, _ = cronometrar(lambda: render_despues(cache, urls), RENDERS)
+        cache.cerrar()
+        nuevo = CacheMiniaturas(directorio)
+        t_disco, _ = cronometrar(lambda: render_despues(nuevo, urls))
+        estadisticas = nuevo.estadisticas()
+        nuevo.cerrar()
+    servidor.shutdown()
+
+    print(f"{len(urls)} imágenes por render, retraso del servidor {retraso * 1000:.0f} ms\n")
+    print(f"{'escenario':>32} | {'KB al navegador':>15} | {'ms por render':>13}")
+    print("-" * 68)
+    print(f"{'antes (URL remota completa)':>32} | {bytes_antes / 1024:>15.1f} | {t_antes:>13.1f}")
+    print(f"{'después (primera vez)':>32} | {bytes_despues / 1024:>15.1f} | {t_frio:>13.1f}")
+    print(f"{'después (memoria)':>32} | {bytes_despues / 1024:>15.1f} | {t_memoria:>13.3f}")
+    print(f"{'después (disco, proceso nuevo)':>32} | {bytes_despues / 1024:>15.1f} | {t_disco:>13.3f}")
+    print(f"\nCaché: {estadisticas}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Benchmark del simulador Monte Carlo de alcance.
+Compara simular N trayectorias llamando N veces al modelo de una trayectoria
+(ciclo de Python por día, como la versión anterior) contra el arreglo
+(corridas × días) de `simular_trayectorias_alcance`, y mide la llamada completa
+que hace la página en cada movimiento del slider.
+
+Uso: python benchmarks/bench_montecarlo.py [simulaciones]
+"""
+
+import os
+import sys
+import time
+
+import numpy as np
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+from epiclab.contenido import _parametros_alcance, simular_forecast_impacto, simular_trayectorias_alcance
+
+
+def trayectoria_original(score_viralidad, dias, rng):
+    # Referencia: una trayectoria con el ciclo por día de la versión anterior
+    factor_base, (minimo, maximo), exponencial = _parametros_alcance(score_viralidad)
+    alcance_inicial = int(rng.integers(minimo, maximo + 1))
+    ruidos = rng.integers(-5, 11, size=max(dias - 1, 0))
+    alcance = [alcance_inicial]
+    for i in range(1, dias):
+        if exponencial:
+            nuevo_alcance = int(alcance[i-1] * (factor_base - (i * 0.05)))
+        else:
+            nuevo_alcance = int(alcance[i-1] + (alcance_inicial * (factor_base - 1) * (1 - i/10)))
+        alcance.append(max(alcance[i-1], nuevo_alcance + int(ruidos[i-1])))
+    return alcance
+
+
+def cronometrar(funcion, repeticiones=1):
+    inicio = time.perf_counter()
+    for _ in range(repeticiones):
+        resultado = funcion()
+    return (time.perf_counter() - inicio) / repeticiones * 1000, resultado
+
+
+def main():
+    simulaciones = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    dias = 7
+    print(f"{simulaciones} trayectorias de {dias} días\n")
+    print(f"{'score':>5} | {'ciclo ms':>9} | {'vectorizado ms':>14} | {'página ms':>9} | {'p50 ciclo':>9} | {'p50 vect.':>9}")
+    print("-" * 72)
+    for score in (20, 50, 70, 90):
+        rng = np.random.default_rng(score)
+        t_ciclo, original = cronometrar(lambda: np.array([trayectoria_original(score, dias, rng) for _ in range(simulaciones)]))
+        t_vector, vectorizado = cronometrar(lambda: simular_trayectorias_alcance(score, dias, simulaciones, rng=score), 5)
+        t_pagina, _ = cronometrar(lambda: simular_forecast_impacto(score, dias, simulaciones=simulaciones), 5)
+        print(f"{score:>5} | {t_ciclo:>9.1f} | {t_vector:>14.2f} | {t_pagina:>9.2f} | "
+              f"{np.median(original[:, -1]):>9.0f} | {np.median(vectorizado[:, -1]):>9.0f}")
+
+
+if __name__ == "__main__":
+    main()
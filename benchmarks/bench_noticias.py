@@ -0,0 +1,81 @@
+"""
+Benchmark de latencia de la página de Noticias con la API lenta.
+Levanta el stub local de NewsAPI con un retraso y mide p50/p99 del tiempo que
+tarda cada render en obtener las noticias:
+antes (requests.get sin sesión ni caché en cada rerun) contra después
+(ClienteNoticias con caché en disco y refresco en segundo plano). El TTL del
+cliente se reduce para que durante la medición haya entradas vencidas.
+
+Uso: python benchmarks/bench_noticias.py [retraso_segundos] [renders]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+import requests
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from epiclab.noticias import CONSULTA_EMPRENDIMIENTO, ClienteNoticias
+from stub_newsapi import iniciar_stub
+
+INTERVALO = 0.02  # segundos entre reruns simulados
+
+
+def render_antes(url):
+    respuesta = requests.get(url, params=dict(CONSULTA_EMPRENDIMIENTO, apiKey="x"))
+    return respuesta.json()
+
+
+def medir(funcion, renders):
+    tiempos = []
+    for _ in range(renders):
+        inicio = time.perf_counter()
+        datos = funcion()
+        tiempos.append(time.perf_counter() - inicio)
+        assert datos.get("articles"), datos
+        time.sleep(INTERVALO)
+    return np.array(tiempos) * 1000
+
+
+def main():
+    retraso = float(sys.argv[1]) if len(sys.argv) > 1 else 0.5
+    renders = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+    servidor, url = iniciar_stub(retraso)
+
+    with tempfile.TemporaryDirectory() as directorio:
+        # TTL corto: la copia vence varias veces durante la medición
+        cliente = ClienteNoticias(url=url, api_key="x", ttl=0.5, dir_cache=directorio)
+        inicio = time.perf_counter()
+        cliente.obtener(CONSULTA_EMPRENDIMIENTO)
+        t_frio = (time.perf_counter() - inicio) * 1000
+
+        despues = medir(lambda: cliente.obtener(CONSULTA_EMPRENDIMIENTO), renders)
+        # Un proceso nuevo arranca desde el caché en disco
+        nuevo = ClienteNoticias(url=url, api_key="x", ttl=0.5, dir_cache=directorio)
+        inicio = time.perf_counter()
+        nuevo.obtener(CONSULTA_EMPRENDIMIENTO)
+        t_disco = (time.perf_counter() - inicio) * 1000
+        estadisticas = cliente.estadisticas()
+        cliente.cerrar()
+        nuevo.cerrar()
+
+    antes = medir(lambda: render_antes(url), min(renders, 30))
+    servidor.shutdown()
+
+    print(f"API con retraso de {retraso * 1000:.0f} ms, {renders} renders\n")
+    print(f"{'escenario':>34} | {'p50 ms':>9} | {'p99 ms':>9}")
+    print("-" * 58)
+    print(f"{'antes (requests.get por rerun)':>34} | {np.percentile(antes, 50):>9.2f} | {np.percentile(antes, 99):>9.2f}")
+    print(f"{'después (caché + revalidación)':>34} | {np.percentile(despues, 50):>9.3f} | {np.percentile(despues, 99):>9.3f}")
+    print(f"\nPrimera carga sin caché: {t_frio:.1f} ms; arranque desde disco: {t_disco:.2f} ms")
+    print(f"Cliente: {estadisticas}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Benchmark de la agregación de noticias por tema.
+Con el stub local de NewsAPI (retraso por petición) compara el tiempo de tener
+listas las noticias de todos los temas:
+antes (una petición tras otra) contra después (consultas en paralelo con
+ClienteNoticias.obtener_varias) y contra un render leyendo del almacén local.
+
+Uso: python benchmarks/bench_noticias_temas.py [retraso_segundos] [paginas]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+import requests
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from epiclab.noticias import CONSULTAS_TEMAS, NOTICIAS_HILOS, AgregadorNoticias, ClienteNoticias
+from stub_newsapi import iniciar_stub
+
+RENDERS = 200
+
+
+def secuencial(url, paginas):
+    articulos = []
+    for params in CONSULTAS_TEMAS.values():
+        for pagina in range(1, paginas + 1):
+            respuesta = requests.get(url, params=dict(params, page=pagina, apiKey="x"), timeout=10)
+            articulos.extend(respuesta.json()["articles"])
+    return articulos
+
+
+def main():
+    retraso = float(sys.argv[1]) if len(sys.argv) > 1 else 0.3
+    paginas = int(sys.argv[2]) if len(sys.argv) > 2 else 2
+    servidor, url = iniciar_stub(retraso)
+    peticiones = len(CONSULTAS_TEMAS) * paginas
+
+    inicio = time.perf_counter()
+    crudos = secuencial(url, paginas)
+    t_secuencial = time.perf_counter() - inicio
+
+    with tempfile.TemporaryDirectory() as directorio:
+        cliente = ClienteNoticias(url=url, api_key="x", dir_cache=directorio)
+        agregador = AgregadorNoticias(cliente, paginas=paginas)
+        inicio = time.perf_counter()
+        agregador.actualizar()
+        t_paralelo = time.perf_counter() - inicio
+
+        tiempos = []
+        for i in range(RENDERS):
+            tema = list(CONSULTAS_TEMAS)[i % len(CONSULTAS_TEMAS)] if i % 2 else None
+            inicio = time.perf_counter()
+            agregador.articulos(8, tema)
+            tiempos.append(time.perf_counter() - inicio)
+        tiempos = np.array(tiempos) * 1000
+        unicos = len(agregador.almacen)
+        cliente.cerrar()
+    servidor.shutdown()
+
+    print(f"{len(CONSULTAS_TEMAS)} temas x {paginas} páginas = {peticiones} peticiones, retraso {retraso * 1000:.0f} ms, {NOTICIAS_HILOS} hilos\n")
+    print(f"{'escenario':>36} | {'ms':>10}")
+    print("-" * 50)
+    print(f"{'antes (peticiones secuenciales)':>36} | {t_secuencial * 1000:>10.1f}")
+    print(f"{'después (consultas en paralelo)':>36} | {t_paralelo * 1000:>10.1f}")
+    print(f"{'render desde el almacén (p50)':>36} | {np.percentile(tiempos, 50):>10.3f}")
+    print(f"{'render desde el almacén (p99)':>36} | {np.percentile(tiempos, 99):>10.3f}")
+    print(f"\nArtículos recibidos: {len(crudos)}; únicos en el almacén: {unicos}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Benchmark de la pasarela LLM contra el servidor OpenAI simulado con límite de
+peticiones simultáneas (responde 429 al excederlo).
+Muchas sesiones piden respuestas a la vez (la mitad son la misma pregunta
+frecuente): antes cada una llamaba al cliente global por su cuenta (con los
+reintentos del SDK); después todas pasan por la pasarela compartida.
+
+Uso: python benchmarks/bench_pasarela_llm.py [sesiones] [max_concurrentes_servidor]
+"""
+
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import openai
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from epiclab.asistente import construir_mensajes, responder
+from epiclab.pasarela_llm import PasarelaLLM
+from fake_openai import iniciar_fake
+
+
+def peticiones(sesiones):
+    preguntas = []
+    for i in range(sesiones):
+        pregunta = "¿Cómo mejorar viralidad?" if i % 2 == 0 else f"Revisa mi post número {i} sobre el MAD Challenge"
+        preguntas.append(construir_mensajes([{"role": "user", "content": pregunta}], "profesional"))
+    return preguntas
+
+
+def correr(cliente, mensajes):
+    def una(m):
+        inicio = time.perf_counter()
+        try:
+            responder(m, cliente)
+            return True, time.perf_counter() - inicio
+        except Exception:
+            return False, time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=len(mensajes)) as pool:
+        resultados = list(pool.map(una, mensajes))
+    exitos = np.array([r[0] for r in resultados])
+    latencias = np.array([r[1] for r in resultados]) * 1000
+    return exitos.sum(), latencias, (time.perf_counter() - inicio) * 1000
+
+
+def main():
+    sesiones = int(sys.argv[1]) if len(sys.argv) > 1 else 40
+    limite = int(sys.argv[2]) if len(sys.argv) > 2 else 4
+    mensajes = peticiones(sesiones)
+    filas = []
+
+    servidor, base_url = iniciar_fake(0.3, 0.002, tokens=40, max_concurrentes=limite)
+    global_ = openai.OpenAI(api_key="x", base_url=base_url)  # como el cliente global anterior (2 reintentos del SDK)
+    exitos, latencias, total = correr(global_, mensajes)
+    filas.append(("cliente global", exitos, dict(servidor.contador), latencias, total))
+    servidor.shutdown()
+
+    servidor, base_url = iniciar_fake(0.3, 0.002, tokens=40, max_concurrentes=limite)
+    pasarela = PasarelaLLM(api_key="x", base_url=base_url, concurrencia=limite)
+    exitos, latencias, total = correr(pasarela, mensajes)
+    filas.append(("pasarela", exitos, dict(servidor.contador), latencias, total))
+    estadisticas = pasarela.estadisticas()
+    pasarela.cerrar()
+    servidor.shutdown()
+
+    print(f"{sesiones} sesiones simultáneas, servidor con {limite} peticiones simultáneas como máximo\n")
+    print(f"{'modo':>15} | {'éxitos':>6} | {'llamadas':>8} | {'429':>5} | {'p50 ms':>7} | {'p95 ms':>7} | {'total ms':>8}")
+    print("-" * 75)
+    for nombre, exitos, contador, latencias, total in filas:
+        print(f"{nombre:>15} | {exitos:>6} | {contador['peticiones']:>8} | {contador['rechazadas']:>5} | "
+              f"{np.percentile(latencias, 50):>7.0f} | {np.percentile(latencias, 95):>7.0f} | {total:>8.0f}")
+    print(f"\nPasarela: {estadisticas}")
+
+
+if __name__ == "__main__":
+    main()
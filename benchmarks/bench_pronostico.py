@@ -0,0 +1,43 @@
+"""
+Benchmark del motor de pronóstico de menciones.
+Para cubos de distinta historia mide el ajuste en lote de todas las series
+(total, plataformas y temas) contra ajustar serie por serie, y el costo de un
+rerun de la página de Predicciones con los parámetros ya memoizados.
+
+Uso: python benchmarks/bench_pronostico.py
+"""
+
+import os
+import sys
+import time
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, RAIZ)
+
+from epiclab.cubo import CuboAgregado
+from epiclab.datos import generar_datos_social_listening
+from epiclab.pronostico import HoltWinters, ajustar_cubo, generar_forecast_menciones, series_cubo
+
+
+def cronometrar(funcion, repeticiones=1):
+    inicio = time.perf_counter()
+    for _ in range(repeticiones):
+        funcion()
+    return (time.perf_counter() - inicio) / repeticiones * 1000
+
+
+def main():
+    print(f"{'días':>5} | {'series':>6} | {'serie por serie ms':>18} | {'lote ms':>8} | {'rerun memoizado ms':>18}")
+    print("-" * 70)
+    for dias in (30, 90, 365):
+        df, _ = generar_datos_social_listening(dias, rng=2025)
+        cubo = CuboAgregado.desde_dataframe(df)
+        _, Y = series_cubo(cubo)
+        t_serie = cronometrar(lambda: [HoltWinters().ajustar(Y[i:i + 1]) for i in range(len(Y))])
+        t_lote = cronometrar(lambda: ajustar_cubo(cubo))
+        t_rerun = cronometrar(lambda: generar_forecast_menciones(cubo), 20)
+        print(f"{dias:>5} | {len(Y):>6} | {t_serie:>18.1f} | {t_lote:>8.1f} | {t_rerun:>18.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+"""
+Servidor local compatible con `POST /v1/chat/completions` de OpenAI (con y sin streaming).
+Simula el tiempo al primer token y el tiempo entre tokens para probar y medir el
+asistente sin llamar a la API real. Con `max_concurrentes` responde 429 (con
+Retry-After) cuando llegan más peticiones simultáneas que ese límite, como el
+rate limit del proveedor. Con `response_format={"type": "json_object"}` responde
+las puntuaciones de impacto que pide epiclab.impacto_llm.
+
+Uso directo: python benchmarks/fake_openai.py [primer_token_s] [entre_tokens_s] [puerto]
+    OPENAI_BASE_URL=http://127.0.0.1:8766/v1 streamlit run chidomad.py
+Desde código:
+    servidor, base_url = iniciar_fake(primer_token=0.5, entre_tokens=0.02)
+    cliente = openai.OpenAI(api_key="x", base_url=base_url)
+"""
+
+import json
+import sys
+import threading
+import time
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+DIMENSIONES = ("viralidad", "relevancia_social", "inclusividad", "claridad", "tono_positivo")
+FRASE = ("Para mejorar la viralidad de tu post 🚀 empieza con un dato sorprendente, "
+         "cuenta una historia breve de un emprendedor del EPIC Lab y cierra con una invitación clara a participar. ")
+
+
+def puntuaciones_json(ultimo):
+    """Respuesta del modo JSON para el puntuador de impacto: cinco dimensiones por publicación."""
+    try:
+        publicaciones = json.loads(ultimo)["publicaciones"]
+    except (ValueError, KeyError, TypeError):
+        return None
+    resultados = []
+    for p in publicaciones:
+        semilla = zlib.crc32(p["texto"].encode("utf-8"))
+        resultados.append({"id": p["id"], **{d: 30 + (semilla >> (4 * i)) % 60 for i, d in enumerate(DIMENSIONES)}})
+    return json.dumps({"resultados": resultados}, ensure_ascii=False)
+
+
+def respuesta_para(mensajes, tokens, formato=None):
+    """Texto determinista de `tokens` palabras para la conversación."""
+    ultimo = next((m["content"] for m in reversed(mensajes) if m.get("role") == "user"), "")
+    if (formato or {}).get("type") == "json_object":
+        contenido = puntuaciones_json(ultimo)
+        if contenido is not None:
+            return [contenido]
+    palabras = (f"Sobre '{ultimo[:60]}': " + FRASE * (tokens // 20 + 1)).split(" ")
+    return [p + " " for p in palabras[:tokens]]
+
+
+class ManejadorOpenAI(BaseHTTPRequestHandler):
+    primer_token = 0.5
+    entre_tokens = 0.02
+    tokens = 120
+    max_concurrentes = None
+    contador = None  # {"peticiones": n, "streaming": n, "rechazadas": n, "activas": n}, compartido por el servidor
+
+    def do_POST(self):
+        if not self.path.rstrip("/").endswith("/chat/completions"):
+            self._json(404, {"error": {"message": "not found"}})
+            return
+        cuerpo = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+        stream = bool(cuerpo.get("stream"))
+        tokens = min(self.tokens, int(cuerpo.get("max_tokens") or self.tokens))
+        partes = respuesta_para(cuerpo.get("messages", []), tokens, cuerpo.get("response_format"))
+        with self.contador["lock"]:
+            limitada = self.max_concurrentes is not None and self.contador["activas"] >= self.max_concurrentes
+            if limitada:
+                self.contador["rechazadas"] += 1
+            else:
+                self.contador["peticiones"] += 1
+                self.contador["streaming"] += int(stream)
+                self.contador["activas"] += 1
+        if limitada:
+            self._json(429, {"error": {"message": "Rate limit reached", "type": "requests"}}, {"Retry-After": "0.2"})
+            return
+        try:
+            self._responder(cuerpo, stream, partes)
+        finally:
+            with self.contador["lock"]:
+                self.contador["activas"] -= 1
+
+    def _responder(self, cuerpo, stream, partes):
+        base = {"id": f"chatcmpl-{time.time_ns()}", "created": int(time.time()), "model": cuerpo.get("model", "gpt-4o")}
+
+        time.sleep(self.primer_token)
+        if not stream:
+            time.sleep(self.entre_tokens * (len(partes) - 1))
+            self._json(200, dict(base, object="chat.completion", choices=[{
+                "index": 0, "message": {"role": "assistant", "content": "".join(partes)}, "finish_reason": "stop"}],
+                usage={"prompt_tokens": 100, "completion_tokens": len(partes), "total_tokens": 100 + len(partes)}))
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Connection", "close")
+        self.end_headers()
+        for i, parte in enumerate(partes):
+            if i:
+                time.sleep(self.entre_tokens)
+            delta = {"role": "assistant", "content": parte} if i == 0 else {"content": parte}
+            self._evento(dict(base, object="chat.completion.chunk", choices=[{"index": 0, "delta": delta, "finish_reason": None}]))
+        self._evento(dict(base, object="chat.completion.chunk", choices=[{"index": 0, "delta": {}, "finish_reason": "stop"}]))
+        self.wfile.write(b"data: [DONE]\n\n")
+        self.wfile.flush()
+
+    def _evento(self, datos):
+        self.wfile.write(b"data: " + json.dumps(datos, ensure_ascii=False).encode("utf-8") + b"\n\n")
+        self.wfile.flush()
+
+    def _json(self, estado, cuerpo, encabezados=None):
+        datos = json.dumps(cuerpo, ensure_ascii=False).encode("utf-8")
+        self.send_response(estado)
+        for nombre, valor in (encabezados or {}).items():
+            self.send_header(nombre, valor)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(datos)))
+        self.end_headers()
+        self.wfile.write(datos)
+
+    def log_message(self, *args):
+        pass
+
+
+class ServidorFake(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def handle_error(self, request, client_address):
+        # El cliente puede colgar a media respuesta (p. ej. al vencer su timeout): no es un error del servidor
+        if not isinstance(sys.exc_info()[1], (ConnectionResetError, BrokenPipeError)):
+            super().handle_error(request, client_address)
+
+
+def iniciar_fake(primer_token=0.5, entre_tokens=0.02, tokens=120, puerto=0, max_concurrentes=None):
+    """Arranca el servidor en un hilo. Regresa (servidor, base_url); `servidor.contador` cuenta las peticiones."""
+    contador = {"peticiones": 0, "streaming": 0, "rechazadas": 0, "activas": 0, "lock": threading.Lock()}
+    manejador = type("Manejador", (ManejadorOpenAI,), {
+        "primer_token": primer_token, "entre_tokens": entre_tokens, "tokens": tokens,
+        "max_concurrentes": max_concurrentes, "contador": contador})
+    servidor = ServidorFake(("127.0.0.1", puerto), manejador)
+    servidor.contador = contador
+    threading.Thread(target=servidor.serve_forever, daemon=True).start()
+    return servidor, f"http://127.0.0.1:{servidor.server_address[1]}/v1"
+
+
+if __name__ == "__main__":
+    primer_token = float(sys.argv[1]) if len(sys.argv) > 1 else 0.5
+    entre_tokens = float(sys.argv[2]) if len(sys.argv) > 2 else 0.02
+    puerto = int(sys.argv[3]) if len(sys.argv) > 3 else 8766
+    servidor, base_url = iniciar_fake(primer_token, entre_tokens, puerto=puerto)
+    print(f"Servidor OpenAI simulado en {base_url}. Ctrl+C para detener.")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        servidor.shutdown()
@@ -0,0 +1,124 @@
+"""
+Servidor local que imita `GET /v2/everything` de NewsAPI con un retraso configurable.
+Sirve como fixture para los benchmarks de la página de Noticias sin depender de la red.
+También sirve las imágenes de los artículos (`/imagenes/<id>.jpg`, JPEG grandes
+como las imágenes de portada reales).
+
+Uso directo: python benchmarks/stub_newsapi.py [retraso_segundos] [puerto]
+Desde código:
+    servidor, url = iniciar_stub(retraso=0.5)
+    ...
+    servidor.shutdown()
+"""
+
+import hashlib
+import io
+import json
+import sys
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+TEMAS = ["fintech", "startups", "inversión", "mujeres emprendedoras", "MAD Fellows", "innovación", "IA", "educación"]
+
+
+def articulos(consulta, pagina=1, cantidad=8, host="imagenes.example"):
+    """
+    Artículos deterministas para una consulta. Consultas distintas comparten parte
+    de los artículos (misma URL y título) para ejercitar la deduplicación.
+    """
+    ahora = datetime.now(timezone.utc).replace(minute=0, second=0, microsecond=0)
+    resultado = []
+    for i in range(cantidad):
+        n = (pagina - 1) * cantidad + i
+        tema = TEMAS[int(hashlib.sha1(f"{consulta}|{n}".encode("utf-8")).hexdigest()[:2], 16) % len(TEMAS)]
+        semilla = hashlib.sha1(f"{tema}|{n}".encode("utf-8")).hexdigest()
+        publicado = ahora - timedelta(hours=int(semilla[4:6], 16) % 72)
+        resultado.append({
+            "source": {"id": None, "name": f"Fuente {int(semilla[2:4], 16) % 12}"},
+            "author": None,
+            "title": f"{tema.capitalize()}: nota {semilla[:8]}",
+            "description": f"Resumen simulado de la nota {n} sobre {tema}.",
+            "url": f"https://noticias.example/{semilla[:16]}?utm_source=newsapi",
+            "urlToImage": f"http://{host}/imagenes/{semilla[:16]}.jpg",
+            "publishedAt": publicado.strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "content": None,
+        })
+    return resultado
+
+
+_imagenes = {}
+_imagenes_lock = threading.Lock()
+
+
+def imagen_portada(clave, ancho=1920, alto=1080):
+    """JPEG de portada (gradiente con ruido, ~0.5 MB) generado una vez por clave."""
+    with _imagenes_lock:
+        if clave not in _imagenes:
+            import numpy as np
+            from PIL import Image
+
+            rng = np.random.default_rng(int(hashlib.sha1(clave.encode("utf-8")).hexdigest()[:8], 16))
+            base = np.linspace(0, 255, ancho, dtype=np.float32)[None, :, None] * rng.uniform(0.3, 1.0, size=3)
+            pixeles = np.clip(base + rng.normal(0, 40, size=(alto, ancho, 3)), 0, 255).astype(np.uint8)
+            buffer = io.BytesIO()
+            Image.fromarray(pixeles).save(buffer, format="JPEG", quality=90)
+            _imagenes[clave] = buffer.getvalue()
+        return _imagenes[clave]
+
+
+class ManejadorNewsAPI(BaseHTTPRequestHandler):
+    retraso = 0.0
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        params = {k: v[0] for k, v in parse_qs(url.query).items()}
+        time.sleep(self.retraso)
+        if url.path.startswith("/imagenes/"):
+            datos = imagen_portada(url.path.rsplit("/", 1)[-1])
+            self.send_response(200)
+            self.send_header("Content-Type", "image/jpeg")
+            self.send_header("Content-Length", str(len(datos)))
+            self.end_headers()
+            self.wfile.write(datos)
+            return
+        if not url.path.endswith("/everything"):
+            self._responder(404, {"status": "error", "message": "not found"})
+            return
+        cantidad = int(params.get("pageSize", 8))
+        pagina = int(params.get("page", 1))
+        lista = articulos(params.get("q", ""), pagina, cantidad, self.headers.get("Host", "imagenes.example"))
+        self._responder(200, {"status": "ok", "totalResults": len(lista) * 5, "articles": lista})
+
+    def _responder(self, estado, cuerpo):
+        datos = json.dumps(cuerpo, ensure_ascii=False).encode("utf-8")
+        self.send_response(estado)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(datos)))
+        self.end_headers()
+        self.wfile.write(datos)
+
+    def log_message(self, *args):
+        pass
+
+
+def iniciar_stub(retraso=0.0, puerto=0):
+    """Arranca el servidor en un hilo. Regresa (servidor, url de /v2/everything)."""
+    manejador = type("Manejador", (ManejadorNewsAPI,), {"retraso": retraso})
+    servidor = ThreadingHTTPServer(("127.0.0.1", puerto), manejador)
+    servidor.daemon_threads = True
+    threading.Thread(target=servidor.serve_forever, daemon=True).start()
+    return servidor, f"http://127.0.0.1:{servidor.server_address[1]}/v2/everything"
+
+
+if __name__ == "__main__":
+    retraso = float(sys.argv[1]) if len(sys.argv) > 1 else 0.5
+    puerto = int(sys.argv[2]) if len(sys.argv) > 2 else 8765
+    servidor, url = iniciar_stub(retraso, puerto)
+    print(f"Stub de NewsAPI en {url} (retraso {retraso}s). Ctrl+C para detener.")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        servidor.shutdown()
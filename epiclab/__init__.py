@@ -0,0 +1,4 @@
+"""
+Módulos de soporte del EPIC Lab Amplificador de Impacto.
+Contiene la lógica de datos y cálculo que no depende de la interfaz de Streamlit.
+"""
@@ -0,0 +1,79 @@
+"""
+Fuente de aleatoriedad de las simulaciones (impacto, hashtags, horarios, pronósticos).
+Cada función recibe un `rng` opcional:
+  - None: si EPICLAB_SEMILLA está definida se usa el modo determinista; si no, entropía del sistema.
+  - int: semilla explícita (modo determinista).
+  - np.random.Generator: se usa tal cual.
+En modo determinista la semilla se deriva de la semilla base y de las entradas de la
+función, así que entradas idénticas producen resultados idénticos y se pueden memoizar.
+"""
+
+import hashlib
+import os
+
+import numpy as np
+import pandas as pd
+
+_semilla = os.environ.get("EPICLAB_SEMILLA", "")
+SEMILLA = int(_semilla) if _semilla.strip() else None
+
+# Constantes de splitmix64
+_DORADO = np.uint64(0x9E3779B97F4A7C15)
+_MEZCLA_1 = np.uint64(0xBF58476D1CE4E5B9)
+_MEZCLA_2 = np.uint64(0x94D049BB133111EB)
+
+
+def fijar_semilla(semilla):
+    """Activa (int) o desactiva (None) el modo determinista para todo el proceso."""
+    global SEMILLA
+    SEMILLA = semilla
+
+
+def semilla_efectiva(rng=None):
+    """Semilla base que aplica a una llamada, o None si no es determinista."""
+    if isinstance(rng, np.random.Generator):
+        return None
+    return SEMILLA if rng is None else int(rng)
+
+
+def derivar_semilla(semilla, *partes):
+    """Semilla de 64 bits estable (entre procesos y plataformas) para una semilla base y unas entradas."""
+    h = hashlib.sha1(repr(semilla).encode('utf-8'))
+    for parte in partes:
+        h.update(b'|')
+        h.update(parte.tobytes() if isinstance(parte, np.ndarray) else repr(parte).encode('utf-8'))
+    return int.from_bytes(h.digest()[:8], 'little')
+
+
+def generador(rng=None, *partes):
+    """np.random.Generator para una llamada; `partes` son las entradas que determinan el resultado."""
+    if isinstance(rng, np.random.Generator):
+        return rng
+    semilla = semilla_efectiva(rng)
+    if semilla is None:
+        return np.random.default_rng()
+    return np.random.default_rng(derivar_semilla(semilla, *partes))
+
+
+def _mezclar(x):
+    # Función de salida de splitmix64
+    x = (x ^ (x >> np.uint64(30))) * _MEZCLA_1
+    x = (x ^ (x >> np.uint64(27))) * _MEZCLA_2
+    return x ^ (x >> np.uint64(31))
+
+
+def enteros_por_texto(textos, semilla, bajos, altos):
+    """
+    Matriz (n, k) de enteros en [bajos[j], altos[j]] que depende solo de cada texto y de la semilla.
+    Vectorizada: un mismo texto recibe los mismos valores sin importar el lote en el que venga.
+    """
+    bajos = np.asarray(bajos, dtype=np.int64)
+    rangos = (np.asarray(altos, dtype=np.int64) - bajos + 1).astype(np.uint64)
+    llaves = pd.util.hash_pandas_object(pd.Series(textos, dtype=object), index=False).to_numpy()
+    with np.errstate(over='ignore'):
+        estado = llaves ^ np.uint64(derivar_semilla(semilla))
+        columnas = []
+        for j in range(len(bajos)):
+            estado = estado + _DORADO
+            columnas.append((_mezclar(estado) % rangos[j]).astype(np.int64) + bajos[j])
+    return np.column_stack(columnas) if columnas else np.empty((len(llaves), 0), dtype=np.int64)
@@ -0,0 +1,346 @@
+"""
+Asesor de Contenido Inteligente: armado del prompt y llamadas al modelo.
+Las respuestas se pueden recibir en streaming (se dibujan conforme llegan los
+tokens con `st.write_stream`); para cada petición se registra el tiempo al
+primer token y la latencia total. Las respuestas a las preguntas frecuentes se
+guardan en un caché compartido por todas las sesiones. El contexto que se envía
+respeta un presupuesto de tokens (EPICLAB_PRESUPUESTO_TOKENS).
+"""
+
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+import unicodedata
+from collections import OrderedDict, deque
+from functools import lru_cache
+
+import numpy as np
+
+MODELO = os.environ.get("EPICLAB_MODELO", "gpt-4o")
+MAX_TOKENS = 500
+MENSAJES_HISTORIAL = 6  # últimos mensajes que se envían al modelo
+STREAMING = os.environ.get("EPICLAB_ASISTENTE_STREAM", "1") != "0"
+MAX_METRICAS = 500
+PRESUPUESTO_TOKENS = int(os.environ.get("EPICLAB_PRESUPUESTO_TOKENS", 2500))  # tokens de entrada por petición
+TOKENS_ULTIMO_TEXTO = 400  # el texto analizado se recorta a este tamaño dentro del contexto
+TOKENS_POR_TURNO = 600  # turnos anteriores al último más largos que esto se recortan
+TOKENS_RESERVA_RESUMEN = 200  # espacio para el resumen de los turnos que no caben
+TOKENS_RESUMEN_TURNO = 40
+TOKENS_POR_MENSAJE = 4  # formato de cada mensaje en la API de chat
+TOKENS_MINIMO_ULTIMO = 50  # espacio que siempre se reserva para el último mensaje (si es más largo)
+MARCADOR_RECORTE = " […] "
+RESPUESTAS_TTL = int(os.environ.get("EPICLAB_RESPUESTAS_TTL", 6 * 3600))  # segundos
+MAX_RESPUESTAS = 256
+
+SYSTEM_PROMPT = """
+Eres un Asesor de Contenido Inteligente para el EPIC Lab, un laboratorio de innovación y emprendimiento del ITAM.
+Tu misión es ayudar a los usuarios a mejorar su contenido y estrategia de publicación.
+
+Tus capacidades incluyen:
+1. Revisar y mejorar contenido: corregir tono, redacción y ofrecer sugerencias para mayor impacto.
+2. Explicar métricas como viralidad, relevancia social, inclusividad, claridad y tono positivo.
+3. Generar ideas creativas para posts, campañas o iniciativas.
+4. Responder preguntas sobre cómo usar la plataforma 'EPIC Lab Amplificador de Impacto'.
+
+Sobre el EPIC Lab:
+- Es un espacio de innovación y emprendimiento del ITAM (Instituto Tecnológico Autónomo de México).
+- Ha impactado a más de 7,000 alumnos en los últimos 10 años.
+- Tiene iniciativas como MAD Fellowship y MAD Challenge.
+- Solo el 30% de participantes son mujeres (es un área de mejora).
+- Su contenido busca inspirar a estudiantes, profesionales y emprendedores.
+
+Tus respuestas deben ser:
+- Breves y concisas (1-3 párrafos máximo).
+- Personalizadas al contexto universitario y de emprendimiento.
+- Positivas y orientadas a soluciones.
+- Utilizando ocasionalmente emojis relevantes para hacer la interacción más dinámica.
+"""
+
+TONOS = {
+    "profesional": "Responde en un tono profesional y formal, adecuado para comunicación corporativa o académica.",
+    "inspirador": "Responde en un tono motivacional e inspirador, usando metáforas y lenguaje que estimule la acción.",
+    "casual": "Responde en un tono casual y conversacional, como hablarías con un amigo, usando más emojis y lenguaje informal."
+}
+
+_PIEZAS = re.compile(r"\w+|[^\w\s]")
+_FIN_ORACION = re.compile(r"(?<=[.!?])\s")
+
+_metricas = deque(maxlen=MAX_METRICAS)
+_metricas_lock = threading.Lock()
+
+_respuestas = OrderedDict()  # llave -> (expira_en, texto)
+_respuestas_lock = threading.Lock()
+_estadisticas_respuestas = {"aciertos": 0, "fallos": 0, "vencidas": 0}
+
+
+@lru_cache(maxsize=1)
+def _codificador():
+    # tiktoken es opcional: sin él se usa el estimador local
+    try:
+        import tiktoken
+    except ImportError:
+        return None
+    try:
+        return tiktoken.encoding_for_model(MODELO)
+    except KeyError:
+        return tiktoken.get_encoding("o200k_base")
+
+
+def contar_tokens(texto):
+    """Tokens del texto: exactos con tiktoken; si no está instalado, ~1 token por cada 4 letras de palabra o signo."""
+    codificador = _codificador()
+    if codificador is not None:
+        return len(codificador.encode(texto))
+    return sum((len(pieza) + 3) // 4 for pieza in _PIEZAS.findall(texto))
+
+
+def contar_mensajes(mensajes):
+    return sum(TOKENS_POR_MENSAJE + contar_tokens(m["content"]) for m in mensajes) + 3
+
+
+def _mayor_que_cabe(armar, maximo, max_tokens):
+    # Búsqueda binaria del mayor largo en [0, maximo] cuyo texto armado cabe en max_tokens (None si ninguno)
+    mejor, bajo, alto = None, 0, maximo
+    while bajo <= alto:
+        medio = (bajo + alto) // 2
+        candidato = armar(medio)
+        if contar_tokens(candidato) <= max_tokens:
+            mejor, bajo = candidato, medio + 1
+        else:
+            alto = medio - 1
+    return mejor
+
+
+def recortar(texto, max_tokens):
+    """Recorta el texto a `max_tokens` conservando el inicio y el final; el resultado nunca excede `max_tokens`."""
+    if max_tokens <= 0:
+        return ""
+    tokens = contar_tokens(texto)
+    if tokens <= max_tokens:
+        return texto
+
+    def con_marcador(largo):
+        return texto[:largo * 2 // 3].rstrip() + MARCADOR_RECORTE + texto[len(texto) - largo // 3:].lstrip()
+
+    # La estimación proporcional casi siempre cabe al primer intento; si no, se busca el largo
+    largo = int(len(texto) * max_tokens / tokens * 0.95)
+    recortado = con_marcador(largo)
+    if contar_tokens(recortado) <= max_tokens:
+        return recortado
+    recortado = _mayor_que_cabe(con_marcador, largo - 1, max_tokens)
+    if recortado is None:
+        # Ni el marcador cabe: solo el inicio del texto
+        recortado = _mayor_que_cabe(lambda largo: texto[:largo].rstrip(), len(texto) - 1, max_tokens)
+    return recortado or ""
+
+
+def resumir_turnos(turnos, max_tokens):
+    """Resumen extractivo de turnos viejos: la primera oración de cada uno, del más reciente al más viejo."""
+    lineas = []
+    for m in reversed(turnos):
+        quien = "Usuario" if m["role"] == "user" else "Asesor"
+        oracion = _FIN_ORACION.split(m["content"].strip(), maxsplit=1)[0]
+        linea = f"- {quien}: {recortar(oracion, TOKENS_RESUMEN_TURNO)}"
+        if contar_tokens("\n".join(lineas + [linea])) > max_tokens:
+            break
+        lineas.append(linea)
+    return "\n".join(reversed(lineas))
+
+
+@lru_cache(maxsize=len(TONOS))
+def prefijo_sistema(tono):
+    """Parte estática del prompt de sistema (instrucciones y tono) y sus tokens; siempre idéntica para el mismo tono."""
+    texto = SYSTEM_PROMPT + f"\n\n{TONOS[tono]}"
+    return texto, contar_tokens(texto)
+
+
+def contexto_sistema(ultimo_score=None, ultimo_texto=None, tokens_texto=TOKENS_ULTIMO_TEXTO):
+    """Parte dinámica: el último análisis de impacto y el último texto analizado (recortado)."""
+    contexto = ""
+    if ultimo_score is not None:
+        contexto += "Contexto adicional - Último análisis de impacto social:\n"
+        contexto += f"- Viralidad: {ultimo_score['viralidad']}/100\n"
+        contexto += f"- Relevancia social: {ultimo_score['relevancia_social']}/100\n"
+        contexto += f"- Inclusividad: {ultimo_score['inclusividad']}/100\n"
+        contexto += f"- Claridad: {ultimo_score['claridad']}/100\n"
+        contexto += f"- Tono positivo: {ultimo_score['tono_positivo']}/100\n"
+
+    if ultimo_texto is not None:
+        contexto += f"\nÚltimo texto analizado: '{recortar(ultimo_texto, tokens_texto)}'\n"
+    return contexto
+
+
+def construir_mensajes(historial, tono, ultimo_score=None, ultimo_texto=None, presupuesto=None):
+    """
+    Mensajes para la API dentro de un presupuesto de tokens de entrada.
+    El prefijo estático va primero y sin cambios para aprovechar el caché de prompts
+    del proveedor; después el contexto del último análisis y el historial reciente.
+    Los turnos que no caben se resumen en una nota y los demasiado largos se recortan.
+    """
+    presupuesto = presupuesto or PRESUPUESTO_TOKENS
+    prefijo, tokens_prefijo = prefijo_sistema(tono)
+    # Formato del prefijo y del último mensaje más los 3 tokens de la respuesta; fijos para cualquier presupuesto
+    fijos = 2 * TOKENS_POR_MENSAJE + 3
+    reserva = min(contar_tokens(historial[-1]["content"]), TOKENS_MINIMO_ULTIMO) if historial else 0
+    if tokens_prefijo > presupuesto - fijos - reserva:
+        # Presupuesto menor que el prefijo estático: se pierde el caché de prompts, pero no se excede
+        prefijo = recortar(prefijo, presupuesto - fijos - reserva)
+        tokens_prefijo = contar_tokens(prefijo)
+    mensajes = [{"role": "system", "content": prefijo}]
+    disponible = presupuesto - fijos - tokens_prefijo - reserva
+
+    # Con presupuestos chicos el texto analizado cede espacio a la conversación; si el contexto
+    # no cabe ni sin el texto, se omite
+    tokens_texto = min(TOKENS_ULTIMO_TEXTO, max(0, disponible) // 3)
+    for texto in (ultimo_texto, None):
+        contexto = contexto_sistema(ultimo_score, texto, tokens_texto)
+        if contexto and contar_tokens(contexto) + TOKENS_POR_MENSAJE <= disponible:
+            mensajes.append({"role": "system", "content": contexto})
+            break
+    restante = presupuesto - contar_mensajes(mensajes)
+
+    # Del más reciente al más viejo; el último mensaje siempre entra (recortado si hace falta)
+    recientes, turnos = [], historial[-MENSAJES_HISTORIAL:]
+    viejos = list(historial[:-MENSAJES_HISTORIAL])
+    for i, m in enumerate(reversed(turnos)):
+        contenido = m["content"] if i == 0 else recortar(m["content"], TOKENS_POR_TURNO)
+        tokens = contar_tokens(contenido) + TOKENS_POR_MENSAJE
+        if i and tokens > restante - TOKENS_RESERVA_RESUMEN:
+            viejos += turnos[:len(turnos) - i]
+            break
+        if tokens > restante:
+            contenido = recortar(contenido, restante - TOKENS_POR_MENSAJE)
+            tokens = contar_tokens(contenido) + TOKENS_POR_MENSAJE
+        recientes.append({"role": m["role"], "content": contenido})
+        restante -= tokens
+
+    if viejos and restante > TOKENS_POR_MENSAJE + TOKENS_RESUMEN_TURNO:
+        resumen = resumir_turnos(viejos, min(restante, TOKENS_RESERVA_RESUMEN) - TOKENS_POR_MENSAJE - 10)
+        nota = f"Resumen de la conversación anterior:\n{resumen}"
+        if resumen and contar_tokens(nota) + TOKENS_POR_MENSAJE <= restante:
+            mensajes.append({"role": "system", "content": nota})
+    return mensajes + recientes[::-1]
+
+
+def registrar_latencia(primer_token, total, streaming, error=False):
+    with _metricas_lock:
+        _metricas.append({
+            "momento": time.time(),
+            "primer_token": primer_token,
+            "total": total,
+            "streaming": streaming,
+            "error": error,
+        })
+
+
+def ultimas_latencias(cantidad=1):
+    with _metricas_lock:
+        return list(_metricas)[-cantidad:]
+
+
+def resumen_latencias():
+    """p50/p95 (en segundos) del tiempo al primer token y de la latencia total de las peticiones exitosas."""
+    with _metricas_lock:
+        exitosas = [m for m in _metricas if not m["error"]]
+    if not exitosas:
+        return None
+    primer_token = np.array([m["primer_token"] for m in exitosas])
+    total = np.array([m["total"] for m in exitosas])
+    return {
+        "peticiones": len(exitosas),
+        "primer_token_p50": float(np.percentile(primer_token, 50)),
+        "primer_token_p95": float(np.percentile(primer_token, 95)),
+        "total_p50": float(np.percentile(total, 50)),
+        "total_p95": float(np.percentile(total, 95)),
+    }
+
+
+def responder(mensajes, cliente=None, modelo=MODELO, max_tokens=MAX_TOKENS):
+    """Respuesta completa (sin streaming). El primer token llega junto con el resto."""
+    import openai
+
+    cliente = cliente or openai
+    inicio = time.perf_counter()
+    try:
+        respuesta = cliente.chat.completions.create(model=modelo, messages=mensajes, max_tokens=max_tokens)
+    except Exception:
+        registrar_latencia(None, time.perf_counter() - inicio, False, error=True)
+        raise
+    total = time.perf_counter() - inicio
+    registrar_latencia(total, total, False)
+    return respuesta.choices[0].message.content
+
+
+def responder_stream(mensajes, cliente=None, modelo=MODELO, max_tokens=MAX_TOKENS):
+    """
+    Generador con los fragmentos de texto de la respuesta conforme llegan.
+    Al terminar (o fallar) registra el tiempo al primer token y la latencia total.
+    """
+    import openai
+
+    cliente = cliente or openai
+    inicio = time.perf_counter()
+    primer_token = None
+    try:
+        flujo = cliente.chat.completions.create(model=modelo, messages=mensajes, max_tokens=max_tokens, stream=True)
+        for fragmento in flujo:
+            if not fragmento.choices:
+                continue
+            texto = fragmento.choices[0].delta.content
+            if texto:
+                if primer_token is None:
+                    primer_token = time.perf_counter() - inicio
+                yield texto
+    except Exception:
+        registrar_latencia(primer_token, time.perf_counter() - inicio, True, error=True)
+        raise
+    registrar_latencia(primer_token, time.perf_counter() - inicio, True)
+
+
+def normalizar_prompt(texto):
+    """Minúsculas, sin acentos, sin signos de puntuación y con espacios simples."""
+    texto = unicodedata.normalize("NFKD", texto.lower())
+    texto = "".join(c for c in texto if not unicodedata.combining(c))
+    return " ".join(re.sub(r"[^\w\s]", " ", texto).split())
+
+
+def llave_respuesta(prompt, tono, ultimo_score=None, ultimo_texto=None):
+    """Llave del caché: (prompt normalizado, tono, hash del contexto del último análisis)."""
+    contexto = json.dumps([ultimo_score and {k: v for k, v in ultimo_score.items() if k != "sugerencias"}, ultimo_texto],
+                          sort_keys=True, ensure_ascii=False, default=str)
+    return (normalizar_prompt(prompt), tono, hashlib.sha1(contexto.encode("utf-8")).hexdigest())
+
+
+def respuesta_en_cache(llave):
+    """Texto guardado para la llave, o None si no existe o ya venció."""
+    ahora = time.time()
+    with _respuestas_lock:
+        entrada = _respuestas.get(llave)
+        if entrada is not None and entrada[0] < ahora:
+            del _respuestas[llave]
+            _estadisticas_respuestas["vencidas"] += 1
+            entrada = None
+        if entrada is None:
+            _estadisticas_respuestas["fallos"] += 1
+            return None
+        _respuestas.move_to_end(llave)
+        _estadisticas_respuestas["aciertos"] += 1
+        return entrada[1]
+
+
+def guardar_respuesta(llave, texto, ttl=RESPUESTAS_TTL):
+    with _respuestas_lock:
+        _respuestas[llave] = (time.time() + ttl, texto)
+        _respuestas.move_to_end(llave)
+        while len(_respuestas) > MAX_RESPUESTAS:
+            _respuestas.popitem(last=False)
+
+
+def estadisticas_respuestas():
+    with _respuestas_lock:
+        consultas = _estadisticas_respuestas["aciertos"] + _estadisticas_respuestas["fallos"]
+        return dict(_estadisticas_respuestas, entradas=len(_respuestas),
+                    tasa_aciertos=_estadisticas_respuestas["aciertos"] / consultas if consultas else None)
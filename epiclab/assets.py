@@ -0,0 +1,92 @@
+"""
+Servicio de imágenes estáticas para `st.image`.
+Cada imagen de `assets/` se lee una sola vez y se convierte a una variante
+reducida al ancho del contenedor (WebP, o PNG si Pillow no soporta WebP).
+Las variantes viven en un LRU acotado por bytes y se invalidan cuando cambia
+la fecha de modificación del archivo.
+"""
+
+import io
+import os
+import threading
+from collections import OrderedDict
+
+# Anchos disponibles para las variantes: se usa el menor que cubra el contenedor
+ANCHOS = (480, 800, 1200, 1600)
+ANCHO_CONTENEDOR = int(os.environ.get("EPICLAB_ANCHO_CONTENEDOR", 1200))
+MAX_BYTES_CACHE = 32 * 1024 ** 2
+CALIDAD_WEBP = 85
+
+_variantes = OrderedDict()  # (ruta, ancho, formato) -> (mtime_ns, bytes)
+_bytes_en_cache = 0
+_lock = threading.Lock()
+
+
+def _formato_preferido():
+    from PIL import features
+
+    return 'WEBP' if features.check('webp') else 'PNG'
+
+
+def ancho_variante(ancho):
+    """Menor ancho disponible que cubre el ancho solicitado."""
+    for disponible in ANCHOS:
+        if disponible >= ancho:
+            return disponible
+    return ANCHOS[-1]
+
+
+def _generar_variante(ruta, ancho, formato):
+    from PIL import Image
+
+    with Image.open(ruta) as imagen:
+        imagen.load()
+        if imagen.width > ancho:
+            alto = round(imagen.height * ancho / imagen.width)
+            imagen = imagen.resize((ancho, alto), Image.LANCZOS)
+        buffer = io.BytesIO()
+        if formato == 'WEBP':
+            imagen.save(buffer, format='WEBP', quality=CALIDAD_WEBP, method=4)
+        else:
+            imagen.save(buffer, format='PNG', optimize=True)
+    return buffer.getvalue()
+
+
+def variante_imagen(ruta, ancho=ANCHO_CONTENEDOR, formato=None):
+    """
+    Bytes de la imagen reducida a `ancho` (redondeado a ANCHOS).
+    Solo se lee el disco la primera vez o cuando el archivo cambia.
+    """
+    global _bytes_en_cache
+
+    ruta = os.path.abspath(ruta)
+    formato = formato or _formato_preferido()
+    llave = (ruta, ancho_variante(ancho), formato)
+    mtime = os.stat(ruta).st_mtime_ns
+
+    with _lock:
+        guardada = _variantes.get(llave)
+        if guardada is not None and guardada[0] == mtime:
+            _variantes.move_to_end(llave)
+            return guardada[1]
+
+    datos = _generar_variante(ruta, llave[1], formato)
+
+    with _lock:
+        anterior = _variantes.pop(llave, None)
+        if anterior is not None:
+            _bytes_en_cache -= len(anterior[1])
+        _variantes[llave] = (mtime, datos)
+        _bytes_en_cache += len(datos)
+        while _bytes_en_cache > MAX_BYTES_CACHE and len(_variantes) > 1:
+            _, (_, expulsada) = _variantes.popitem(last=False)
+            _bytes_en_cache -= len(expulsada)
+    return datos
+
+
+def limpiar_cache():
+    global _bytes_en_cache
+
+    with _lock:
+        _variantes.clear()
+        _bytes_en_cache = 0
@@ -0,0 +1,152 @@
+"""
+Backtesting de los modelos de pronóstico con origen rodante.
+Cada modelo se ajusta con la historia hasta un origen y se compara su pronóstico
+con lo observado en los días siguientes; los orígenes avanzan por la serie y las
+ventanas (modelo, origen) se evalúan en paralelo en un pool de procesos; las
+series se envían una sola vez a cada proceso y las tareas solo llevan (modelo,
+origen). El resultado resume MAPE, sMAPE y los tiempos de ajuste y predicción por modelo.
+"""
+
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from epiclab.pronostico import ESTACION, HORIZONTE, HoltWinters, NaiveEstacional
+
+MIN_SEGUNDOS_POOL = 0.5  # trabajo secuencial estimado; con menos, arrancar el pool cuesta más de lo que ahorra
+
+
+class TendenciaLineal:
+    """Pronóstico anterior de la página (último valor × crecimiento fijo de 0 a 30%), sin el ruido; como referencia."""
+
+    nombre = 'tendencia_lineal'
+
+    def ajustar(self, Y):
+        self.ultimo = np.asarray(Y, dtype=np.float64)[:, -1]
+        return self
+
+    def predecir(self, horizonte=HORIZONTE, nivel=None):
+        media = self.ultimo[:, None] * (1 + np.linspace(0, 0.3, horizonte))
+        return media, media, media
+
+
+class Automatico:
+    """Holt-Winters o naive estacional por serie, según el menor error un paso adelante (como ajustar_cubo)."""
+
+    nombre = 'auto'
+
+    def ajustar(self, Y):
+        self.modelos = [NaiveEstacional().ajustar(Y)]
+        if np.shape(Y)[1] >= 2 * ESTACION:
+            self.modelos.append(HoltWinters().ajustar(Y))
+        self.eleccion = np.vstack([m.error for m in self.modelos]).argmin(axis=0)
+        return self
+
+    def predecir(self, horizonte=HORIZONTE, nivel=None):
+        predicciones = [m.predecir(horizonte) for m in self.modelos]
+        filas = np.arange(len(self.eleccion))
+        return tuple(np.stack([p[k] for p in predicciones])[self.eleccion, filas] for k in range(3))
+
+
+MODELOS_BACKTEST = {
+    'tendencia_lineal': TendenciaLineal,
+    'naive_estacional': NaiveEstacional,
+    'holt_winters': HoltWinters,
+    'auto': Automatico,
+}
+
+
+def origenes_rodantes(dias, horizonte=HORIZONTE, minimo=2 * ESTACION, paso=1):
+    """Índices de origen: se ajusta con [0, origen) y se evalúa en [origen, origen + horizonte)."""
+    return list(range(minimo, dias - horizonte + 1, paso))
+
+
+_Y_trabajador = None  # series del backtest en cada proceso del pool (las fija el initializer)
+
+
+def _iniciar_trabajador(Y):
+    global _Y_trabajador
+    _Y_trabajador = Y
+
+
+def _evaluar_en_trabajador(argumentos):
+    # Corre en un proceso del pool con las series que recibió al iniciar
+    nombre, origen, horizonte = argumentos
+    return _evaluar_ventana(nombre, _Y_trabajador, origen, horizonte)
+
+
+def _evaluar_ventana(nombre, Y, origen, horizonte):
+    # Ajusta, predice y acumula los errores de una ventana
+    inicio = time.perf_counter()
+    modelo = MODELOS_BACKTEST[nombre]().ajustar(Y[:, :origen])
+    ajuste = time.perf_counter() - inicio
+    inicio = time.perf_counter()
+    media = np.clip(modelo.predecir(horizonte)[0], 0, None)
+    prediccion = time.perf_counter() - inicio
+
+    real = Y[:, origen:origen + horizonte].astype(np.float64)
+    error = np.abs(real - media)
+    con_valor = real != 0
+    denominador = np.abs(real) + np.abs(media)
+    con_suma = denominador > 0
+    return {
+        'modelo': nombre,
+        'origen': origen,
+        'ape': float((error[con_valor] / np.abs(real[con_valor])).sum()),
+        'n_ape': int(con_valor.sum()),
+        'sape': float((2 * error[con_suma] / denominador[con_suma]).sum()),
+        'n_sape': int(con_suma.sum()),
+        'ajuste': ajuste,
+        'prediccion': prediccion,
+    }
+
+
+def backtest(Y, modelos=None, horizonte=HORIZONTE, minimo=2 * ESTACION, paso=1, procesos=None):
+    """
+    Backtest de origen rodante de `modelos` sobre las series Y (series, días).
+    Regresa un DataFrame por modelo con ventanas, MAPE y sMAPE (%) y los tiempos
+    medios de ajuste y predicción (ms), ordenado por sMAPE. Con `procesos=None` se
+    usa un proceso por CPU, salvo que el costo medido de las primeras ventanas
+    anticipe menos de MIN_SEGUNDOS_POOL de trabajo secuencial.
+    """
+    Y = np.asarray(Y)
+    modelos = list(modelos or MODELOS_BACKTEST)
+    tareas = [(nombre, origen, horizonte) for nombre in modelos for origen in origenes_rodantes(Y.shape[1], horizonte, minimo, paso)]
+    if not tareas:
+        raise ValueError("La historia es demasiado corta para el horizonte y el mínimo indicados")
+
+    ventanas = []
+    if procesos is None:
+        procesos = min(len(tareas), os.cpu_count() or 1)
+        if procesos > 1:
+            # Se mide una ventana por modelo en el origen de en medio (entran al resultado) y se
+            # estima el trabajo restante: el pool solo se usa si compensa su arranque
+            origen_medio = tareas[len(tareas) // len(modelos) // 2][1]
+            ventanas = [_evaluar_ventana(nombre, Y, origen, horizonte) for nombre, origen, horizonte in tareas if origen == origen_medio]
+            tareas = [t for t in tareas if t[1] != origen_medio]
+            estimado = sum(v['ajuste'] + v['prediccion'] for v in ventanas) / len(ventanas) * len(tareas)
+            if estimado < MIN_SEGUNDOS_POOL:
+                procesos = 1
+    if procesos > 1 and tareas:
+        with ProcessPoolExecutor(max_workers=procesos, initializer=_iniciar_trabajador, initargs=(Y,)) as pool:
+            ventanas += pool.map(_evaluar_en_trabajador, tareas, chunksize=max(1, len(tareas) // (4 * procesos)))
+    else:
+        ventanas += [_evaluar_ventana(nombre, Y, origen, horizonte) for nombre, origen, horizonte in tareas]
+
+    detalle = pd.DataFrame(ventanas)
+    resumen = detalle.groupby('modelo', sort=False).agg(
+        ventanas=('origen', 'size'),
+        ape=('ape', 'sum'), n_ape=('n_ape', 'sum'),
+        sape=('sape', 'sum'), n_sape=('n_sape', 'sum'),
+        ajuste_ms=('ajuste', 'mean'), prediccion_ms=('prediccion', 'mean'),
+    )
+    return pd.DataFrame({
+        'ventanas': resumen['ventanas'],
+        'mape': resumen['ape'] / resumen['n_ape'].where(resumen['n_ape'] > 0) * 100,
+        'smape': resumen['sape'] / resumen['n_sape'].where(resumen['n_sape'] > 0) * 100,
+        'ajuste_ms': resumen['ajuste_ms'] * 1000,
+        'prediccion_ms': resumen['prediccion_ms'] * 1000,
+    }).sort_values('smape')
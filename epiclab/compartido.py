@@ -0,0 +1,225 @@
+"""
+Capa de datos compartida entre sesiones de Streamlit.
+El dataset de social listening se construye una sola vez por proceso y cada
+sesión recibe una vista sin copia (copy-on-write) en lugar de su propia copia.
+"""
+
+import os
+import sys
+import threading
+import time
+from datetime import date, datetime
+
+import pandas as pd
+import streamlit as st
+
+from epiclab.cubo import CuboAgregado
+from epiclab.datos import TERMINOS_BASE, generar_datos_social_listening
+
+# Configuración (se puede sobreescribir con variables de entorno)
+DATASET_DIAS = int(os.environ.get("EPICLAB_DATASET_DIAS", 30))
+DATASET_SEMILLA = int(os.environ.get("EPICLAB_DATASET_SEMILLA", 2025))
+DATASET_TTL = int(os.environ.get("EPICLAB_DATASET_TTL", 3600))               # segundos
+DATASET_MAX_ENTRADAS = int(os.environ.get("EPICLAB_DATASET_MAX_ENTRADAS", 4))  # versiones en memoria
+DATASET_EXPORT = os.environ.get("EPICLAB_EXPORT", "")  # exportación real (CSV/JSON); vacío = datos simulados
+SESION_INACTIVA = 30 * 60  # segundos sin actividad para dejar de contar una sesión
+SIMULACIONES_MAX_ENTRADAS = 256  # curvas de alcance en memoria (101 scores por día)
+
+# Las vistas por sesión dependen de copy-on-write (siempre activo desde pandas 3)
+if int(pd.__version__.split(".")[0]) < 3:
+    pd.set_option("mode.copy_on_write", True)
+
+
+@st.cache_resource(ttl=DATASET_TTL, max_entries=DATASET_MAX_ENTRADAS, show_spinner=False)
+def _dataset_compartido(dias, semilla, fecha_fin):
+    # Un único DataFrame por (dias, semilla, fecha) compartido por todo el proceso
+    return generar_datos_social_listening(dias, rng=semilla, fecha_fin=fecha_fin)
+
+
+@st.cache_resource(ttl=DATASET_TTL, max_entries=DATASET_MAX_ENTRADAS, show_spinner="Cargando exportación de social listening...")
+def _dataset_export(ruta, mtime_ns):
+    # mtime_ns forma parte de la llave: si el archivo cambia se vuelve a cargar
+    from epiclab.ingesta import cargar_export
+
+    return cargar_export(ruta), TERMINOS_BASE
+
+
+def _fuente(dias, semilla, ruta_export):
+    # Llave hashable del dataset vigente: exportación (ruta, mtime) o simulación (días, semilla, fecha)
+    if ruta_export and os.path.exists(ruta_export):
+        return ("export", os.path.abspath(ruta_export), os.stat(ruta_export).st_mtime_ns)
+    return ("simulado", dias, semilla, date.today().isoformat())
+
+
+def _cargar_fuente(fuente):
+    if fuente[0] == "export":
+        return _dataset_export(*fuente[1:])
+    return _dataset_compartido(*fuente[1:])
+
+
+@st.cache_resource(ttl=DATASET_TTL, max_entries=DATASET_MAX_ENTRADAS, show_spinner=False)
+def _cubo_compartido(fuente):
+    df, _ = _cargar_fuente(fuente)
+    return CuboAgregado.desde_dataframe(df)
+
+
+@st.cache_resource(ttl=DATASET_TTL, max_entries=DATASET_MAX_ENTRADAS, show_spinner=False)
+def _motor_compartido(fuente):
+    # Con una exportación con texto se tokenizan sus menciones; el sentimiento que quede
+    # sin términos (por ejemplo, una exportación sin menciones negativas) parte de los simulados
+    from epiclab.graficas import TERMINOS_NEGATIVOS
+    from epiclab.nube_palabras import MotorTerminos
+
+    motor = MotorTerminos()
+    if fuente[0] == "export":
+        from epiclab.ingesta import leer_textos_export
+
+        for textos, sentimientos in leer_textos_export(fuente[1]):
+            motor.agregar(textos, sentimientos)
+    if not motor.top("Positivo", 1):
+        motor.agregar_frecuencias("Positivo", TERMINOS_BASE)
+    if not motor.top("Negativo", 1):
+        motor.agregar_frecuencias("Negativo", TERMINOS_NEGATIVOS)
+    return motor
+
+
+def obtener_datos_sesion(dias=DATASET_DIAS, semilla=DATASET_SEMILLA, ruta_export=DATASET_EXPORT):
+    """
+    Regresa (df, terminos) para la sesión actual.
+    Si hay una exportación configurada (EPICLAB_EXPORT) se usa; si no, datos simulados.
+    El DataFrame es una vista superficial del dataset compartido: no copia datos y
+    cualquier modificación local se copia bajo demanda sin afectar a otras sesiones.
+    """
+    df, terminos = _cargar_fuente(_fuente(dias, semilla, ruta_export))
+    return df.copy(deep=False), dict(terminos)
+
+
+def obtener_cubo(dias=DATASET_DIAS, semilla=DATASET_SEMILLA, ruta_export=DATASET_EXPORT):
+    """Cubo de agregados del dataset vigente, compartido por todas las sesiones (solo lectura)."""
+    return _cubo_compartido(_fuente(dias, semilla, ruta_export))
+
+
+def obtener_motor_terminos(dias=DATASET_DIAS, semilla=DATASET_SEMILLA, ruta_export=DATASET_EXPORT):
+    """
+    Motor de términos del dataset vigente, compartido por todas las sesiones.
+    Las menciones nuevas se suman con `motor.agregar(textos, sentimientos)`.
+    """
+    return _motor_compartido(_fuente(dias, semilla, ruta_export))
+
+
+@st.cache_resource(max_entries=SIMULACIONES_MAX_ENTRADAS, show_spinner=False)
+def _forecast_impacto_compartido(score_viralidad, dia, semilla):
+    # semilla forma parte de la llave: cambiar de semilla base no reutiliza curvas de la anterior
+    from epiclab.contenido import simular_forecast_impacto
+
+    return simular_forecast_impacto(score_viralidad, inicio=datetime.fromisoformat(dia))
+
+
+def obtener_forecast_impacto(score_viralidad):
+    """
+    Curva de alcance simulada del score. En modo determinista (EPICLAB_SEMILLA) hay
+    una por (score, día), compartida por todas las sesiones (solo lectura), y su gráfica
+    sale de la caché de figuras; sin semilla cada llamada es una simulación nueva.
+    """
+    from epiclab.aleatorio import semilla_efectiva
+    from epiclab.contenido import simular_forecast_impacto
+
+    dia = date.today().isoformat()
+    semilla = semilla_efectiva()
+    if semilla is None:
+        return simular_forecast_impacto(int(score_viralidad), inicio=datetime.fromisoformat(dia))
+    return _forecast_impacto_compartido(int(score_viralidad), dia, semilla)
+
+
+@st.cache_resource(show_spinner=False)
+def obtener_cliente_noticias():
+    """Cliente de NewsAPI único por proceso (sesión HTTP, caché y refrescos compartidos)."""
+    from epiclab.noticias import ClienteNoticias
+
+    return ClienteNoticias()
+
+
+@st.cache_resource(show_spinner=False)
+def obtener_agregador_noticias():
+    """Agregador de noticias por tema y su almacén de artículos, únicos por proceso."""
+    from epiclab.noticias import AgregadorNoticias
+
+    return AgregadorNoticias(obtener_cliente_noticias())
+
+
+@st.cache_resource(show_spinner=False)
+def obtener_cache_miniaturas():
+    """Caché de miniaturas de las noticias (descargas y archivos compartidos por el proceso)."""
+    from epiclab.miniaturas import CacheMiniaturas
+
+    return CacheMiniaturas()
+
+
+@st.cache_resource(show_spinner=False)
+def obtener_pasarela_llm():
+    """Pasarela al modelo de lenguaje única por proceso: concurrencia, límites de uso y reintentos compartidos."""
+    from epiclab.pasarela_llm import PasarelaLLM
+
+    return PasarelaLLM(api_key=st.secrets.get("openai", {}).get("api_key", ""))
+
+
+@st.cache_resource(show_spinner=False)
+def obtener_puntuador_impacto():
+    """Puntuador de impacto con el modelo de lenguaje (caché de resultados y presupuesto compartidos)."""
+    from epiclab.impacto_llm import PuntuadorImpactoLLM
+
+    return PuntuadorImpactoLLM(obtener_pasarela_llm())
+
+
+# Registro de sesiones activas para la métrica de memoria
+@st.cache_resource(show_spinner=False)
+def _registro_sesiones():
+    return {"lock": threading.Lock(), "sesiones": {}}
+
+
+def registrar_sesion():
+    """Marca la sesión actual como activa y regresa el número de sesiones activas."""
+    from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+    registro = _registro_sesiones()
+    ctx = get_script_run_ctx()
+    ahora = time.time()
+    with registro["lock"]:
+        sesiones = registro["sesiones"]
+        if ctx is not None:
+            sesiones[ctx.session_id] = ahora
+        for sesion_id, visto in list(sesiones.items()):
+            if ahora - visto > SESION_INACTIVA:
+                del sesiones[sesion_id]
+        return max(1, len(sesiones))
+
+
+def memoria_residente_mb():
+    """Memoria residente (RSS) del proceso en MB."""
+    try:
+        with open("/proc/self/statm") as f:
+            paginas = int(f.read().split()[1])
+        return paginas * os.sysconf("SC_PAGE_SIZE") / 1024 ** 2
+    except (OSError, ValueError, AttributeError):
+        # Fuera de Linux solo está disponible el pico de memoria
+        import resource
+
+        pico = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return pico / 1024 ** 2 if sys.platform == "darwin" else pico / 1024
+
+
+def metricas_memoria(df, sesiones_activas):
+    """
+    Compara la memoria por sesión actual contra la estimada con una copia por sesión.
+    Regresa un dict con `por_sesion_mb` (compartido) y `por_sesion_antes_mb` (copias privadas).
+    """
+    rss = memoria_residente_mb()
+    tamano_df = df.memory_usage(deep=True).sum() / 1024 ** 2
+    antes = rss + tamano_df * (sesiones_activas - 1)
+    return {
+        "sesiones": sesiones_activas,
+        "rss_mb": rss,
+        "dataset_mb": tamano_df,
+        "por_sesion_mb": rss / sesiones_activas,
+        "por_sesion_antes_mb": antes / sesiones_activas,
+    }
@@ -0,0 +1,174 @@
+"""
+Herramientas simuladas del generador de contenido: hashtags, horarios de
+publicación y proyección del alcance de una publicación (Monte Carlo con bandas
+de percentiles).
+Todas aceptan un `rng` opcional (ver epiclab.aleatorio) para obtener resultados
+reproducibles.
+"""
+
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+
+from epiclab.aleatorio import generador
+
+SIMULACIONES_ALCANCE = 10000
+PERCENTILES_ALCANCE = (10, 50, 90)
+
+# Hashtags base relacionados con EPIC Lab
+HASHTAGS_BASE = ["#EPICLab", "#ITAM", "#Innovación"]
+
+# Palabras clave que podrían generar hashtags específicos
+PALABRAS_HASHTAG = {
+    "emprendimiento": "#Emprendimiento",
+    "startup": "#Startup",
+    "negocio": "#Business",
+    "tecnología": "#Tech",
+    "digital": "#Digital",
+    "transformación": "#Transformación",
+    "futuro": "#FuturoDigital",
+    "educación": "#EducaciónDigital",
+    "méxico": "#México",
+    "desafío": "#Challenge",
+    "solución": "#Soluciones",
+    "impacto": "#ImpactoSocial",
+    "comunidad": "#Comunidad",
+    "desarrollo": "#Desarrollo",
+    "talento": "#Talento",
+    "creatividad": "#Creatividad",
+    "colaboración": "#Colaboración",
+    "fellows": "#MADFellows",
+    "challenge": "#EPICChallenge",
+    "estudiantes": "#Estudiantes",
+    "profesionales": "#Profesionales"
+}
+
+HASHTAGS_ADICIONALES = ["#Innovación", "#Emprendimiento", "#Tech", "#Business", "#DigitalTransformation"]
+
+# Horarios base por plataforma (simulados según investigaciones de marketing)
+HORARIOS_BASE = {
+    'Instagram': [
+        {'hora': '12:00 PM', 'efectividad': 85, 'razon': 'Hora de almuerzo, mayor actividad de usuarios'},
+        {'hora': '6:00 PM', 'efectividad': 90, 'razon': 'Final de jornada laboral, pico de engagement'},
+        {'hora': '9:00 PM', 'efectividad': 75, 'razon': 'Tiempo de ocio nocturno, alta retención'}
+    ],
+    'Twitter/X': [
+        {'hora': '8:00 AM', 'efectividad': 80, 'razon': 'Inicio de jornada, consumo de noticias'},
+        {'hora': '12:00 PM', 'efectividad': 75, 'razon': 'Pausa de mediodía, alto volumen de tweets'},
+        {'hora': '5:00 PM', 'efectividad': 85, 'razon': 'Final de jornada, discusiones activas'}
+    ],
+    'LinkedIn': [
+        {'hora': '8:00 AM', 'efectividad': 85, 'razon': 'Inicio de jornada profesional'},
+        {'hora': '12:00 PM', 'efectividad': 70, 'razon': 'Pausa de mediodía, profesionales activos'},
+        {'hora': '5:30 PM', 'efectividad': 80, 'razon': 'Final de jornada laboral, mayor tiempo de lectura'}
+    ],
+    'TikTok': [
+        {'hora': '11:00 AM', 'efectividad': 70, 'razon': 'Actividad creciente en la plataforma'},
+        {'hora': '2:00 PM', 'efectividad': 75, 'razon': 'Pico de actividad diurna'},
+        {'hora': '8:00 PM', 'efectividad': 95, 'razon': 'Prime time, máxima audiencia y engagement'}
+    ]
+}
+
+
+def generar_hashtags(texto, rng=None):
+    """Entre 8 y 10 hashtags para un texto: los base, los de sus palabras clave y genéricos."""
+    rng = generador(rng, 'hashtags', texto)
+
+    # Extraer hashtags del texto
+    hashtags_especificos = []
+    if texto:
+        palabras = texto.lower().split()
+        for palabra in palabras:
+            palabra_limpia = ''.join(c for c in palabra if c.isalnum())
+            if palabra_limpia in PALABRAS_HASHTAG and PALABRAS_HASHTAG[palabra_limpia] not in hashtags_especificos:
+                hashtags_especificos.append(PALABRAS_HASHTAG[palabra_limpia])
+
+    # Combinar hashtags base con específicos
+    todos_hashtags = HASHTAGS_BASE + hashtags_especificos
+
+    # Si hay pocos hashtags, añadir algunos genéricos relevantes
+    while len(todos_hashtags) < 8:
+        hashtag_adicional = HASHTAGS_ADICIONALES[rng.integers(len(HASHTAGS_ADICIONALES))]
+        if hashtag_adicional not in todos_hashtags:
+            todos_hashtags.append(hashtag_adicional)
+
+    # Limitar a máximo 10 hashtags
+    return todos_hashtags[:10]
+
+
+def recomendar_horarios(plataforma, rng=None):
+    """Horarios de publicación de la plataforma, ordenados por efectividad."""
+    rng = generador(rng, 'horarios', plataforma)
+
+    # Añadir variación aleatoria para simular datos reales
+    horarios = []
+    variaciones = rng.integers(-5, 6, size=len(HORARIOS_BASE[plataforma]))
+    for horario, variacion in zip(HORARIOS_BASE[plataforma], variaciones):
+        horario_ajustado = horario.copy()
+        horario_ajustado['efectividad'] = max(min(horario['efectividad'] + int(variacion), 100), 60)
+        horarios.append(horario_ajustado)
+
+    # Ordenar por efectividad
+    horarios.sort(key=lambda x: x['efectividad'], reverse=True)
+
+    return horarios
+
+
+def _parametros_alcance(score_viralidad):
+    # (factor base, rango del alcance inicial, crecimiento exponencial) según el score de viralidad
+    if score_viralidad >= 80:
+        return 2.0, (80, 120), True  # Crecimiento exponencial alto
+    if score_viralidad >= 60:
+        return 1.5, (50, 90), True  # Crecimiento exponencial moderado
+    if score_viralidad >= 40:
+        return 1.2, (30, 60), False  # Crecimiento lineal alto
+    return 1.1, (10, 40), False  # Crecimiento lineal bajo
+
+
+def simular_trayectorias_alcance(score_viralidad, dias=7, simulaciones=SIMULACIONES_ALCANCE, rng=None):
+    """
+    Monte Carlo del alcance acumulado: arreglo (simulaciones, dias) con una trayectoria por fila.
+    Cada trayectoria sigue el modelo de crecimiento de la publicación con su propio alcance
+    inicial y ruido diario; el ciclo es sobre los días y cada paso opera sobre todas las corridas.
+    """
+    rng = generador(rng, 'forecast_impacto', score_viralidad, dias, simulaciones)
+    factor_base, (minimo, maximo), exponencial = _parametros_alcance(score_viralidad)
+
+    trayectorias = np.empty((simulaciones, dias), dtype=np.int64)
+    if dias == 0:
+        return trayectorias
+    inicial = rng.integers(minimo, maximo + 1, size=simulaciones)
+    ruidos = rng.integers(-5, 11, size=(simulaciones, max(dias - 1, 0)))
+    trayectorias[:, 0] = inicial
+    for i in range(1, dias):
+        anterior = trayectorias[:, i - 1]
+        if exponencial:
+            nuevo = (anterior * (factor_base - i * 0.05)).astype(np.int64)  # Disminuye el factor con el tiempo
+        else:
+            nuevo = (anterior + inicial * (factor_base - 1) * (1 - i / 10)).astype(np.int64)
+        trayectorias[:, i] = np.maximum(anterior, nuevo + ruidos[:, i - 1])  # Asegurar que no decrece
+    return trayectorias
+
+
+def simular_forecast_impacto(score_viralidad, dias=7, rng=None, inicio=None, simulaciones=SIMULACIONES_ALCANCE):
+    """
+    Curva de alcance acumulado de una publicación durante `dias` días.
+    `alcance` es la mediana de `simulaciones` trayectorias Monte Carlo; `p10` y `p90`
+    forman la banda de incertidumbre y `media` es el alcance esperado (el último día
+    es el alcance total esperado). `inicio` es la fecha del primer día (por defecto, ahora).
+    """
+    trayectorias = simular_trayectorias_alcance(score_viralidad, dias, simulaciones, rng)
+    p10, p50, p90 = np.percentile(trayectorias, PERCENTILES_ALCANCE, axis=0)
+
+    # Fechas
+    inicio = inicio or datetime.now()
+    fechas = [inicio + timedelta(days=i) for i in range(dias)]
+
+    return pd.DataFrame({
+        'fecha': fechas,
+        'alcance': np.rint(p50).astype(np.int64),
+        'p10': np.rint(p10).astype(np.int64),
+        'p90': np.rint(p90).astype(np.int64),
+        'media': trayectorias.mean(axis=0),
+    })
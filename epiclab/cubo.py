@@ -0,0 +1,207 @@
+"""
+Cubo de agregados precalculado para las métricas del dashboard.
+Guarda las menciones por (día, plataforma, sentimiento, tema) en un arreglo
+int32 y sus sumas acumuladas por día, de modo que cualquier rango de fechas y
+combinación de filtros se resuelve sin volver a recorrer el DataFrame.
+"""
+
+import itertools
+import threading
+
+import numpy as np
+import pandas as pd
+
+DIMENSIONES = ('plataforma', 'sentimiento', 'tema')
+
+_contador_cubos = itertools.count(1)
+
+
+def _acumular(conteos):
+    # Sumas acumuladas por día con una fila de ceros al inicio: total[i0:i1] = acum[i1] - acum[i0]
+    acumulado = np.zeros((conteos.shape[0] + 1,) + conteos.shape[1:], dtype=np.int64)
+    np.cumsum(conteos, axis=0, out=acumulado[1:])
+    if acumulado[-1].max(initial=0) <= np.iinfo(np.int32).max:
+        acumulado = acumulado.astype(np.int32)
+    return acumulado
+
+
+def _indices(categorias):
+    return {dim: {v: i for i, v in enumerate(vals)} for dim, vals in categorias.items()}
+
+
+def _categorias(serie):
+    if isinstance(serie.dtype, pd.CategoricalDtype):
+        return list(serie.cat.categories)
+    return sorted(serie.dropna().unique())
+
+
+def _rango(fechas, inicio, fin):
+    # Rango de días [i0, i1) a partir de fechas inclusivas
+    i0 = 0 if inicio is None else int(fechas.searchsorted(pd.Timestamp(inicio).normalize(), side='left'))
+    i1 = len(fechas) if fin is None else int(fechas.searchsorted(pd.Timestamp(fin).normalize(), side='right'))
+    return i0, max(i0, i1)
+
+
+def _selector(indices, dimension, valor):
+    if valor is None:
+        return slice(None)
+    indices = indices[dimension]
+    if isinstance(valor, (list, tuple, set, frozenset)):
+        return np.array([indices[v] for v in valor if v in indices], dtype=np.intp)
+    return np.array([indices[valor]] if valor in indices else [], dtype=np.intp)
+
+
+def _matriz(estado, inicio, fin, filtros):
+    fechas, _, indices, _, acumulado = estado
+    i0, i1 = _rango(fechas, inicio, fin)
+    rango = acumulado[i1].astype(np.int64) - acumulado[i0]
+    selectores = [_selector(indices, d, filtros.get(d)) for d in DIMENSIONES]
+    return rango[np.ix_(*[np.arange(n)[s] for n, s in zip(rango.shape, selectores)])]
+
+
+class CuboAgregado:
+    """
+    Menciones agregadas por (día, plataforma, sentimiento, tema).
+    `version` aumenta con cada actualización y, junto con `id`, sirve como llave
+    de memoización para los cálculos derivados del cubo. Fechas, catálogos, conteos
+    y sumas acumuladas forman una sola tupla inmutable que `agregar_dias` reemplaza
+    completa: cada lectura toma la tupla una vez y ve un estado consistente.
+    """
+
+    def __init__(self, fechas, plataformas, sentimientos, temas, conteos):
+        categorias = {
+            'plataforma': list(plataformas),
+            'sentimiento': list(sentimientos),
+            'tema': list(temas),
+        }
+        conteos = np.ascontiguousarray(conteos, dtype=np.int32)
+        self._estado = (pd.DatetimeIndex(fechas), categorias, _indices(categorias), conteos, _acumular(conteos))
+        self.id = next(_contador_cubos)
+        self.version = 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def desde_dataframe(cls, df):
+        """Construye el cubo a partir de un DataFrame con el esquema del dashboard."""
+        fechas = pd.DatetimeIndex(df['fecha_dt']).normalize()
+        eje_fechas = pd.date_range(fechas.min(), fechas.max(), freq='D') if len(df) else pd.DatetimeIndex([])
+        categorias = [_categorias(df[dim]) for dim in DIMENSIONES]
+
+        conteos = np.zeros((len(eje_fechas),) + tuple(len(c) for c in categorias), dtype=np.int32)
+        if len(df):
+            idx_dia = eje_fechas.get_indexer(fechas)
+            idx = [pd.Categorical(df[dim], categories=cats).codes for dim, cats in zip(DIMENSIONES, categorias)]
+            np.add.at(conteos, (idx_dia, *idx), df['menciones'].to_numpy(dtype=np.int32))
+        return cls(eje_fechas, *categorias, conteos)
+
+    @property
+    def fechas(self):
+        return self._estado[0]
+
+    @property
+    def categorias(self):
+        return self._estado[1]
+
+    @property
+    def conteos(self):
+        return self._estado[3]
+
+    @property
+    def clave(self):
+        """Identificador de la versión actual del cubo (para memoizar cálculos derivados)."""
+        return f"{self.id}.{self.version}"
+
+    @property
+    def fecha_inicio(self):
+        fechas = self.fechas
+        return fechas[0] if len(fechas) else None
+
+    @property
+    def fecha_fin(self):
+        fechas = self.fechas
+        return fechas[-1] if len(fechas) else None
+
+    def matriz(self, inicio=None, fin=None, plataforma=None, sentimiento=None, tema=None):
+        """Menciones del rango de fechas para cada combinación (plataforma, sentimiento, tema) seleccionada."""
+        return _matriz(self._estado, inicio, fin, {'plataforma': plataforma, 'sentimiento': sentimiento, 'tema': tema})
+
+    def matrices(self, rangos):
+        """
+        Matrices (plataforma, sentimiento, tema) de varios rangos de fechas en una sola
+        operación. `rangos` es una lista de pares (inicio, fin); regresa un arreglo (n, P, S, T).
+        """
+        fechas, _, _, _, acumulado = self._estado
+        limites = np.array([_rango(fechas, inicio, fin) for inicio, fin in rangos], dtype=np.intp).reshape(-1, 2)
+        return acumulado[limites[:, 1]].astype(np.int64) - acumulado[limites[:, 0]]
+
+    def total(self, inicio=None, fin=None, plataforma=None, sentimiento=None, tema=None):
+        """Total de menciones del corte indicado. Cada filtro acepta un valor o una lista."""
+        return int(self.matriz(inicio, fin, plataforma, sentimiento, tema).sum())
+
+    def por(self, dimension, inicio=None, fin=None, **filtros):
+        """Menciones del corte agrupadas por una dimensión (plataforma, sentimiento o tema)."""
+        estado = self._estado
+        bloque = _matriz(estado, inicio, fin, filtros)
+        eje = DIMENSIONES.index(dimension)
+        totales = bloque.sum(axis=tuple(i for i in range(3) if i != eje))
+        seleccion = _selector(estado[2], dimension, filtros.get(dimension))
+        etiquetas = np.array(estado[1][dimension], dtype=object)[seleccion]
+        return pd.Series(totales, index=pd.Index(etiquetas, name=dimension), name='menciones')
+
+    def serie_diaria(self, inicio=None, fin=None, plataforma=None, sentimiento=None, tema=None):
+        """Menciones por día del corte indicado."""
+        fechas, _, indices, conteos, _ = self._estado
+        i0, i1 = _rango(fechas, inicio, fin)
+        selectores = [_selector(indices, d, v) for d, v in zip(DIMENSIONES, (plataforma, sentimiento, tema))]
+        conteos = conteos[i0:i1]
+        for eje, selector in enumerate(selectores, start=1):
+            conteos = conteos.take(np.arange(conteos.shape[eje])[selector], axis=eje)
+        return pd.Series(conteos.sum(axis=(1, 2, 3), dtype=np.int64), index=fechas[i0:i1], name='menciones')
+
+    def agregar_dias(self, df_nuevo):
+        """
+        Incorpora menciones nuevas sin reconstruir el cubo desde el DataFrame completo.
+        Los días posteriores al último se añaden al final (los días sin datos entre ambos
+        quedan en cero); si llegan datos de días ya existentes se suman. Solo se recalculan
+        las sumas acumuladas desde el primer día afectado.
+        """
+        if df_nuevo is None or not len(df_nuevo):
+            return self
+        nuevo = CuboAgregado.desde_dataframe(df_nuevo)
+
+        with self._lock:
+            fechas, categorias_previas, indices, conteos_previos, acumulado_previo = self._estado
+            # Unificar catálogos (las categorías nuevas se agregan al final)
+            categorias = {dim: categorias_previas[dim] + [v for v in nuevo.categorias[dim] if v not in indices[dim]]
+                          for dim in DIMENSIONES}
+            inicio = min(fechas[0], nuevo.fechas[0]) if len(fechas) else nuevo.fechas[0]
+            fin = max(fechas[-1], nuevo.fechas[-1]) if len(fechas) else nuevo.fechas[-1]
+            eje_fechas = pd.date_range(inicio, fin, freq='D')
+
+            forma = (len(eje_fechas),) + tuple(len(categorias[d]) for d in DIMENSIONES)
+            conteos = np.zeros(forma, dtype=np.int32)
+            desplazamiento = eje_fechas.get_indexer(fechas[:1])[0] if len(fechas) else 0
+            d, p, s, t = conteos_previos.shape
+            conteos[desplazamiento:desplazamiento + d, :p, :s, :t] = conteos_previos
+
+            idx_dia = eje_fechas.get_indexer(nuevo.fechas)
+            idx = [np.array([categorias[dim].index(v) for v in nuevo.categorias[dim]], dtype=np.intp) for dim in DIMENSIONES]
+            conteos[np.ix_(idx_dia, *idx)] += nuevo.conteos
+
+            # Las sumas acumuladas previas al primer día modificado siguen siendo válidas; si los
+            # datos nuevos empiezan después de un hueco, se recalcula desde el último día previo
+            primero = min(int(idx_dia.min()), len(fechas))
+            if desplazamiento == 0 and conteos.shape[1:] == conteos_previos.shape[1:] and primero > 0:
+                acumulado = np.zeros((len(eje_fechas) + 1,) + conteos.shape[1:], dtype=np.int64)
+                acumulado[:primero + 1] = acumulado_previo[:primero + 1]
+                np.cumsum(conteos[primero:], axis=0, out=acumulado[primero + 1:])
+                acumulado[primero + 1:] += acumulado[primero]
+                if acumulado[-1].max(initial=0) <= np.iinfo(np.int32).max:
+                    acumulado = acumulado.astype(np.int32)
+            else:
+                acumulado = _acumular(conteos)
+
+            # Se reemplaza el estado completo de una vez para que las lecturas concurrentes sean consistentes
+            self._estado = (eje_fechas, categorias, _indices(categorias), conteos, acumulado)
+            self.version += 1
+        return self
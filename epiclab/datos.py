@@ -0,0 +1,104 @@
+"""
+Generación de datos simulados de social listening para el EPIC Lab.
+Todas las columnas se construyen como arreglos de NumPy con broadcasting,
+sin ciclos anidados en Python.
+"""
+
+import numpy as np
+import pandas as pd
+
+# Catálogos del esquema (el orden define las categorías de cada columna)
+PLATAFORMAS = ['Twitter/X', 'Instagram', 'LinkedIn', 'Facebook', 'TikTok']
+SENTIMIENTOS = ['Positivo', 'Neutral', 'Negativo']
+TEMAS = ['Emprendimiento', 'Innovación', 'Tecnología', 'Finanzas', 'Negocios', 'Educación', 'Eventos']
+
+COLUMNAS = ['fecha', 'plataforma', 'menciones', 'sentimiento', 'tema', 'fecha_dt']
+
+# Distribución base (media, desviación) de cada catálogo
+_DIST_PLATAFORMA = np.array([[0.35, 0.05], [0.25, 0.05], [0.20, 0.03], [0.15, 0.03], [0.05, 0.02]])
+_DIST_SENTIMIENTO = np.array([[0.6, 0.05], [0.3, 0.03], [0.1, 0.02]])
+_DIST_TEMA = np.array([[0.25, 0.05], [0.20, 0.04], [0.15, 0.04], [0.12, 0.03], [0.10, 0.03], [0.10, 0.03], [0.08, 0.02]])
+
+# Términos clave (palabras más mencionadas)
+TERMINOS_BASE = {
+    'EPIC Lab': 100,
+    'ITAM': 80,
+    'innovación': 70,
+    'emprendimiento': 65,
+    'tecnología': 60,
+    'startup': 55,
+    'negocios': 50,
+    'fintech': 45,
+    'proyecto': 40,
+    'digital': 38,
+    'transformación': 35,
+    'futuro': 33,
+    'educación': 30,
+    'México': 28,
+    'desafío': 25,
+    'solución': 23,
+    'impacto': 20,
+    'comunidad': 18,
+    'desarrollo': 15,
+    'talento': 13,
+    'creatividad': 10,
+    'colaboración': 8,
+    'MAD Fellows': 75,
+    'Challenge': 60,
+    'estudiantes': 40,
+    'profesionales': 35,
+    'mentores': 30,
+    'workshops': 25,
+    'conferencias': 20,
+    'networking': 15
+}
+
+
+def _proporciones(rng, dist, dias, minimo=0.01):
+    # Muestrea (dias, n) proporciones con variación diaria y normaliza cada fila a 1
+    valores = rng.normal(dist[:, 0], dist[:, 1], size=(dias, len(dist)))
+    valores = np.maximum(minimo, valores)
+    return valores / valores.sum(axis=1, keepdims=True)
+
+
+def generar_datos_social_listening(dias=30, rng=None, fecha_fin=None):
+    """
+    Genera menciones simuladas por día, plataforma, sentimiento y tema.
+    `rng` acepta un `numpy.random.Generator` (o una semilla) para obtener resultados reproducibles.
+    """
+    rng = np.random.default_rng(rng)
+
+    # Fechas (la última es hoy, salvo que se indique otra)
+    fin = pd.Timestamp.now().normalize() if fecha_fin is None else pd.Timestamp(fecha_fin).normalize()
+    fechas_dt = pd.date_range(end=fin, periods=dias, freq='D')
+
+    # Menciones por día (con tendencia creciente y algo de ruido)
+    base_menciones = np.linspace(50, 150, dias)
+    ruido = rng.normal(0, 15, dias)
+    menciones = np.maximum(5, base_menciones + ruido).astype(np.int64)
+
+    # Proporciones diarias de cada dimensión: (dias, P), (dias, S), (dias, T)
+    prop_plataforma = _proporciones(rng, _DIST_PLATAFORMA, dias)
+    prop_sentimiento = _proporciones(rng, _DIST_SENTIMIENTO, dias)
+    prop_tema = _proporciones(rng, _DIST_TEMA, dias)
+
+    # Reparto en cascada con truncamiento entero en cada nivel, igual que el reparto original
+    por_plataforma = (menciones[:, None] * prop_plataforma).astype(np.int64)
+    por_sentimiento = (por_plataforma[:, :, None] * prop_sentimiento[:, None, :]).astype(np.int64)
+    cubo = (por_sentimiento[:, :, :, None] * prop_tema[:, None, None, :]).astype(np.int64)
+
+    # Solo se conservan las combinaciones con menciones
+    idx_dia, idx_plat, idx_sent, idx_tema = np.nonzero(cubo)
+    valores = cubo[idx_dia, idx_plat, idx_sent, idx_tema]
+
+    etiquetas_fecha = fechas_dt.strftime('%Y-%m-%d')
+    df = pd.DataFrame({
+        'fecha': pd.Categorical.from_codes(idx_dia, categories=etiquetas_fecha),
+        'plataforma': pd.Categorical.from_codes(idx_plat, categories=PLATAFORMAS),
+        'menciones': valores.astype(np.int32),
+        'sentimiento': pd.Categorical.from_codes(idx_sent, categories=SENTIMIENTOS),
+        'tema': pd.Categorical.from_codes(idx_tema, categories=TEMAS),
+        'fecha_dt': fechas_dt.values[idx_dia],
+    }, columns=COLUMNAS)
+
+    return df, dict(TERMINOS_BASE)
@@ -0,0 +1,379 @@
+"""
+Gráficas del dashboard generadas a partir de los datos vigentes.
+Sustituyen a las imágenes estáticas de `assets/`. Cada figura (o PNG en el caso
+de las nubes de palabras) se guarda en caché por tipo, huella del corte de datos
+que la produce y colores del tema: si nada cambia, no se vuelve a construir.
+Las figuras en caché además guardan su especificación, así que st.plotly_chart
+no vuelve a copiar y recorrer las trazas en cada rerun.
+"""
+
+import hashlib
+import io
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+
+import numpy as np
+
+from epiclab.paginas.tema import hex_rgba
+
+MAX_FIGURAS = 64
+
+_cache = OrderedDict()
+_cache_lock = threading.Lock()
+_estadisticas = {'aciertos': 0, 'fallos': 0}
+
+# Términos con connotación negativa (simulados, como los términos base)
+TERMINOS_NEGATIVOS = {
+    'crisis': 90,
+    'problemas': 80,
+    'riesgos': 70,
+    'fracaso': 60,
+    'deuda': 50,
+    'quiebra': 45,
+    'despidos': 40,
+    'incertidumbre': 38,
+    'inflación': 35,
+    'corrupción': 30,
+    'burocracia': 28,
+    'pérdidas': 25,
+    'cierre': 22,
+    'recesión': 20,
+    'desempleo': 18,
+    'inseguridad': 15,
+    'polémica': 12,
+    'conflicto': 10,
+}
+
+
+def huella(*partes):
+    """Hash estable del contenido (arreglos, listas, dicts o escalares) que alimenta una gráfica."""
+    h = hashlib.sha1()
+    for parte in partes:
+        if isinstance(parte, np.ndarray):
+            h.update(str(parte.dtype).encode())
+            h.update(str(parte.shape).encode())
+            h.update(np.ascontiguousarray(parte).tobytes())
+        elif isinstance(parte, dict):
+            h.update(repr(sorted(parte.items())).encode('utf-8'))
+        else:
+            h.update(repr(parte).encode('utf-8'))
+        h.update(b'|')
+    return h.hexdigest()
+
+
+def _cacheado(llave, construir):
+    with _cache_lock:
+        if llave in _cache:
+            _cache.move_to_end(llave)
+            _estadisticas['aciertos'] += 1
+            return _cache[llave]
+    valor = construir()
+    with _cache_lock:
+        _estadisticas['fallos'] += 1
+        _cache[llave] = valor
+        while len(_cache) > MAX_FIGURAS:
+            _cache.popitem(last=False)
+    return valor
+
+
+@lru_cache(maxsize=None)
+def _clase_fija(base):
+    class FiguraFija(base):
+        """Figura en caché (de solo lectura): `to_dict` se calcula una vez y se reutiliza."""
+
+        _especificacion = None
+
+        def to_dict(self):
+            if self._especificacion is None:
+                self._especificacion = super().to_dict()
+            return self._especificacion
+
+    FiguraFija.__name__ = FiguraFija.__qualname__ = base.__name__
+    return FiguraFija
+
+
+def _figura_cacheada(llave, construir):
+    """Como _cacheado, para figuras de Plotly: la figura guardada memoiza su especificación."""
+
+    def construir_fija():
+        fig = construir()
+        fig.__class__ = _clase_fija(type(fig))
+        return fig
+
+    return _cacheado(llave, construir_fija)
+
+
+def estadisticas_cache():
+    with _cache_lock:
+        return dict(_estadisticas, entradas=len(_cache))
+
+
+def _colores_sentimiento(colores):
+    return {'Positivo': colores['primary'], 'Neutral': colores['chart3'], 'Negativo': colores['danger']}
+
+
+def _layout_base(fig, alto):
+    fig.update_layout(
+        margin=dict(t=10, b=30, l=10, r=10),
+        height=alto,
+        legend=dict(orientation='h', yanchor='bottom', y=-0.25, xanchor='center', x=0.5),
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(0,0,0,0)',
+    )
+    return fig
+
+
+def grafica_sentimiento(cubo, colores):
+    """Dona con la distribución del sentimiento de las menciones."""
+    import plotly.graph_objects as go
+
+    por_sentimiento = cubo.por('sentimiento')
+    etiquetas = list(por_sentimiento.index)
+    valores = por_sentimiento.to_numpy()
+
+    def construir():
+        mapa = _colores_sentimiento(colores)
+        fig = go.Figure(go.Pie(
+            labels=etiquetas,
+            values=valores,
+            hole=0.55,
+            sort=False,
+            marker=dict(colors=[mapa.get(e, colores['chart5']) for e in etiquetas]),
+            textinfo='label+percent',
+        ))
+        return _layout_base(fig, 380)
+
+    return _figura_cacheada(('sentimiento', huella(valores, etiquetas, colores)), construir)
+
+
+def grafica_plataforma_sentimiento(cubo, colores):
+    """Barras apiladas de menciones por plataforma y sentimiento."""
+    import plotly.graph_objects as go
+
+    matriz = cubo.matriz().sum(axis=2)  # (plataforma, sentimiento)
+    plataformas = cubo.categorias['plataforma']
+    sentimientos = cubo.categorias['sentimiento']
+
+    def construir():
+        mapa = _colores_sentimiento(colores)
+        orden = np.argsort(matriz.sum(axis=1))
+        fig = go.Figure([
+            go.Bar(
+                y=[plataformas[i] for i in orden],
+                x=matriz[orden, j],
+                name=sentimiento,
+                orientation='h',
+                marker_color=mapa.get(sentimiento, colores['chart5']),
+            )
+            for j, sentimiento in enumerate(sentimientos)
+        ])
+        fig.update_layout(barmode='stack', xaxis_title='Menciones')
+        return _layout_base(fig, 380)
+
+    return _figura_cacheada(('plataforma_sentimiento', huella(matriz, plataformas, sentimientos, colores)), construir)
+
+
+def grafica_tema_sentimiento(cubo, colores):
+    """Barras apiladas de menciones por tema y sentimiento."""
+    import plotly.graph_objects as go
+
+    matriz = cubo.matriz().sum(axis=0).T  # (tema, sentimiento)
+    temas = cubo.categorias['tema']
+    sentimientos = cubo.categorias['sentimiento']
+
+    def construir():
+        mapa = _colores_sentimiento(colores)
+        orden = np.argsort(-matriz.sum(axis=1))
+        fig = go.Figure([
+            go.Bar(
+                x=[temas[i] for i in orden],
+                y=matriz[orden, j],
+                name=sentimiento,
+                marker_color=mapa.get(sentimiento, colores['chart5']),
+            )
+            for j, sentimiento in enumerate(sentimientos)
+        ])
+        fig.update_layout(barmode='stack', yaxis_title='Menciones')
+        return _layout_base(fig, 400)
+
+    return _figura_cacheada(('tema_sentimiento', huella(matriz, temas, sentimientos, colores)), construir)
+
+
+def grafica_sentimiento_diario(cubo, colores):
+    """Evolución diaria de las menciones por sentimiento."""
+    import plotly.graph_objects as go
+
+    diario = cubo.conteos.sum(axis=(1, 3), dtype=np.int64)  # (dia, sentimiento)
+    sentimientos = cubo.categorias['sentimiento']
+    fechas = cubo.fechas
+
+    def construir():
+        mapa = _colores_sentimiento(colores)
+        fig = go.Figure([
+            go.Scatter(
+                x=fechas,
+                y=diario[:, j],
+                name=sentimiento,
+                mode='lines',
+                stackgroup='sentimiento',
+                line=dict(width=1.5, color=mapa.get(sentimiento, colores['chart5'])),
+                fillcolor=hex_rgba(mapa.get(sentimiento, colores['chart5']), 0.35),
+            )
+            for j, sentimiento in enumerate(sentimientos)
+        ])
+        fig.update_layout(yaxis_title='Menciones', hovermode='x unified')
+        return _layout_base(fig, 380)
+
+    return _figura_cacheada(('sentimiento_diario', huella(diario, fechas.asi8, sentimientos, colores)), construir)
+
+
+def grafica_radar_impacto(categorias, valores, colores):
+    """Radar de las dimensiones del medidor de impacto social, sobre anillos de referencia en 50, 75 y 100."""
+    import plotly.graph_objects as go
+
+    valores = list(valores)
+
+    def construir():
+        # Cerrar el polígono repitiendo el primer valor
+        categorias_cerrado = list(categorias) + [categorias[0]]
+        valores_cerrado = valores + [valores[0]]
+        anillos = [
+            (100, 'rgba(245, 245, 245, 0.3)', 'rgba(245, 245, 245, 0.5)'),
+            (75, hex_rgba(colores['secondary'], 0.1), hex_rgba(colores['secondary'], 0.3)),
+            (50, hex_rgba(colores['primary'], 0.1), hex_rgba(colores['primary'], 0.3)),
+        ]
+        fig = go.Figure([
+            go.Scatterpolar(
+                r=[nivel] * len(categorias_cerrado),
+                theta=categorias_cerrado,
+                fill='toself',
+                fillcolor=relleno,
+                line=dict(color=borde),
+                showlegend=False,
+            )
+            for nivel, relleno, borde in anillos
+        ])
+        fig.add_trace(go.Scatterpolar(
+            r=valores_cerrado,
+            theta=categorias_cerrado,
+            fill='toself',
+            fillcolor=hex_rgba(colores['primary'], 0.6),
+            line=dict(color=colores['primary'], width=3),
+            name='Impacto Social',
+        ))
+        fig.update_layout(
+            polar=dict(radialaxis=dict(visible=True, range=[0, 100], tickvals=[25, 50, 75, 100], ticktext=['25', '50', '75', '100'])),
+            showlegend=False,
+            margin=dict(t=10, b=30, l=10, r=10),
+            height=400,
+        )
+        return fig
+
+    return _figura_cacheada(('radar_impacto', huella(list(categorias), valores, colores)), construir)
+
+
+def grafica_forecast_menciones(forecast, colores):
+    """Menciones históricas y pronosticadas con la banda del intervalo de predicción (de generar_forecast_menciones)."""
+    import plotly.express as px
+    import plotly.graph_objects as go
+
+    fechas = forecast['fecha'].to_numpy()
+    menciones = forecast['menciones'].to_numpy()
+    tipo = forecast['tipo'].to_numpy(dtype=object)
+    inferior = forecast['inferior'].to_numpy()
+    superior = forecast['superior'].to_numpy()
+
+    def construir():
+        fig = px.line(
+            forecast,
+            x='fecha',
+            y='menciones',
+            color='tipo',
+            title=None,
+            labels={'fecha': 'Fecha', 'menciones': 'Menciones', 'tipo': ''},
+            color_discrete_map={'Histórico': colores['primary'], 'Predicción': colores['secondary']},
+        )
+        # Área sombreada con el intervalo de predicción
+        futuro = tipo == 'Predicción'
+        fig.add_trace(go.Scatter(
+            x=np.concatenate([fechas[futuro], fechas[futuro][::-1]]),
+            y=np.concatenate([superior[futuro], inferior[futuro][::-1]]),
+            fill='toself',
+            fillcolor=hex_rgba(colores['secondary'], 0.2),
+            line=dict(color='rgba(0,0,0,0)'),
+            hoverinfo='skip',
+            name='Intervalo 80%',
+        ))
+        fig.update_layout(
+            margin=dict(t=10, b=30, l=10, r=10),
+            legend=dict(orientation='h', yanchor='bottom', y=-0.2, xanchor='center', x=0.5),
+            height=400,
+        )
+        return fig
+
+    llave = huella(fechas.astype('datetime64[ns]').view(np.int64), menciones, tipo.tolist(), inferior, superior, colores)
+    return _figura_cacheada(('forecast_menciones', llave), construir)
+
+
+def grafica_alcance_impacto(impacto, colores, memoizar=True):
+    """
+    Área del alcance esperado (p50) con la banda p10-p90 de las trayectorias simuladas
+    (de simular_forecast_impacto). Con `memoizar=False` (curvas sin semilla, que no se
+    repiten) la figura no entra a la caché y no desplaza a las demás.
+    """
+    import plotly.express as px
+    import plotly.graph_objects as go
+
+    fechas = impacto['fecha'].to_numpy()
+    alcance = impacto['alcance'].to_numpy()
+    p10 = impacto['p10'].to_numpy()
+    p90 = impacto['p90'].to_numpy()
+
+    def construir():
+        fig = px.area(
+            impacto,
+            x='fecha',
+            y='alcance',
+            title=None,
+            labels={'fecha': 'Fecha', 'alcance': 'Alcance (Personas)'},
+            template='plotly_white',
+        )
+        fig.update_traces(line=dict(color=colores['primary'], width=3), fillcolor=hex_rgba(colores['primary'], 0.2))
+        fig.add_trace(go.Scatter(
+            x=np.concatenate([fechas, fechas[::-1]]),
+            y=np.concatenate([p90, p10[::-1]]),
+            fill='toself',
+            fillcolor=hex_rgba(colores['secondary'], 0.2),
+            line=dict(color='rgba(0,0,0,0)'),
+            hoverinfo='skip',
+            name='p10-p90',
+        ))
+        fig.update_layout(margin=dict(t=10, b=10, l=10, r=10), height=350)
+        return fig
+
+    if not memoizar:
+        return construir()
+    llave = huella(fechas.astype('datetime64[ns]').view(np.int64), alcance, p10, p90, colores)
+    return _figura_cacheada(('alcance_impacto', llave), construir)
+
+
+def nube_palabras_png(frecuencias, colormap='Greens', ancho=1200, alto=500):
+    """PNG de la nube de palabras para un dict {término: frecuencia}."""
+
+    def construir():
+        from wordcloud import WordCloud
+
+        nube = WordCloud(
+            width=ancho,
+            height=alto,
+            background_color='white',
+            colormap=colormap,
+            prefer_horizontal=0.9,
+            random_state=42,
+        ).generate_from_frequencies(frecuencias)
+        buffer = io.BytesIO()
+        nube.to_image().save(buffer, format='PNG', optimize=True)
+        return buffer.getvalue()
+
+    return _cacheado(('nube', huella(frecuencias, colormap, ancho, alto)), construir)
@@ -0,0 +1,123 @@
+"""
+Medidor de impacto social de un texto.
+Las palabras clave de cada dimensión se precompilan en un vocabulario con su
+vector de incrementos, de modo que un lote de miles de publicaciones se puntúa
+con una sola tokenización y una suma vectorizada por texto.
+"""
+
+import numpy as np
+import pandas as pd
+
+from epiclab.aleatorio import enteros_por_texto, generador, semilla_efectiva
+
+DIMENSIONES = ('viralidad', 'relevancia_social', 'inclusividad', 'claridad', 'tono_positivo')
+
+# Palabras clave que aumentan cada dimensión
+PALABRAS_CLAVE = {
+    'viralidad': frozenset(['innovación', 'disruptivo', 'revolucionario', 'increíble', 'sorprendente', 'único', 'exclusivo']),
+    'relevancia_social': frozenset(['impacto', 'comunidad', 'sociedad', 'problema', 'solución', 'futuro', 'cambio', 'transformación']),
+    'inclusividad': frozenset(['todos', 'todas', 'diversidad', 'inclusión', 'accesible', 'oportunidad', 'equidad']),
+    'claridad': frozenset(['simple', 'claro', 'directo', 'específico', 'concreto', 'ejemplo', 'paso']),
+    'tono_positivo': frozenset(['éxito', 'logro', 'beneficio', 'ventaja', 'positivo', 'mejora', 'crecimiento', 'desarrollo']),
+}
+
+# Rango (inclusivo) de la puntuación base aleatoria de cada dimensión
+RANGOS_BASE = {
+    'viralidad': (40, 60),
+    'relevancia_social': (45, 65),
+    'inclusividad': (35, 55),
+    'claridad': (50, 70),
+    'tono_positivo': (45, 65),
+}
+
+# Puntuación fija para textos demasiado cortos
+PUNTUACION_TEXTO_CORTO = {
+    'viralidad': 30,
+    'relevancia_social': 25,
+    'inclusividad': 40,
+    'claridad': 35,
+    'tono_positivo': 45,
+}
+
+INCREMENTO_PALABRA = 5
+LONGITUD_MINIMA = 10  # caracteres
+
+SUGERENCIAS = {
+    'viralidad': "Incluye elementos más sorprendentes o únicos para aumentar la viralidad.",
+    'relevancia_social': "Conecta más claramente con problemas o necesidades actuales de la comunidad.",
+    'inclusividad': "Utiliza lenguaje más inclusivo y considera diversas perspectivas.",
+    'claridad': "Simplifica el mensaje y sé más directo en la comunicación.",
+    'tono_positivo': "Incorpora un tono más positivo y orientado a soluciones.",
+}
+SUGERENCIA_TEXTO_CORTO = "El texto es demasiado corto para realizar un análisis completo. Intenta escribir un mensaje más elaborado que comunique claramente el valor del EPIC Lab."
+SUGERENCIA_BALANCEADO = "¡Excelente trabajo! Tu contenido tiene un buen balance. Considera amplificar tu mensaje a través de múltiples canales."
+
+
+def _compilar_vocabulario():
+    # Vocabulario ordenado y matriz (V, 5) con el incremento que cada palabra aporta a cada dimensión
+    palabras = sorted(set().union(*PALABRAS_CLAVE.values()))
+    incrementos = np.zeros((len(palabras), len(DIMENSIONES)), dtype=np.int64)
+    for fila, palabra in enumerate(palabras):
+        for j, dimension in enumerate(DIMENSIONES):
+            if palabra in PALABRAS_CLAVE[dimension]:
+                incrementos[fila, j] = INCREMENTO_PALABRA
+    return palabras, incrementos
+
+
+_PALABRAS, _INCREMENTOS = _compilar_vocabulario()
+_BASE_MIN = np.array([RANGOS_BASE[d][0] for d in DIMENSIONES])
+_BASE_MAX = np.array([RANGOS_BASE[d][1] for d in DIMENSIONES])
+
+
+def analizar_impacto_lote(textos, rng=None):
+    """
+    Puntúa un lote de textos (lista o columna de un DataFrame).
+    Regresa un DataFrame con una columna por dimensión (0-100) y el mismo índice
+    que la entrada cuando es una Serie. En modo determinista (ver epiclab.aleatorio)
+    la puntuación base de cada texto depende solo del texto y de la semilla.
+    """
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    serie = textos if isinstance(textos, pd.Series) else pd.Series(list(textos), dtype=object)
+    n = len(serie)
+    arreglo = pa.array(serie.astype('string').fillna(''), type=pa.string())
+    cortos = pc.less(pc.utf8_length(arreglo), LONGITUD_MINIMA).to_numpy(zero_copy_only=False)
+
+    # Misma tokenización que el análisis individual (minúsculas y separación por espacios),
+    # pero en Arrow: las palabras se buscan en el vocabulario sin pasar por objetos de Python
+    listas = pc.utf8_split_whitespace(pc.utf8_lower(arreglo))
+    longitud = pc.list_value_length(listas).to_numpy(zero_copy_only=False)
+    filas = pc.index_in(pc.list_flatten(listas), value_set=pa.array(_PALABRAS)).to_numpy(zero_copy_only=False)
+    posiciones = pc.list_parent_indices(listas).to_numpy(zero_copy_only=False)
+
+    encontradas = ~np.isnan(filas)
+    suma = np.zeros((n, len(DIMENSIONES)), dtype=np.int64)
+    np.add.at(suma, posiciones[encontradas], _INCREMENTOS[filas[encontradas].astype(np.intp)])
+
+    semilla = semilla_efectiva(rng)
+    if semilla is not None:
+        base = enteros_por_texto(serie.to_numpy(dtype=object), semilla, _BASE_MIN, _BASE_MAX)
+    else:
+        base = generador(rng).integers(_BASE_MIN, _BASE_MAX + 1, size=(n, len(DIMENSIONES)))
+    # Penaliza textos muy cortos o muy largos
+    factor = np.where(longitud < 20, 0.8, np.where(longitud > 200, 0.9, 1.0))
+    puntuaciones = np.clip(((base + suma) * factor[:, None]).astype(np.int64), 0, 100)
+    puntuaciones[cortos] = [PUNTUACION_TEXTO_CORTO[d] for d in DIMENSIONES]
+
+    return pd.DataFrame(puntuaciones, columns=list(DIMENSIONES), index=serie.index)
+
+
+def sugerencias_impacto(puntuaciones):
+    """Texto de sugerencias para un dict de puntuaciones por dimensión."""
+    sugerencias = [SUGERENCIAS[d] for d in DIMENSIONES if puntuaciones[d] < 50]
+    return " ".join(sugerencias or [SUGERENCIA_BALANCEADO])
+
+
+def analizar_impacto_social(texto, rng=None):
+    """Puntuaciones de las cinco dimensiones y sugerencias para un solo texto."""
+    if not texto or len(texto) < LONGITUD_MINIMA:
+        return dict(PUNTUACION_TEXTO_CORTO, sugerencias=SUGERENCIA_TEXTO_CORTO)
+
+    puntuaciones = {d: int(v) for d, v in analizar_impacto_lote([texto], rng).iloc[0].items()}
+    return dict(puntuaciones, sugerencias=sugerencias_impacto(puntuaciones))
@@ -0,0 +1,214 @@
+"""
+Puntuación de impacto social con el modelo de lenguaje (opcional, EPICLAB_IMPACTO_LLM=1).
+Regresa las mismas cinco dimensiones que el medidor heurístico de epiclab.impacto.
+Muchas publicaciones viajan en una sola petición con un prompt JSON estructurado
+y cada resultado se guarda por hash del texto. Si no hay presupuesto de tokens,
+la petición tarda más del límite o la respuesta no se puede leer, esas
+publicaciones se puntúan con la heurística, así el tiempo de respuesta no
+depende del proveedor.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, wait
+
+import pandas as pd
+
+from epiclab.impacto import (
+    DIMENSIONES,
+    LONGITUD_MINIMA,
+    PUNTUACION_TEXTO_CORTO,
+    SUGERENCIA_TEXTO_CORTO,
+    analizar_impacto_lote,
+    sugerencias_impacto,
+)
+
+IMPACTO_LLM = os.environ.get("EPICLAB_IMPACTO_LLM", "0") == "1"
+MODELO_IMPACTO = os.environ.get("EPICLAB_MODELO_IMPACTO", "gpt-4o-mini")
+PUBLICACIONES_POR_PETICION = 20
+CARACTERES_POR_PUBLICACION = 1200  # los textos más largos se recortan dentro del prompt
+TOKENS_RESPUESTA_POR_PUBLICACION = 40
+TIMEOUT_IMPACTO = float(os.environ.get("EPICLAB_IMPACTO_TIMEOUT", 8))  # segundos por lote
+TOKENS_MINUTO_IMPACTO = int(os.environ.get("EPICLAB_IMPACTO_TPM", 40000))  # presupuesto propio del puntuador
+PETICIONES_SIMULTANEAS = 4
+MAX_RESULTADOS = 20000
+VERSION_PROMPT = 1  # forma parte de la llave del caché
+
+PROMPT_IMPACTO = """
+Eres un evaluador de contenido para redes sociales del EPIC Lab (innovación y emprendimiento, ITAM).
+Para cada publicación asigna un entero de 0 a 100 en cada dimensión:
+- viralidad: qué tan probable es que se comparta (elementos sorprendentes, únicos, llamativos).
+- relevancia_social: conexión con problemas o necesidades de la comunidad y la sociedad.
+- inclusividad: lenguaje inclusivo y apertura a diversas perspectivas.
+- claridad: mensaje simple, directo y concreto.
+- tono_positivo: tono optimista y orientado a soluciones.
+Recibirás un JSON {"publicaciones": [{"id": ..., "texto": ...}]}.
+Responde solo con un JSON {"resultados": [{"id": ..., "viralidad": ..., "relevancia_social": ...,
+"inclusividad": ..., "claridad": ..., "tono_positivo": ...}]} con un elemento por publicación.
+""".strip()
+
+
+def _huella(texto):
+    return hashlib.sha1(f"{VERSION_PROMPT}:{MODELO_IMPACTO}:{texto}".encode("utf-8")).hexdigest()
+
+
+def _leer_resultados(contenido, ids):
+    """{id: puntuaciones} de la respuesta del modelo; se descartan los elementos incompletos."""
+    try:
+        resultados = json.loads(contenido).get("resultados", [])
+    except (TypeError, ValueError, AttributeError):
+        return {}
+    leidos = {}
+    for elemento in resultados if isinstance(resultados, list) else []:
+        try:
+            identificador = int(elemento["id"])
+            puntuaciones = {d: min(100, max(0, int(round(float(elemento[d]))))) for d in DIMENSIONES}
+        except (KeyError, TypeError, ValueError):
+            continue
+        if identificador in ids:
+            leidos[identificador] = puntuaciones
+    return leidos
+
+
+class PuntuadorImpactoLLM:
+    """
+    `analizar_lote(textos)` regresa un DataFrame con las cinco dimensiones, como
+    `impacto.analizar_impacto_lote`; `analizar(texto)` regresa el dict con sugerencias,
+    como `impacto.analizar_impacto_social`.
+    """
+
+    def __init__(self, pasarela, modelo=MODELO_IMPACTO, por_peticion=PUBLICACIONES_POR_PETICION,
+                 timeout=TIMEOUT_IMPACTO, tokens_minuto=TOKENS_MINUTO_IMPACTO, max_resultados=MAX_RESULTADOS):
+        from epiclab.pasarela_llm import CubetaTokens
+
+        self.pasarela = pasarela
+        self.modelo = modelo
+        self.por_peticion = por_peticion
+        self.timeout = timeout
+        self.max_resultados = max_resultados
+        self._presupuesto = CubetaTokens(tokens_minuto / 60, tokens_minuto)
+        self._pool = ThreadPoolExecutor(max_workers=PETICIONES_SIMULTANEAS, thread_name_prefix="impacto-llm")
+        self._resultados = OrderedDict()  # huella -> puntuaciones
+        self._en_curso = {}  # huella -> Future del lote que la está puntuando
+        self._lock = threading.Lock()
+        self._estadisticas = {"cache": 0, "llm": 0, "peticiones": 0, "sin_presupuesto": 0, "timeout": 0, "errores": 0}
+
+    def _contar(self, clave, cantidad=1):
+        with self._lock:
+            self._estadisticas[clave] += cantidad
+
+    def _guardar(self, huellas, leidos):
+        with self._lock:
+            for i, puntuaciones in leidos.items():
+                self._resultados[huellas[i]] = puntuaciones
+                self._resultados.move_to_end(huellas[i])
+            while len(self._resultados) > self.max_resultados:
+                self._resultados.popitem(last=False)
+
+    def _mensajes(self, textos):
+        publicaciones = [{"id": i, "texto": texto[:CARACTERES_POR_PUBLICACION]} for i, texto in enumerate(textos)]
+        return [
+            {"role": "system", "content": PROMPT_IMPACTO},
+            {"role": "user", "content": json.dumps({"publicaciones": publicaciones}, ensure_ascii=False)},
+        ]
+
+    def _puntuar(self, huellas, mensajes, max_tokens):
+        # Corre en el pool: una petición por lote; lo que llega se guarda aunque el render ya no espere
+        self._contar("peticiones")
+        respuesta = self.pasarela.crear(
+            model=self.modelo, messages=mensajes, max_tokens=max_tokens,
+            temperature=0, response_format={"type": "json_object"},
+        )
+        leidos = _leer_resultados(respuesta.choices[0].message.content, set(range(len(huellas))))
+        self._guardar(huellas, leidos)
+        return leidos
+
+    def _terminar(self, huellas, futuro):
+        with self._lock:
+            for huella in huellas:
+                if self._en_curso.get(huella) is futuro:
+                    del self._en_curso[huella]
+
+    def analizar_lote(self, textos, rng=None):
+        """Puntúa un lote de textos; los que no obtienen respuesta del modelo a tiempo usan la heurística."""
+        from epiclab.asistente import contar_mensajes
+
+        serie = textos if isinstance(textos, pd.Series) else pd.Series(list(textos), dtype=object)
+        valores = serie.astype("string").fillna("").tolist()
+        huellas = [_huella(t) for t in valores]
+        puntuaciones = [None] * len(valores)
+
+        # Caché y textos cortos; los pendientes se agrupan por texto para no pedirlos dos veces
+        pendientes, esperando = {}, {}
+        with self._lock:
+            for i, (texto, huella) in enumerate(zip(valores, huellas)):
+                if len(texto) < LONGITUD_MINIMA:
+                    puntuaciones[i] = dict(PUNTUACION_TEXTO_CORTO)
+                elif huella in self._resultados:
+                    self._resultados.move_to_end(huella)
+                    puntuaciones[i] = self._resultados[huella]
+                    self._estadisticas["cache"] += 1
+                elif huella in self._en_curso:
+                    esperando.setdefault(huella, self._en_curso[huella])
+                else:
+                    pendientes.setdefault(huella, texto)
+
+        # Un lote por petición mientras haya presupuesto; sin presupuesto se queda con la heurística
+        lista = list(pendientes.items())
+        for inicio in range(0, len(lista), self.por_peticion):
+            lote = lista[inicio:inicio + self.por_peticion]
+            lote_huellas = [h for h, _ in lote]
+            mensajes = self._mensajes([t for _, t in lote])
+            max_tokens = TOKENS_RESPUESTA_POR_PUBLICACION * len(lote) + 20
+            if not self._presupuesto.tomar(contar_mensajes(mensajes) + max_tokens, limite=0):
+                self._contar("sin_presupuesto", len(lote))
+                continue
+            futuro = self._pool.submit(self._puntuar, lote_huellas, mensajes, max_tokens)
+            with self._lock:
+                for huella in lote_huellas:
+                    self._en_curso[huella] = futuro
+            futuro.add_done_callback(lambda f, h=lote_huellas: self._terminar(h, f))
+            for huella in lote_huellas:
+                esperando[huella] = futuro
+
+        if esperando:
+            _, sin_terminar = wait(set(esperando.values()), timeout=self.timeout)
+            if sin_terminar:
+                self._contar("timeout", sum(1 for f in esperando.values() if f in sin_terminar))
+            for futuro in set(esperando.values()) - sin_terminar:
+                if futuro.exception() is not None:
+                    self._contar("errores")
+
+        with self._lock:
+            for i, huella in enumerate(huellas):
+                if puntuaciones[i] is None and huella in self._resultados:
+                    puntuaciones[i] = self._resultados[huella]
+                    self._estadisticas["llm"] += 1
+
+        resultado = pd.DataFrame(
+            [p if p is not None else {d: 0 for d in DIMENSIONES} for p in puntuaciones],
+            columns=list(DIMENSIONES), index=serie.index, dtype="int64",
+        )
+        faltantes = [i for i, p in enumerate(puntuaciones) if p is None]
+        if faltantes:
+            heuristica = analizar_impacto_lote(serie.iloc[faltantes], rng)
+            resultado.iloc[faltantes] = heuristica.to_numpy()
+        return resultado
+
+    def analizar(self, texto, rng=None):
+        """Puntuaciones de las cinco dimensiones y sugerencias para un solo texto."""
+        if not texto or len(texto) < LONGITUD_MINIMA:
+            return dict(PUNTUACION_TEXTO_CORTO, sugerencias=SUGERENCIA_TEXTO_CORTO)
+
+        puntuaciones = {d: int(v) for d, v in self.analizar_lote([texto], rng).iloc[0].items()}
+        return dict(puntuaciones, sugerencias=sugerencias_impacto(puntuaciones))
+
+    def estadisticas(self):
+        with self._lock:
+            return dict(self._estadisticas, en_cache=len(self._resultados), en_curso=len(self._en_curso))
+
+    def cerrar(self):
+        self._pool.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,247 @@
+"""
+Ingesta de exportaciones reales de herramientas de social listening.
+Lee CSV/JSON grandes por bloques, los normaliza al esquema del dashboard
+(fecha, plataforma, menciones, sentimiento, tema, fecha_dt) y guarda una copia
+en Parquet particionada por mes y plataforma para abrirla rápido en los
+siguientes arranques.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+from epiclab.datos import COLUMNAS, PLATAFORMAS, SENTIMIENTOS, TEMAS
+
+TAMANO_BLOQUE = 250_000
+DIR_CACHE = os.environ.get("EPICLAB_CACHE_DIR", os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".cache"))
+TEMA_DESCONOCIDO = "Otros"
+
+# Nombres de columna usados por distintas herramientas -> columna del esquema
+ALIAS_COLUMNAS = {
+    'fecha': ['fecha', 'date', 'created_at', 'published', 'published_at', 'timestamp', 'datetime', 'time'],
+    'plataforma': ['plataforma', 'platform', 'source', 'network', 'red_social', 'page_type', 'channel'],
+    'sentimiento': ['sentimiento', 'sentiment', 'polarity', 'tono'],
+    'tema': ['tema', 'topic', 'category', 'categoria', 'theme', 'tag'],
+    'menciones': ['menciones', 'mentions', 'count', 'volume', 'volumen', 'total'],
+}
+# Columna con el texto de la mención (opcional; alimenta las nubes de palabras)
+ALIAS_TEXTO = ['texto', 'text', 'full_text', 'content', 'contenido', 'message', 'mensaje', 'snippet', 'title']
+
+# Valores equivalentes -> valor canónico
+ALIAS_PLATAFORMA = {
+    'twitter': 'Twitter/X', 'x': 'Twitter/X', 'twitter/x': 'Twitter/X', 'x (twitter)': 'Twitter/X',
+    'instagram': 'Instagram', 'ig': 'Instagram',
+    'linkedin': 'LinkedIn',
+    'facebook': 'Facebook', 'fb': 'Facebook',
+    'tiktok': 'TikTok',
+}
+ALIAS_SENTIMIENTO = {
+    'positivo': 'Positivo', 'positive': 'Positivo', 'pos': 'Positivo',
+    'neutral': 'Neutral', 'neutro': 'Neutral', 'neu': 'Neutral',
+    'negativo': 'Negativo', 'negative': 'Negativo', 'neg': 'Negativo',
+}
+
+
+def _resolver_columnas(columnas):
+    # Regresa {columna_original: columna_esquema} según ALIAS_COLUMNAS
+    normalizadas = {c.strip().lower().replace(' ', '_'): c for c in columnas}
+    mapeo = {}
+    for destino, alias in ALIAS_COLUMNAS.items():
+        for nombre in alias:
+            if nombre in normalizadas:
+                mapeo[normalizadas[nombre]] = destino
+                break
+    faltantes = {'fecha', 'plataforma', 'sentimiento'} - set(mapeo.values())
+    if faltantes:
+        raise ValueError(f"La exportación no tiene las columnas requeridas: {', '.join(sorted(faltantes))}")
+    return mapeo
+
+
+def _normalizar_categoria(serie, alias):
+    # Mapea cada valor único una sola vez en lugar de fila por fila
+    serie = serie.astype('string').str.strip()
+    unicos = serie.dropna().unique()
+    tabla = {v: alias.get(v.lower(), v) for v in unicos}
+    return serie.map(tabla)
+
+
+def _parsear_fechas(serie):
+    # El formato se infiere del primer valor; si el archivo mezcla formatos se analiza valor por valor
+    try:
+        fecha = pd.to_datetime(serie, utc=True)
+    except (ValueError, TypeError):
+        fecha = pd.to_datetime(serie, errors='coerce', utc=True, format='mixed')
+    return fecha.dt.tz_localize(None).dt.normalize()
+
+
+def normalizar_bloque(bloque):
+    """
+    Convierte un bloque crudo de la exportación al esquema del dashboard y lo
+    agrega por (fecha, plataforma, sentimiento, tema).
+    """
+    mapeo = _resolver_columnas(bloque.columns)
+    bloque = bloque[list(mapeo)].rename(columns=mapeo)
+
+    fecha = _parsear_fechas(bloque['fecha'])
+    datos = pd.DataFrame({
+        'fecha_dt': fecha,
+        'plataforma': _normalizar_categoria(bloque['plataforma'], ALIAS_PLATAFORMA),
+        'sentimiento': _normalizar_categoria(bloque['sentimiento'], ALIAS_SENTIMIENTO),
+        'tema': bloque['tema'].astype('string').str.strip() if 'tema' in bloque else TEMA_DESCONOCIDO,
+        'menciones': pd.to_numeric(bloque['menciones'], errors='coerce') if 'menciones' in bloque else 1,
+    })
+    datos['tema'] = datos['tema'].fillna(TEMA_DESCONOCIDO)
+    datos = datos.dropna(subset=['fecha_dt', 'plataforma', 'sentimiento', 'menciones'])
+
+    agregado = datos.groupby(['fecha_dt', 'plataforma', 'sentimiento', 'tema'], observed=True, sort=False)['menciones'].sum()
+    return agregado.reset_index()
+
+
+def leer_export(ruta, tamano_bloque=TAMANO_BLOQUE):
+    """
+    Itera sobre la exportación en bloques ya normalizados.
+    Soporta CSV y JSON por líneas (.jsonl/.ndjson); un JSON con arreglo se lee completo.
+    """
+    extension = os.path.splitext(ruta)[1].lower()
+    if extension in ('.csv', '.tsv', '.txt'):
+        separador = '\t' if extension == '.tsv' else ','
+        # Solo se leen las columnas que usa el esquema (las exportaciones traen texto, autor, etc.)
+        encabezado = pd.read_csv(ruta, sep=separador, nrows=0).columns
+        columnas = list(_resolver_columnas(encabezado))
+        lector = pd.read_csv(ruta, sep=separador, usecols=columnas, chunksize=tamano_bloque, low_memory=False)
+    elif extension in ('.jsonl', '.ndjson'):
+        lector = pd.read_json(ruta, lines=True, chunksize=tamano_bloque)
+    elif extension == '.json':
+        lector = [pd.read_json(ruta)]
+    else:
+        raise ValueError(f"Formato de exportación no soportado: {extension}")
+
+    for bloque in lector:
+        if len(bloque):
+            yield normalizar_bloque(bloque)
+
+
+def leer_textos_export(ruta, tamano_bloque=TAMANO_BLOQUE):
+    """
+    Itera sobre (textos, sentimientos) de la exportación, por bloques.
+    Solo se leen las columnas de texto y sentimiento; si la exportación no trae
+    texto no produce ningún bloque.
+    """
+    extension = os.path.splitext(ruta)[1].lower()
+    if extension in ('.csv', '.tsv', '.txt'):
+        separador = '\t' if extension == '.tsv' else ','
+        encabezado = pd.read_csv(ruta, sep=separador, nrows=0).columns
+    elif extension in ('.jsonl', '.ndjson'):
+        encabezado = pd.read_json(ruta, lines=True, nrows=1).columns
+    elif extension == '.json':
+        encabezado = None
+    else:
+        raise ValueError(f"Formato de exportación no soportado: {extension}")
+
+    def columnas_de(nombres):
+        normalizadas = {c.strip().lower().replace(' ', '_'): c for c in nombres}
+        texto = next((normalizadas[a] for a in ALIAS_TEXTO if a in normalizadas), None)
+        sentimiento = next((normalizadas[a] for a in ALIAS_COLUMNAS['sentimiento'] if a in normalizadas), None)
+        return texto, sentimiento
+
+    if extension == '.json':
+        bloques = [pd.read_json(ruta)]
+        texto, sentimiento = columnas_de(bloques[0].columns)
+    else:
+        texto, sentimiento = columnas_de(encabezado)
+        if texto is None or sentimiento is None:
+            return
+        if extension in ('.jsonl', '.ndjson'):
+            bloques = pd.read_json(ruta, lines=True, chunksize=tamano_bloque)
+        else:
+            bloques = pd.read_csv(ruta, sep=separador, usecols=[texto, sentimiento], chunksize=tamano_bloque, low_memory=False)
+    if texto is None or sentimiento is None:
+        return
+
+    for bloque in bloques:
+        if len(bloque):
+            yield bloque[texto], _normalizar_categoria(bloque[sentimiento], ALIAS_SENTIMIENTO)
+
+
+def _dir_parquet(ruta):
+    ruta = os.path.abspath(ruta)
+    clave = hashlib.sha1(ruta.encode('utf-8')).hexdigest()[:12]
+    nombre = os.path.splitext(os.path.basename(ruta))[0]
+    return os.path.join(DIR_CACHE, 'parquet', f"{nombre}-{clave}")
+
+
+def _firma(ruta):
+    info = os.stat(ruta)
+    return {'mtime_ns': info.st_mtime_ns, 'tamano': info.st_size}
+
+
+def convertir_a_parquet(ruta, tamano_bloque=TAMANO_BLOQUE):
+    """
+    Escribe la exportación como Parquet particionado por mes y plataforma.
+    Regresa el directorio del dataset. Si ya existe una conversión del mismo
+    archivo (misma fecha de modificación y tamaño) se reutiliza.
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    destino = _dir_parquet(ruta)
+    manifiesto = os.path.join(destino, '_origen.json')
+    firma = _firma(ruta)
+    if os.path.exists(manifiesto):
+        with open(manifiesto, encoding='utf-8') as f:
+            if json.load(f) == firma:
+                return destino
+
+    shutil.rmtree(destino, ignore_errors=True)
+    os.makedirs(destino)
+    for i, bloque in enumerate(leer_export(ruta, tamano_bloque)):
+        bloque['mes'] = bloque['fecha_dt'].dt.strftime('%Y-%m')
+        bloque['menciones'] = bloque['menciones'].astype(np.int64)
+        tabla = pa.Table.from_pandas(bloque, preserve_index=False)
+        pq.write_to_dataset(tabla, destino, partition_cols=['mes', 'plataforma'], basename_template=f"bloque-{i:05d}-{{i}}.parquet")
+
+    # El manifiesto se escribe al final: una conversión interrumpida se rehace completa
+    with open(manifiesto, 'w', encoding='utf-8') as f:
+        json.dump(firma, f)
+    return destino
+
+
+def _ordenar_categorias(serie, base):
+    # Respeta el orden de los catálogos conocidos y añade al final los valores nuevos
+    valores = serie.astype('string').unique()
+    extra = sorted(v for v in valores if v not in base)
+    return pd.Categorical(serie.astype('string'), categories=[v for v in base if v in set(valores)] + extra)
+
+
+@lru_cache(maxsize=8)
+def _cargar_parquet(ruta, mtime_ns, tamano):
+    # La firma (mtime, tamaño) forma parte de la llave: un archivo modificado se vuelve a leer
+    destino = convertir_a_parquet(ruta)
+    crudo = pd.read_parquet(destino, columns=['fecha_dt', 'plataforma', 'sentimiento', 'tema', 'menciones'])
+
+    # Los bloques se agregaron por separado: se vuelve a agregar el total
+    crudo['plataforma'] = crudo['plataforma'].astype('string')
+    df = crudo.groupby(['fecha_dt', 'plataforma', 'sentimiento', 'tema'], observed=True)['menciones'].sum().reset_index()
+    df = df[df['menciones'] > 0].sort_values(['fecha_dt', 'plataforma', 'sentimiento', 'tema'], ignore_index=True)
+
+    df['plataforma'] = _ordenar_categorias(df['plataforma'], PLATAFORMAS)
+    df['sentimiento'] = _ordenar_categorias(df['sentimiento'], SENTIMIENTOS)
+    df['tema'] = _ordenar_categorias(df['tema'], TEMAS)
+    df['fecha'] = pd.Categorical(df['fecha_dt'].dt.strftime('%Y-%m-%d'))
+    df['menciones'] = df['menciones'].astype(np.int32)
+    return df[COLUMNAS]
+
+
+def cargar_export(ruta):
+    """
+    Carga una exportación normalizada al esquema del dashboard.
+    La primera vez convierte a Parquet; después lee directo del Parquet y,
+    dentro del mismo proceso, reutiliza el resultado mientras el archivo no cambie.
+    """
+    firma = _firma(ruta)
+    return _cargar_parquet(os.path.abspath(ruta), firma['mtime_ns'], firma['tamano'])
@@ -0,0 +1,137 @@
+"""
+Motor de KPIs del dashboard.
+Calcula todas las métricas de un periodo y de su periodo de comparación en una
+sola pasada vectorizada sobre el cubo de agregados, y memoiza el resultado por
+versión del dataset y rango de fechas.
+"""
+
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+MAX_MEMO = 256
+
+MESES = ['enero', 'febrero', 'marzo', 'abril', 'mayo', 'junio', 'julio',
+         'agosto', 'septiembre', 'octubre', 'noviembre', 'diciembre']
+
+_memo = OrderedDict()
+_memo_lock = threading.Lock()
+
+
+def _porcentaje(parte, total):
+    return np.divide(parte * 100.0, total, out=np.zeros_like(parte, dtype=float), where=total > 0)
+
+
+def _variacion(actual, anterior):
+    # Variación porcentual; None cuando el periodo anterior no tiene menciones
+    if anterior is None or anterior == 0:
+        return None
+    return (actual / anterior - 1) * 100
+
+
+def _metricas_periodos(cubo, rangos):
+    # (n, P, S, T) -> métricas de los n periodos con operaciones sobre ejes
+    matrices = cubo.matrices(rangos)
+    sentimientos = cubo.categorias['sentimiento']
+    por_sentimiento = matrices.sum(axis=(1, 3))
+    por_plataforma = matrices.sum(axis=(2, 3))
+    por_tema = matrices.sum(axis=(1, 2))
+    totales = por_sentimiento.sum(axis=1)
+    pct_sentimiento = _porcentaje(por_sentimiento, totales[:, None])
+
+    def columna(nombre):
+        return sentimientos.index(nombre) if nombre in sentimientos else None
+
+    i_pos, i_neu, i_neg = columna('Positivo'), columna('Neutral'), columna('Negativo')
+    periodos = []
+    for n in range(len(rangos)):
+        pct = {s: float(pct_sentimiento[n, i]) for i, s in enumerate(sentimientos)}
+        positivo = int(por_sentimiento[n, i_pos]) if i_pos is not None else 0
+        negativo = int(por_sentimiento[n, i_neg]) if i_neg is not None else 0
+        periodos.append({
+            'total': int(totales[n]),
+            'positivo': positivo,
+            'neutral': int(por_sentimiento[n, i_neu]) if i_neu is not None else 0,
+            'negativo': negativo,
+            'pct_positivo': pct.get('Positivo', 0.0),
+            'pct_neutral': pct.get('Neutral', 0.0),
+            'pct_negativo': pct.get('Negativo', 0.0),
+            'sentimiento_neto': pct.get('Positivo', 0.0) - pct.get('Negativo', 0.0),
+            'por_plataforma': dict(zip(cubo.categorias['plataforma'], por_plataforma[n].tolist())),
+            'por_tema': dict(zip(cubo.categorias['tema'], por_tema[n].tolist())),
+        })
+    return periodos
+
+
+def calcular_kpis(cubo, inicio=None, fin=None, comparar=True):
+    """
+    KPIs del periodo [inicio, fin] (por defecto, todo el dataset).
+    Con `comparar=True` también se calculan los del periodo inmediatamente anterior
+    de la misma duración y su variación. El resultado se memoiza por (versión del cubo, rango).
+    """
+    llave = (cubo.clave, None if inicio is None else str(inicio), None if fin is None else str(fin), comparar)
+    with _memo_lock:
+        if llave in _memo:
+            _memo.move_to_end(llave)
+            return _memo[llave]
+
+    fin_ts = cubo.fecha_fin if fin is None else pd.Timestamp(fin).normalize()
+    inicio_ts = cubo.fecha_inicio if inicio is None else pd.Timestamp(inicio).normalize()
+    dias = (fin_ts - inicio_ts).days + 1 if fin_ts is not None else 0
+
+    rangos = [(inicio_ts, fin_ts)]
+    if comparar and dias > 0:
+        fin_anterior = inicio_ts - pd.Timedelta(days=1)
+        rangos.append((fin_anterior - pd.Timedelta(days=dias - 1), fin_anterior))
+    periodos = _metricas_periodos(cubo, rangos)
+
+    actual = periodos[0]
+    anterior = periodos[1] if len(periodos) > 1 and periodos[1]['total'] > 0 else None
+    kpis = {
+        'inicio': inicio_ts,
+        'fin': fin_ts,
+        'dias': dias,
+        'actual': actual,
+        'anterior': anterior,
+        'variacion': {
+            'total': _variacion(actual['total'], anterior and anterior['total']),
+            'positivo': _variacion(actual['positivo'], anterior and anterior['positivo']),
+            'negativo': _variacion(actual['negativo'], anterior and anterior['negativo']),
+            'sentimiento_neto': None if anterior is None else actual['sentimiento_neto'] - anterior['sentimiento_neto'],
+            'por_plataforma': {p: _variacion(v, anterior and anterior['por_plataforma'][p])
+                               for p, v in actual['por_plataforma'].items()},
+        },
+    }
+
+    with _memo_lock:
+        _memo[llave] = kpis
+        while len(_memo) > MAX_MEMO:
+            _memo.popitem(last=False)
+    return kpis
+
+
+def formatear_numero(valor):
+    """165990 -> '165.99K', 2400000 -> '2.40M'."""
+    if valor is None:
+        return "—"
+    if abs(valor) >= 1_000_000:
+        return f"{valor / 1_000_000:.2f}M"
+    if abs(valor) >= 1_000:
+        return f"{valor / 1_000:.2f}K"
+    return f"{valor:,.0f}"
+
+
+def formatear_variacion(valor, sufijo="%"):
+    if valor is None:
+        return "—"
+    return f"{valor:+.0f}{sufijo}"
+
+
+def formatear_fecha(fecha, con_anio=False):
+    """Fecha en español: '23 de marzo' o '23 de marzo de 2025'."""
+    if fecha is None:
+        return ""
+    texto = f"{fecha.day} de {MESES[fecha.month - 1]}"
+    return f"{texto} de {fecha.year}" if con_anio else texto
@@ -0,0 +1,241 @@
+"""
+Caché de miniaturas para las imágenes de los artículos de noticias.
+Cada imagen remota se descarga una sola vez (a lo más unas cuantas a la vez),
+se reduce al ancho del layout y se guarda en disco direccionada por contenido
+(`<sha1>.webp`) con expulsión LRU. Si una imagen no está lista a tiempo se
+regresa None y la página muestra el placeholder "EPIC News".
+"""
+
+import hashlib
+import io
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+
+from epiclab.assets import CALIDAD_WEBP
+from epiclab.ingesta import DIR_CACHE
+
+ANCHO_MINIATURA = 150
+DIR_MINIATURAS = os.path.join(DIR_CACHE, "miniaturas")
+MAX_BYTES_DISCO = int(os.environ.get("EPICLAB_MINIATURAS_MAX_MB", 64)) * 1024 ** 2
+DESCARGAS_SIMULTANEAS = 4
+MAX_BYTES_ORIGEN = 15 * 1024 ** 2  # imágenes más grandes no se descargan
+TIMEOUT_DESCARGA = (2, 4)  # conexión, lectura
+ESPERA_RENDER = 1.5  # segundos que un render espera por las miniaturas que faltan
+REINTENTO_FALLIDAS = 600  # segundos antes de volver a intentar una URL que falló
+
+
+class CacheMiniaturas:
+    """
+    `obtener(urls)` regresa {url: bytes de la miniatura o None}.
+    Las descargas pendientes siguen en segundo plano y quedan listas para el siguiente render.
+    """
+
+    def __init__(self, directorio=DIR_MINIATURAS, ancho=ANCHO_MINIATURA, max_bytes=MAX_BYTES_DISCO,
+                 hilos=DESCARGAS_SIMULTANEAS, timeout=TIMEOUT_DESCARGA):
+        import requests
+
+        self.directorio = directorio
+        self.ancho = ancho
+        self.max_bytes = max_bytes
+        self.timeout = timeout
+        self._sesion = requests.Session()
+        self._sesion.headers["User-Agent"] = "EPICLab-miniaturas/1.0"
+        # El pool limita cuántas imágenes se descargan a la vez
+        self._pool = ThreadPoolExecutor(max_workers=hilos, thread_name_prefix="miniaturas")
+        self._lock = threading.Lock()
+        self._lock_indice = threading.Lock()
+        self._indice = {}  # url -> sha1 del contenido
+        self._en_curso = {}  # url -> Future
+        self._fallidas = {}  # url -> momento del fallo
+        self._memoria = {}  # sha1 -> bytes (las miniaturas pesan pocos KB)
+        self._usos = {}  # sha1 -> última vez que se marcó su uso en disco
+        self._estadisticas = {"memoria": 0, "disco": 0, "descargas": 0, "fallos": 0, "placeholder": 0}
+        self._cargar_indice()
+
+    # Índice url -> contenido, persistido junto a las miniaturas
+    def _ruta_indice(self):
+        return os.path.join(self.directorio, "indice.json")
+
+    def _ruta(self, huella):
+        return os.path.join(self.directorio, f"{huella}.webp")
+
+    def _cargar_indice(self):
+        try:
+            with open(self._ruta_indice(), encoding="utf-8") as f:
+                self._indice = json.load(f)
+        except (OSError, ValueError):
+            self._indice = {}
+
+    def _guardar_indice(self):
+        # Un solo escritor a la vez: así la última copia en disco es también la más reciente
+        with self._lock_indice:
+            with self._lock:
+                indice = dict(self._indice)
+            try:
+                temporal = f"{self._ruta_indice()}.tmp"
+                with open(temporal, "w", encoding="utf-8") as f:
+                    json.dump(indice, f)
+                os.replace(temporal, self._ruta_indice())
+            except OSError:
+                pass
+
+    def _marcar_uso(self, huella):
+        # La fecha de modificación del archivo marca su último uso (para la expulsión LRU);
+        # se actualiza a lo más una vez por minuto por miniatura
+        ahora = time.time()
+        with self._lock:
+            if ahora - self._usos.get(huella, 0) < 60:
+                return
+            self._usos[huella] = ahora
+        try:
+            os.utime(self._ruta(huella))
+        except OSError:
+            pass
+
+    def _leer(self, url):
+        with self._lock:
+            huella = self._indice.get(url)
+            datos = self._memoria.get(huella) if huella else None
+            if datos is not None:
+                self._estadisticas["memoria"] += 1
+        if huella is None:
+            return None
+        if datos is None:
+            try:
+                with open(self._ruta(huella), "rb") as f:
+                    datos = f.read()
+            except OSError:
+                with self._lock:
+                    self._indice.pop(url, None)
+                return None
+            with self._lock:
+                self._memoria[huella] = datos
+                self._estadisticas["disco"] += 1
+        self._marcar_uso(huella)
+        return datos
+
+    def _reducir(self, contenido):
+        from PIL import Image, features
+
+        with Image.open(io.BytesIO(contenido)) as imagen:
+            imagen.draft("RGB", (self.ancho * 2, self.ancho * 2))  # decodificación reducida de JPEG
+            imagen = imagen.convert("RGB")
+            if imagen.width > self.ancho:
+                imagen = imagen.resize((self.ancho, max(1, round(imagen.height * self.ancho / imagen.width))), Image.LANCZOS)
+            buffer = io.BytesIO()
+            if features.check("webp"):
+                imagen.save(buffer, format="WEBP", quality=CALIDAD_WEBP)
+            else:
+                imagen.save(buffer, format="PNG", optimize=True)
+        return buffer.getvalue()
+
+    def _descargar(self, url):
+        try:
+            with self._sesion.get(url, timeout=self.timeout, stream=True) as respuesta:
+                respuesta.raise_for_status()
+                partes, total = [], 0
+                for parte in respuesta.iter_content(64 * 1024):
+                    total += len(parte)
+                    if total > MAX_BYTES_ORIGEN:
+                        raise ValueError("imagen demasiado grande")
+                    partes.append(parte)
+            miniatura = self._reducir(b"".join(partes))
+        except Exception:  # red, HTTP o formato: se usa el placeholder
+            with self._lock:
+                self._fallidas[url] = time.time()
+                self._estadisticas["fallos"] += 1
+            return None
+
+        huella = hashlib.sha1(miniatura).hexdigest()
+        ruta = self._ruta(huella)
+        try:
+            os.makedirs(self.directorio, exist_ok=True)
+            if not os.path.exists(ruta):
+                temporal = f"{ruta}.{threading.get_ident()}.tmp"
+                with open(temporal, "wb") as f:
+                    f.write(miniatura)
+                os.replace(temporal, ruta)
+        except OSError:
+            pass
+        with self._lock:
+            self._indice[url] = huella
+            self._memoria[huella] = miniatura
+            self._estadisticas["descargas"] += 1
+        self._guardar_indice()
+        self._expulsar()
+        return miniatura
+
+    def _terminar(self, url, futuro):
+        with self._lock:
+            if self._en_curso.get(url) is futuro:
+                del self._en_curso[url]
+
+    def _expulsar(self):
+        # LRU por fecha de último uso hasta quedar bajo el límite de bytes
+        try:
+            archivos = [e for e in os.scandir(self.directorio) if e.name.endswith(".webp")]
+        except OSError:
+            return
+        total = sum(e.stat().st_size for e in archivos)
+        if total <= self.max_bytes:
+            return
+        expulsadas = set()
+        for entrada in sorted(archivos, key=lambda e: e.stat().st_mtime):
+            if total <= self.max_bytes:
+                break
+            total -= entrada.stat().st_size
+            try:
+                os.remove(entrada.path)
+            except OSError:
+                continue
+            expulsadas.add(entrada.name[:-len(".webp")])
+        with self._lock:
+            for url, huella in list(self._indice.items()):
+                if huella in expulsadas:
+                    del self._indice[url]
+            for huella in expulsadas:
+                self._memoria.pop(huella, None)
+        self._guardar_indice()
+
+    def obtener(self, urls, espera=ESPERA_RENDER):
+        """
+        Miniaturas de las URLs. Las que ya están en caché se regresan de inmediato;
+        las demás se descargan en paralelo (con el límite del pool) esperando como
+        máximo `espera` segundos en total. Las que no llegan a tiempo regresan None.
+        """
+        resultado, pendientes = {}, {}
+        ahora = time.time()
+        for url in dict.fromkeys(u for u in urls if u):
+            datos = self._leer(url)
+            if datos is not None:
+                resultado[url] = datos
+                continue
+            with self._lock:
+                if ahora - self._fallidas.get(url, 0) < REINTENTO_FALLIDAS:
+                    resultado[url] = None
+                    continue
+                futuro = self._en_curso.get(url)
+                if futuro is None:
+                    futuro = self._pool.submit(self._descargar, url)
+                    self._en_curso[url] = futuro
+                    futuro.add_done_callback(lambda f, url=url: self._terminar(url, f))
+            pendientes[url] = futuro
+
+        if pendientes:
+            wait(list(pendientes.values()), timeout=espera)
+        for url, futuro in pendientes.items():
+            resultado[url] = futuro.result() if futuro.done() else None
+        with self._lock:
+            self._estadisticas["placeholder"] += sum(1 for v in resultado.values() if v is None)
+        return resultado
+
+    def estadisticas(self):
+        with self._lock:
+            return dict(self._estadisticas, en_indice=len(self._indice), en_curso=len(self._en_curso))
+
+    def cerrar(self):
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        self._sesion.close()
@@ -0,0 +1,410 @@
+"""
+Cliente de NewsAPI para la página de Noticias.
+Reutiliza conexiones con una `requests.Session`, usa timeouts explícitos y
+guarda cada respuesta en un caché con TTL (en memoria y en disco). Cuando una
+entrada vence se sirve de inmediato la copia anterior y se refresca en segundo
+plano (stale-while-revalidate), así una API lenta no detiene el script.
+
+El agregador lanza varias consultas por tema en paralelo y combina los
+resultados en un almacén local de artículos sin duplicados, desde el que se
+dibuja la página.
+"""
+
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from epiclab.ingesta import DIR_CACHE
+
+NEWSAPI_URL = os.environ.get("EPICLAB_NEWSAPI_URL", "https://newsapi.org/v2/everything")
+NEWSAPI_KEY = os.environ.get("EPICLAB_NEWSAPI_KEY", "34ce1012f268483bb5f81ac477eb4791")
+NOTICIAS_TTL = int(os.environ.get("EPICLAB_NOTICIAS_TTL", 900))  # segundos
+NOTICIAS_HILOS = int(os.environ.get("EPICLAB_NOTICIAS_HILOS", 6))  # consultas simultáneas
+NOTICIAS_PAGINAS = int(os.environ.get("EPICLAB_NOTICIAS_PAGINAS", 1))  # páginas por consulta
+MAX_ARTICULOS = 1000
+DIAS_ARTICULOS = 30  # antigüedad máxima en el almacén
+REINTENTO_VACIO = 60  # segundos entre intentos mientras el almacén está vacío
+TIMEOUT_CONEXION = 3.05
+TIMEOUT_LECTURA = float(os.environ.get("EPICLAB_NEWSAPI_TIMEOUT", 5))
+DIR_NOTICIAS = os.path.join(DIR_CACHE, "noticias")
+
+# Búsqueda de la página de Noticias
+CONSULTA_EMPRENDIMIENTO = {
+    "q": "emprendimiento OR startups OR innovación OR emprendedor",
+    "language": "es",
+    "sortBy": "publishedAt",
+    "pageSize": 8,
+}
+
+# Temas que sigue el agregador (nombre -> búsqueda)
+CONSULTAS_TEMAS = {
+    "Emprendimiento": CONSULTA_EMPRENDIMIENTO,
+    "Fintech": {"q": "fintech OR \"tecnología financiera\"", "language": "es", "sortBy": "publishedAt", "pageSize": 20},
+    "MAD Fellows": {"q": "\"MAD Fellows\" OR \"EPIC Lab\" OR ITAM", "language": "es", "sortBy": "publishedAt", "pageSize": 20},
+    "Mujeres emprendedoras": {"q": "\"mujeres emprendedoras\" OR fundadoras OR \"emprendimiento femenino\"", "language": "es", "sortBy": "publishedAt", "pageSize": 20},
+    "Inversión": {"q": "\"capital de riesgo\" OR \"venture capital\" OR \"ronda de inversión\"", "language": "es", "sortBy": "publishedAt", "pageSize": 20},
+    "Inteligencia artificial": {"q": "\"inteligencia artificial\" AND (startup OR empresa)", "language": "es", "sortBy": "publishedAt", "pageSize": 20},
+    "Impacto social": {"q": "\"impacto social\" OR sostenibilidad OR \"economía social\"", "language": "es", "sortBy": "publishedAt", "pageSize": 20},
+    "Ecosistema México": {"q": "startups AND México", "language": "es", "sortBy": "publishedAt", "pageSize": 20},
+}
+
+PARAMETROS_RASTREO = frozenset({"fbclid", "gclid", "ref", "source"})  # nombres exactos
+PREFIJO_RASTREO = "utm_"
+
+
+def _llave(params):
+    # La llave no incluye la clave de la API
+    crudo = json.dumps(params, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha1(crudo.encode("utf-8")).hexdigest()
+
+
+class ClienteNoticias:
+    """
+    Cliente con caché para una API tipo NewsAPI `/v2/everything`.
+    `obtener(params)` regresa el JSON de la API o un dict con `error`.
+    """
+
+    def __init__(self, url=NEWSAPI_URL, api_key=NEWSAPI_KEY, ttl=NOTICIAS_TTL,
+                 timeout=(TIMEOUT_CONEXION, TIMEOUT_LECTURA), dir_cache=DIR_NOTICIAS, hilos=2):
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        self.url = url
+        self.api_key = api_key
+        self.ttl = ttl
+        self.timeout = timeout
+        self.dir_cache = dir_cache
+        self._sesion = requests.Session()
+        reintentos = Retry(total=2, connect=1, read=0, backoff_factor=0.3, status_forcelist=(502, 503, 504), allowed_methods=["GET"])
+        self._sesion.mount("https://", HTTPAdapter(pool_connections=2, pool_maxsize=max(hilos, NOTICIAS_HILOS), max_retries=reintentos))
+        self._sesion.mount("http://", HTTPAdapter(pool_connections=2, pool_maxsize=max(hilos, NOTICIAS_HILOS), max_retries=reintentos))
+        self._memoria = {}  # llave -> (guardado_en, datos)
+        self._refrescando = set()
+        self._lock = threading.Lock()
+        self._fondo = ThreadPoolExecutor(max_workers=hilos, thread_name_prefix="noticias")
+        self._estadisticas = {"frescas": 0, "vencidas": 0, "descargas": 0, "errores": 0}
+
+    # Caché en disco: un JSON por consulta, escrito de forma atómica
+    def _ruta(self, llave):
+        return os.path.join(self.dir_cache, f"{llave}.json")
+
+    def _leer_disco(self, llave):
+        try:
+            with open(self._ruta(llave), encoding="utf-8") as f:
+                entrada = json.load(f)
+            return entrada["guardado_en"], entrada["datos"]
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def _escribir_disco(self, llave, guardado_en, datos):
+        try:
+            os.makedirs(self.dir_cache, exist_ok=True)
+            temporal = f"{self._ruta(llave)}.{threading.get_ident()}.tmp"
+            with open(temporal, "w", encoding="utf-8") as f:
+                json.dump({"guardado_en": guardado_en, "datos": datos}, f, ensure_ascii=False)
+            os.replace(temporal, self._ruta(llave))
+        except OSError:
+            pass  # sin disco disponible el caché en memoria sigue funcionando
+
+    def _entrada(self, llave):
+        with self._lock:
+            entrada = self._memoria.get(llave)
+        if entrada is None:
+            entrada = self._leer_disco(llave)
+            if entrada is not None:
+                with self._lock:
+                    self._memoria.setdefault(llave, entrada)
+        return entrada
+
+    def _descargar(self, llave, params):
+        import requests
+
+        try:
+            respuesta = self._sesion.get(self.url, params=dict(params, apiKey=self.api_key), timeout=self.timeout)
+        except requests.RequestException as e:
+            self._contar("errores")
+            # Los mensajes de requests incluyen la URL completa: no se expone la clave
+            return {"error": str(e).replace(self.api_key, "***") if self.api_key else str(e)}
+        if respuesta.status_code != 200:
+            self._contar("errores")
+            return {"error": f"Error en la API: {respuesta.status_code}"}
+
+        try:
+            datos = respuesta.json()
+        except ValueError:
+            self._contar("errores")
+            return {"error": "Respuesta inválida de la API"}
+        guardado_en = time.time()
+        with self._lock:
+            self._memoria[llave] = (guardado_en, datos)
+        self._escribir_disco(llave, guardado_en, datos)
+        self._contar("descargas")
+        return datos
+
+    def _refrescar(self, llave, params):
+        try:
+            self._descargar(llave, params)
+        finally:
+            with self._lock:
+                self._refrescando.discard(llave)
+
+    def _contar(self, nombre):
+        with self._lock:
+            self._estadisticas[nombre] += 1
+
+    def obtener(self, params=None, forzar=False):
+        """
+        Noticias de la consulta. Vigentes -> desde el caché; vencidas -> desde el caché
+        y se programa un refresco en segundo plano; sin caché -> se descargan ahora.
+        Con `forzar` las vencidas también se descargan ahora (la copia vencida solo
+        se regresa si la descarga falla); es lo que usa el agregador, que ya corre en fondo.
+        """
+        params = dict(CONSULTA_EMPRENDIMIENTO if params is None else params)
+        llave = _llave(params)
+        entrada = self._entrada(llave)
+        if entrada is None:
+            return self._descargar(llave, params)
+
+        guardado_en, datos = entrada
+        if time.time() - guardado_en <= self.ttl:
+            self._contar("frescas")
+            return datos
+        if forzar:
+            descargados = self._descargar(llave, params)
+            return datos if "error" in descargados else descargados
+
+        self._contar("vencidas")
+        with self._lock:
+            pendiente = llave in self._refrescando
+            self._refrescando.add(llave)
+        if not pendiente:
+            self._fondo.submit(self._refrescar, llave, params)
+        return datos
+
+    def obtener_varias(self, consultas, paginas=1, hilos=NOTICIAS_HILOS, forzar=False):
+        """
+        Lanza en paralelo las consultas {nombre: params} (y sus páginas) con un máximo
+        de `hilos` peticiones simultáneas. Regresa {(nombre, página): respuesta}.
+        `forzar` se pasa a `obtener`.
+        """
+        tareas = [(nombre, pagina, dict(params, page=pagina) if pagina > 1 else params)
+                  for nombre, params in consultas.items() for pagina in range(1, paginas + 1)]
+        if not tareas:
+            return {}
+        with ThreadPoolExecutor(max_workers=min(hilos, len(tareas)), thread_name_prefix="noticias-consulta") as grupo:
+            futuros = {(nombre, pagina): grupo.submit(self.obtener, params, forzar) for nombre, pagina, params in tareas}
+            return {llave: futuro.result() for llave, futuro in futuros.items()}
+
+    def estadisticas(self):
+        with self._lock:
+            return dict(self._estadisticas, en_memoria=len(self._memoria), refrescando=len(self._refrescando))
+
+    def cerrar(self):
+        self._fondo.shutdown(wait=False)
+        self._sesion.close()
+
+
+def normalizar_url(url):
+    """URL canónica para detectar duplicados: sin fragmento, parámetros de rastreo ni '/' final."""
+    partes = urlsplit((url or "").strip())
+    consulta = [(k, v) for k, v in parse_qsl(partes.query)
+                if k.lower() not in PARAMETROS_RASTREO and not k.lower().startswith(PREFIJO_RASTREO)]
+    host = partes.netloc.lower()
+    host = host[4:] if host.startswith("www.") else host
+    return urlunsplit(("", host, partes.path.rstrip("/"), urlencode(consulta), ""))
+
+
+def huella_titulo(titulo):
+    """Hash del título normalizado (minúsculas, solo letras y números)."""
+    limpio = " ".join(re.findall(r"\w+", (titulo or "").lower()))
+    return hashlib.sha1(limpio.encode("utf-8")).hexdigest()[:16] if limpio else None
+
+
+def _fecha_articulo(articulo):
+    try:
+        fecha = datetime.fromisoformat(articulo.get("publishedAt", "").replace("Z", "+00:00"))
+    except (TypeError, ValueError):
+        return None
+    # Sin zona horaria se toma como UTC, para poder compararla con el límite
+    return fecha if fecha.tzinfo else fecha.replace(tzinfo=timezone.utc)
+
+
+class AlmacenArticulos:
+    """
+    Almacén local de artículos sin duplicados, con índices por URL canónica y por
+    hash del título. Conserva los MAX_ARTICULOS más recientes de los últimos
+    DIAS_ARTICULOS días y se guarda en disco.
+    """
+
+    def __init__(self, ruta=None, max_articulos=MAX_ARTICULOS, dias=DIAS_ARTICULOS):
+        self.ruta = ruta
+        self.max_articulos = max_articulos
+        self.dias = dias
+        self._articulos = OrderedDict()  # id -> artículo (con la lista 'temas')
+        self._por_url = {}
+        self._por_titulo = {}
+        self._lock = threading.Lock()
+        self.version = 0
+        if ruta:
+            self._cargar()
+
+    def __len__(self):
+        return len(self._articulos)
+
+    def _indexar(self, id_articulo, articulo):
+        url = normalizar_url(articulo.get("url"))
+        titulo = huella_titulo(articulo.get("title"))
+        if url:
+            self._por_url[url] = id_articulo
+        if titulo:
+            self._por_titulo[titulo] = id_articulo
+
+    def _duplicado(self, articulo):
+        url = normalizar_url(articulo.get("url"))
+        if url and url in self._por_url:
+            return self._por_url[url]
+        titulo = huella_titulo(articulo.get("title"))
+        return self._por_titulo.get(titulo) if titulo else None
+
+    def agregar(self, articulos, tema=None):
+        """Agrega artículos nuevos; los repetidos solo suman el tema. Regresa cuántos fueron nuevos."""
+        nuevos = 0
+        with self._lock:
+            for articulo in articulos:
+                if not articulo.get("title") or articulo.get("title") == "[Removed]":
+                    continue
+                existente = self._duplicado(articulo)
+                if existente is not None:
+                    temas = self._articulos[existente]["temas"]
+                    if tema and tema not in temas:
+                        temas.append(tema)
+                    continue
+                id_articulo = normalizar_url(articulo.get("url")) or huella_titulo(articulo.get("title"))
+                if id_articulo is None:
+                    continue
+                self._articulos[id_articulo] = dict(articulo, temas=[tema] if tema else [])
+                self._indexar(id_articulo, articulo)
+                nuevos += 1
+            if nuevos:
+                self._recortar()
+                self.version += 1
+        return nuevos
+
+    def _recortar(self):
+        limite = datetime.now(timezone.utc) - timedelta(days=self.dias)
+        vigentes = [(id_articulo, a) for id_articulo, a in self._articulos.items()
+                    if (_fecha_articulo(a) or limite) >= limite]
+        vigentes.sort(key=lambda par: par[1].get("publishedAt") or "", reverse=True)
+        vigentes = vigentes[:self.max_articulos]
+        if len(vigentes) == len(self._articulos):
+            self._articulos = OrderedDict(vigentes)
+            return
+        self._articulos = OrderedDict(vigentes)
+        self._por_url, self._por_titulo = {}, {}
+        for id_articulo, articulo in self._articulos.items():
+            self._indexar(id_articulo, articulo)
+
+    def recientes(self, cantidad=8, tema=None):
+        """Los artículos más recientes (opcionalmente de un tema)."""
+        with self._lock:
+            seleccion = []
+            for articulo in self._articulos.values():
+                if tema is None or tema in articulo["temas"]:
+                    seleccion.append(articulo)
+                    if len(seleccion) >= cantidad:
+                        break
+            return seleccion
+
+    def _cargar(self):
+        try:
+            with open(self.ruta, encoding="utf-8") as f:
+                articulos = json.load(f)
+        except (OSError, ValueError):
+            return
+        with self._lock:
+            for articulo in articulos:
+                id_articulo = normalizar_url(articulo.get("url")) or huella_titulo(articulo.get("title"))
+                if id_articulo is None or self._duplicado(articulo) is not None:
+                    continue
+                self._articulos[id_articulo] = dict(articulo, temas=list(articulo.get("temas") or []))
+                self._indexar(id_articulo, articulo)
+            self._recortar()
+
+    def guardar(self):
+        if not self.ruta:
+            return
+        with self._lock:
+            articulos = list(self._articulos.values())
+        try:
+            os.makedirs(os.path.dirname(self.ruta), exist_ok=True)
+            temporal = f"{self.ruta}.{threading.get_ident()}.tmp"
+            with open(temporal, "w", encoding="utf-8") as f:
+                json.dump(articulos, f, ensure_ascii=False)
+            os.replace(temporal, self.ruta)
+        except OSError:
+            pass
+
+
+class AgregadorNoticias:
+    """
+    Sigue varias consultas por tema. `actualizar()` las lanza en paralelo y combina
+    los resultados en el almacén; la página lee de `almacen.recientes()` sin esperar a la red.
+    """
+
+    def __init__(self, cliente, consultas=None, almacen=None, paginas=NOTICIAS_PAGINAS, intervalo=None):
+        self.cliente = cliente
+        self.consultas = dict(CONSULTAS_TEMAS if consultas is None else consultas)
+        self.almacen = almacen if almacen is not None else AlmacenArticulos(os.path.join(cliente.dir_cache, "articulos.json"))
+        self.paginas = paginas
+        self.intervalo = cliente.ttl if intervalo is None else intervalo
+        self.ultimo_error = None
+        self._actualizado_en = 0.0
+        self._actualizando = threading.Lock()
+        self._fondo = ThreadPoolExecutor(max_workers=1, thread_name_prefix="noticias-agregador")
+
+    def actualizar(self):
+        """Consulta todos los temas en paralelo. Regresa el número de artículos nuevos."""
+        with self._actualizando:
+            # Forzado: con el intervalo igual al TTL las consultas ya vencieron y, sin forzar,
+            # el cliente regresaría la copia vencida y lo nuevo llegaría hasta el siguiente intervalo
+            respuestas = self.cliente.obtener_varias(self.consultas, self.paginas, forzar=True)
+            nuevos, errores = 0, []
+            for (tema, _), respuesta in respuestas.items():
+                if "error" in respuesta:
+                    errores.append(respuesta["error"])
+                else:
+                    nuevos += self.almacen.agregar(respuesta.get("articles", []), tema)
+            self.ultimo_error = errores[0] if errores and len(errores) == len(respuestas) else None
+            self._actualizado_en = time.time()
+            if nuevos:
+                self.almacen.guardar()
+            return nuevos
+
+    def _actualizar_en_fondo(self):
+        try:
+            self.actualizar()
+        except Exception as e:  # un refresco fallido no debe tumbar el hilo
+            self.ultimo_error = str(e)
+
+    def articulos(self, cantidad=8, tema=None):
+        """
+        Artículos para la página. Con el almacén vacío se espera una actualización
+        (en paralelo); si no, se leen del almacén y, si ya pasó el intervalo, se
+        actualiza en segundo plano.
+        """
+        if len(self.almacen) == 0:
+            # Sin artículos no hay qué mostrar: se espera, reintentando cada REINTENTO_VACIO segundos
+            if time.time() - self._actualizado_en > min(self.intervalo, REINTENTO_VACIO):
+                self.actualizar()
+        elif time.time() - self._actualizado_en > self.intervalo and not self._actualizando.locked():
+            self._actualizado_en = time.time()  # evita encolar varios refrescos
+            self._fondo.submit(self._actualizar_en_fondo)
+        return self.almacen.recientes(cantidad, tema)
@@ -0,0 +1,153 @@
+"""
+Motor incremental de frecuencias de términos para las nubes de palabras.
+Tokeniza menciones por lotes, separa los conteos por sentimiento en arreglos
+compactos y solo vuelve a generar la nube (WordCloud.generate es costoso) cuando
+el top-K de términos cambia de forma apreciable.
+"""
+
+import re
+import threading
+
+import numpy as np
+import pandas as pd
+
+from epiclab.graficas import nube_palabras_png
+
+TOP_K = 40
+UMBRAL_CAMBIO = 0.15  # distancia mínima entre distribuciones top-K para regenerar la nube
+LONGITUD_MINIMA = 3
+
+PATRON_TOKEN = re.compile(r"[#@]?[^\W\d_]+(?:[-'][^\W\d_]+)*", re.UNICODE)
+
+STOPWORDS_ES = frozenset("""
+a al algo algunas algunos ante antes aquí así aun aunque bajo bien cada casi como con contra cual cuales cuando
+de del desde donde dos el ella ellas ellos en entre era eran es esa esas ese eso esos esta estaba estado estamos
+están estar este esto estos estoy fue fueron gran ha había han hasta hay la las le les lo los más me mi mis mucho
+muy nada ni no nos nosotros nuestra nuestro o otra otro otros para pero poco por porque que quien se sea ser si
+sin sobre son su sus también tan tanto te tiene tienen todo todos tu tus un una uno unos usted y ya yo the and for
+with this that from you your are was our http https www com rt via
+""".split())
+
+
+def tokenizar(textos, stopwords=STOPWORDS_ES, longitud_minima=LONGITUD_MINIMA):
+    """
+    Tokens de una serie de textos en una sola pasada vectorizada.
+    Regresa una Serie con el índice del texto original repetido por cada token.
+    """
+    serie = pd.Series(textos, dtype='string').fillna('')
+    tokens = serie.str.lower().str.findall(PATRON_TOKEN).explode().dropna()
+    tokens = tokens[(tokens.str.len() >= longitud_minima) & ~tokens.isin(stopwords)]
+    return tokens
+
+
+def _distancia(a, b):
+    # 1 - similitud de Jaccard ponderada entre dos distribuciones normalizadas
+    if not a or not b:
+        return 1.0
+    total_a, total_b = sum(a.values()), sum(b.values())
+    terminos = a.keys() | b.keys()
+    minimo = sum(min(a.get(t, 0) / total_a, b.get(t, 0) / total_b) for t in terminos)
+    maximo = sum(max(a.get(t, 0) / total_a, b.get(t, 0) / total_b) for t in terminos)
+    return 1.0 - minimo / maximo if maximo else 0.0
+
+
+class MotorTerminos:
+    """
+    Conteos de términos por sentimiento, actualizables por lotes.
+    Los términos se guardan en un vocabulario común (término -> id) y los conteos
+    de cada sentimiento en un arreglo int64 que crece conforme aparecen términos nuevos.
+    """
+
+    def __init__(self, top_k=TOP_K, umbral_cambio=UMBRAL_CAMBIO):
+        self.top_k = top_k
+        self.umbral_cambio = umbral_cambio
+        self._vocabulario = {}
+        self._terminos = []
+        self._conteos = {}
+        self._publicado = {}  # sentimiento -> frecuencias con las que se generó la última nube
+        self._lock = threading.Lock()
+        self.version = 0
+
+    def _ids(self, terminos):
+        ids = np.empty(len(terminos), dtype=np.intp)
+        for i, termino in enumerate(terminos):
+            id_termino = self._vocabulario.get(termino)
+            if id_termino is None:
+                id_termino = len(self._terminos)
+                self._vocabulario[termino] = id_termino
+                self._terminos.append(termino)
+            ids[i] = id_termino
+        return ids
+
+    def _sumar(self, sentimiento, ids, cantidades):
+        conteos = self._conteos.get(sentimiento)
+        tamano = len(self._terminos)
+        if conteos is None or len(conteos) < tamano:
+            nuevos = np.zeros(max(tamano, 2 * (len(conteos) if conteos is not None else 64)), dtype=np.int64)
+            if conteos is not None:
+                nuevos[:len(conteos)] = conteos
+            conteos = nuevos
+            self._conteos[sentimiento] = conteos
+        np.add.at(conteos, ids, cantidades)
+
+    def agregar_frecuencias(self, sentimiento, frecuencias):
+        """Suma un dict {término: frecuencia} (por ejemplo, los términos base)."""
+        if not frecuencias:
+            return
+        with self._lock:
+            ids = self._ids(list(frecuencias))
+            self._sumar(sentimiento, ids, np.fromiter(frecuencias.values(), dtype=np.int64, count=len(frecuencias)))
+            self.version += 1
+
+    def agregar(self, textos, sentimientos):
+        """Tokeniza un lote de menciones y suma sus términos al sentimiento de cada una."""
+        # Índices posicionales en ambos lados: los bloques de una exportación siguen
+        # numerando sus filas (el segundo empieza en tamano_bloque, no en 0)
+        tokens = tokenizar(pd.Series(textos).reset_index(drop=True))
+        if tokens.empty:
+            return
+        etiquetas = pd.Series(sentimientos).reset_index(drop=True)
+        conteo = pd.DataFrame({
+            'sentimiento': etiquetas.iloc[tokens.index.to_numpy()].to_numpy(),
+            'termino': tokens.to_numpy(),
+        }).value_counts()
+        with self._lock:
+            for sentimiento, grupo in conteo.groupby(level='sentimiento'):
+                terminos = grupo.index.get_level_values('termino')
+                self._sumar(sentimiento, self._ids(terminos), grupo.to_numpy())
+            self.version += 1
+
+    def top(self, sentimiento, k=None):
+        """Los k términos más frecuentes del sentimiento como {término: frecuencia}."""
+        k = k or self.top_k
+        with self._lock:
+            conteos = self._conteos.get(sentimiento)
+            if conteos is None:
+                return {}
+            conteos = conteos[:len(self._terminos)]
+            k = min(k, int((conteos > 0).sum()))
+            if k == 0:
+                return {}
+            indices = np.argpartition(-conteos, k - 1)[:k]
+            indices = indices[np.argsort(-conteos[indices], kind='stable')]
+            return {self._terminos[i]: int(conteos[i]) for i in indices}
+
+    def frecuencias_nube(self, sentimiento):
+        """
+        Frecuencias a dibujar. Si el top-K actual difiere poco del que se dibujó la
+        última vez se regresan las mismas frecuencias, así la nube en caché sigue vigente.
+        """
+        actual = self.top(sentimiento)
+        with self._lock:
+            publicado = self._publicado.get(sentimiento)
+            if publicado is not None and _distancia(actual, publicado) < self.umbral_cambio:
+                return publicado
+            self._publicado[sentimiento] = actual
+            return actual
+
+    def nube_png(self, sentimiento, colormap='Greens'):
+        """PNG de la nube del sentimiento (el layout se reutiliza mientras no cambie el top-K)."""
+        frecuencias = self.frecuencias_nube(sentimiento)
+        if not frecuencias:
+            return None
+        return nube_palabras_png(frecuencias, colormap=colormap)
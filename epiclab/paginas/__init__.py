@@ -0,0 +1,25 @@
+"""
+Páginas de la aplicación, un módulo por página.
+Cada módulo se importa hasta que su página se abre por primera vez, así que el
+arranque y las páginas ligeras no pagan por las dependencias de las demás.
+"""
+
+import importlib
+
+# Página del menú -> (módulo, función que la dibuja)
+PAGINAS = {
+    "Dashboard": ("dashboard", "render_dashboard"),
+    "Epic Lab Analytics": ("analytics", "render_analytics"),
+    "Contenido": ("contenido", "render_content"),
+    "Predicciones": ("predicciones", "render_predictions"),
+    "Noticias": ("noticias", "render_noticias"),
+    "Asistente": ("asistente", "render_assistant"),
+    "Instrucciones": ("instrucciones", "render_instrucciones"),
+    "Configuración": ("configuracion", "render_settings"),
+}
+
+
+def cargar_pagina(nombre):
+    """Función que dibuja la página `nombre`; importa su módulo la primera vez."""
+    modulo, funcion = PAGINAS[nombre]
+    return getattr(importlib.import_module(f"{__name__}.{modulo}"), funcion)
@@ -0,0 +1,193 @@
+"""
+Página Epic Lab Analytics: menciones, sentimiento y temas de la conversación digital.
+"""
+
+from datetime import timedelta
+
+import streamlit as st
+
+from epiclab.graficas import grafica_plataforma_sentimiento, grafica_sentimiento_diario, grafica_tema_sentimiento
+from epiclab.kpis import calcular_kpis, formatear_fecha, formatear_numero, formatear_variacion
+from epiclab.paginas.componentes import mostrar_asset
+from epiclab.paginas.tema import EPIC_COLORS
+
+
+# Función para Analytics
+def render_analytics(df, cubo):
+    st.markdown("""
+    <div class="epic-header">
+        <h1 class="epic-title">Analytics del EPIC Lab</h1>
+        <p class="epic-subtitle">Análisis detallado del impacto y alcance digital</p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # SECCIÓN 1: CRECIMIENTO EN MÉTRICAS
+    st.markdown("### Crecimiento en Menciones y Sentimiento")
+    
+    # Ventana de comparación: últimos N días contra los N días anteriores
+    dias_disponibles = len(cubo.fechas)
+    if dias_disponibles == 0:
+        st.info("Aún no hay menciones para analizar.")
+        return
+    ventanas = [v for v in (7, 14, 30, 90, 180) if 2 * v <= dias_disponibles] or [max(1, dias_disponibles // 2)]
+    ventana = st.selectbox(
+        "Ventana de comparación (días):",
+        ventanas,
+        index=len(ventanas) - 1,
+        key="ventana_kpis"
+    )
+    
+    inicio = cubo.fecha_fin - timedelta(days=ventana - 1)
+    kpis = calcular_kpis(cubo, inicio=inicio, fin=cubo.fecha_fin)
+    actual, anterior, variacion = kpis['actual'], kpis['anterior'] or {}, kpis['variacion']
+    twitter_actual = actual['por_plataforma'].get('Twitter/X', 0)
+    twitter_anterior = anterior.get('por_plataforma', {}).get('Twitter/X')
+    
+    st.markdown(f"<p class='epic-periodo'>Del {formatear_fecha(kpis['inicio'], True)} al {formatear_fecha(kpis['fin'], True)}, comparado con los {ventana} días anteriores</p>", unsafe_allow_html=True)
+    
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        st.markdown(f"""
+        <div class="epic-metric">
+            <div class="epic-metric-value">{formatear_variacion(variacion['total'])}</div>
+            <div class="epic-metric-label">Aumento en Menciones</div>
+            <div class="epic-metric-detalle">(De {formatear_numero(anterior.get('total'))} a {formatear_numero(actual['total'])})</div>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col2:
+        st.markdown(f"""
+        <div class="epic-metric">
+            <div class="epic-metric-value">{formatear_variacion(variacion['positivo'])}</div>
+            <div class="epic-metric-label">Crecimiento en Menciones Positivas</div>
+            <div class="epic-metric-detalle">(De {formatear_numero(anterior.get('positivo'))} a {formatear_numero(actual['positivo'])})</div>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col3:
+        st.markdown(f"""
+        <div class="epic-metric">
+            <div class="epic-metric-value">{formatear_variacion(variacion['sentimiento_neto'], ' pts')}</div>
+            <div class="epic-metric-label">Cambio en Sentimiento Neto</div>
+            <div class="epic-metric-detalle">(De {anterior.get('sentimiento_neto', 0):.1f}% a {actual['sentimiento_neto']:.1f}%)</div>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col4:
+        st.markdown(f"""
+        <div class="epic-metric">
+            <div class="epic-metric-value">{formatear_variacion(variacion['por_plataforma'].get('Twitter/X'))}</div>
+            <div class="epic-metric-label">Cambio en Menciones Twitter</div>
+            <div class="epic-metric-detalle">(De {formatear_numero(twitter_anterior)} a {formatear_numero(twitter_actual)})</div>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    # Recomendación para crecimiento
+    st.markdown('<div class="epic-insight">', unsafe_allow_html=True)
+    st.markdown(f"""
+    <div class="epic-insight-title">📌 Estrategia de Crecimiento</div>
+    <p>La variación en menciones ({formatear_variacion(variacion['total'])}) y en menciones positivas ({formatear_variacion(variacion['positivo'])}) muestra el 
+    potencial de expansión del EPIC Lab. Para mantener una tendencia positiva, recomendamos:</p>
+    <ul>
+        <li>Diversificar a nuevas plataformas como Instagram y TikTok</li>
+        <li>Crear más contenido sobre Ciencia e Innovación ligado al emprendimiento</li>
+        <li>Implementar estrategias específicas para aumentar la participación femenina</li>
+        <li>Expandir el alcance más allá de la comunidad del ITAM</li>
+    </ul>
+    """, unsafe_allow_html=True)
+    st.markdown('</div>', unsafe_allow_html=True)
+    
+    # SECCIÓN 2: PUBLICACIONES POR USUARIO Y SENTIMIENTO
+    st.markdown("### Publicaciones por Usuario y Sentimiento")
+    
+    mostrar_asset("assets/publicacionesporusuariosentimiento.png", "Distribución de publicaciones por usuario y sentimiento")
+    
+    # Insight sobre usuarios
+    st.markdown('<div class="epic-insight">', unsafe_allow_html=True)
+    st.markdown(f"""
+    <div class="epic-insight-title">📌 Expansión de Comunidad</div>
+    <p>La conversación digital sobre el EPIC Lab se mantiene principalmente dentro de la comunidad del ITAM. 
+    Para amplificar su impacto, es crucial expandir el alcance más allá de este círculo inmediato. 
+    Recomendamos establecer alianzas con influencers del ecosistema emprendedor, desarrollar un programa 
+    de embajadores, y participar activamente en comunidades externas relacionadas con innovación y emprendimiento.</p>
+    """, unsafe_allow_html=True)
+    st.markdown('</div>', unsafe_allow_html=True)
+    
+    # SECCIÓN 3: PUBLICACIONES POR GÉNERO
+    st.markdown("### Publicaciones por Género")
+    
+    mostrar_asset("assets/publicacionesporgenero.png", "Distribución de publicaciones por género")
+    
+    # Insight sobre género
+    st.markdown('<div class="epic-insight">', unsafe_allow_html=True)
+    st.markdown(f"""
+    <div class="epic-insight-title">📌 Estrategia de Inclusión</div>
+    <p>El análisis muestra que apenas el 2% de la audiencia identificable es femenina, mientras que el 31.6% es masculina 
+    (el resto es indefinido). Esta brecha representa una oportunidad significativa para implementar estrategias de inclusión 
+    que aumenten la participación femenina. Recomendamos destacar historias de mujeres emprendedoras, crear contenido 
+    específico para este segmento y utilizar lenguaje inclusivo en todas las comunicaciones.</p>
+    """, unsafe_allow_html=True)
+    st.markdown('</div>', unsafe_allow_html=True)
+    
+    # SECCIÓN 4: PUBLICACIONES POR FUENTE Y SENTIMIENTO
+    st.markdown("### Publicaciones por Fuente y Sentimiento")
+    
+    st.plotly_chart(grafica_plataforma_sentimiento(cubo, EPIC_COLORS), use_container_width=True, key="analytics_fuente_sentimiento")
+    st.caption("Distribución de menciones por fuente y sentimiento")
+    
+    # Insight sobre fuentes
+    st.markdown('<div class="epic-insight">', unsafe_allow_html=True)
+    st.markdown(f"""
+    <div class="epic-insight-title">📌 Estrategia de Plataformas</div>
+    <p>La conversación digital sobre el EPIC Lab está fuertemente concentrada en Twitter. Sin embargo, 
+    recomendamos expandir significativamente la presencia en Instagram, ya que la conversación digital 
+    sobre emprendimiento está más activa en esta plataforma. Esta diversificación permitirá llegar a 
+    audiencias más jóvenes y potencialmente interesadas en los programas del EPIC Lab.</p>
+    """, unsafe_allow_html=True)
+    st.markdown('</div>', unsafe_allow_html=True)
+    
+    # SECCIÓN 5: MENCIONES POR TEMA
+    st.markdown("### Menciones por Tema")
+    
+    st.plotly_chart(grafica_tema_sentimiento(cubo, EPIC_COLORS), use_container_width=True)
+    st.caption("Distribución de menciones por tema y sentimiento")
+    
+    # Insight sobre menciones por tema (de la ventana seleccionada)
+    temas_principales = sorted(actual['por_tema'], key=actual['por_tema'].get, reverse=True)[:2]
+    positivas_tema = cubo.por('tema', inicio, cubo.fecha_fin, sentimiento='Positivo')
+    menciones_temas = sum(actual['por_tema'][t] for t in temas_principales)
+    pct_positivo_temas = 100 * sum(int(positivas_tema.get(t, 0)) for t in temas_principales) / menciones_temas if menciones_temas else 0.0
+    st.markdown('<div class="epic-insight">', unsafe_allow_html=True)
+    st.markdown(f"""
+    <div class="epic-insight-title">📌 Estrategia de Contenido</div>
+    <p>En los últimos {ventana} días, {" y ".join(temas_principales) or "ningún tema"} concentran el mayor volumen de menciones 
+    ({formatear_numero(menciones_temas)}, {100 * menciones_temas / actual['total'] if actual['total'] else 0:.1f}% del periodo), 
+    con {pct_positivo_temas:.1f}% de menciones positivas. Las publicaciones relacionadas con estos temas tienen un potencial 
+    mayor de alcance. Recomendamos aumentar la frecuencia de publicaciones en estos temas, 
+    enfatizando su conexión con el emprendimiento.</p>
+    """, unsafe_allow_html=True)
+    st.markdown('</div>', unsafe_allow_html=True)
+    
+    # SECCIÓN 6: ANÁLISIS DE SENTIMIENTO
+    st.markdown("### Análisis de Sentimiento")
+    
+    st.plotly_chart(grafica_sentimiento_diario(cubo, EPIC_COLORS), use_container_width=True)
+    st.caption("Evolución diaria del sentimiento sobre EPIC Lab")
+    
+    # Insight sobre sentimiento: rango diario de la ventana seleccionada
+    diario = cubo.serie_diaria(inicio, cubo.fecha_fin)
+    con_menciones = diario > 0
+    pct_positivo = 100 * cubo.serie_diaria(inicio, cubo.fecha_fin, sentimiento='Positivo')[con_menciones] / diario[con_menciones]
+    pct_neto = pct_positivo - 100 * cubo.serie_diaria(inicio, cubo.fecha_fin, sentimiento='Negativo')[con_menciones] / diario[con_menciones]
+    rango_positivo = f"{pct_positivo.min():.1f}% a {pct_positivo.max():.1f}%" if len(pct_positivo) else "sin datos"
+    rango_neto = f"entre {pct_neto.min():.1f}% y {pct_neto.max():.1f}%" if len(pct_neto) else "sin datos"
+    st.markdown('<div class="epic-insight">', unsafe_allow_html=True)
+    st.markdown(f"""
+    <div class="epic-insight-title">📌 Tono de Comunicación</div>
+    <p>En los últimos {ventana} días ({actual['pct_positivo']:.1f}% de menciones positivas), el sentimiento positivo diario 
+    va de {rango_positivo}, con un sentimiento neto diario {rango_neto}. 
+    Esta percepción positiva es un activo valioso. Recomendamos continuar con un tono positivo en todas las comunicaciones, 
+    destacar historias de éxito y transformación, y mantener un enfoque en soluciones al abordar los desafíos del emprendimiento.</p>
+    """, unsafe_allow_html=True)
+    st.markdown('</div>', unsafe_allow_html=True)
@@ -0,0 +1,216 @@
+"""
+Página Asistente y panel del asesor de contenido.
+El cliente de OpenAI se carga en la pasarela hasta la primera petición.
+"""
+
+import streamlit as st
+
+from epiclab.asistente import (
+    STREAMING,
+    construir_mensajes,
+    guardar_respuesta,
+    llave_respuesta,
+    respuesta_en_cache,
+    responder,
+    responder_stream,
+)
+from epiclab.compartido import obtener_pasarela_llm
+
+
+def add_ai_message(message, role="user"):
+    st.session_state.ai_assistant_messages.append({"role": role, "content": message})
+
+# Función para generar una respuesta del asistente
+def generate_ai_response(user_message, stream=STREAMING, cache=False):
+    # Agregar el mensaje del usuario al historial
+    st.session_state.ai_assistant_messages.append({"role": "user", "content": user_message})
+    
+    # Las sugerencias rápidas se responden desde el caché si ya se preguntaron con el mismo tono y contexto
+    llave = None
+    if cache:
+        llave = llave_respuesta(
+            user_message,
+            st.session_state.ai_assistant_tone,
+            st.session_state.get('ultimo_score'),
+            st.session_state.get('ultimo_texto'),
+        )
+        ai_response = respuesta_en_cache(llave)
+        if ai_response is not None:
+            if stream:
+                with st.chat_message("assistant", avatar="💬"):
+                    st.markdown(ai_response)
+            st.session_state.ai_assistant_messages.append({"role": "assistant", "content": ai_response})
+            return ai_response
+    
+    # Prompt de sistema (tono y contexto del último análisis) más el historial reciente
+    messages = construir_mensajes(
+        st.session_state.ai_assistant_messages,
+        st.session_state.ai_assistant_tone,
+        st.session_state.get('ultimo_score'),
+        st.session_state.get('ultimo_texto'),
+    )
+    
+    try:
+        if stream:
+            # Los tokens se dibujan conforme llegan; al terminar se guarda el texto completo
+            with st.chat_message("assistant", avatar="💬"):
+                ai_response = st.write_stream(responder_stream(messages, obtener_pasarela_llm()))
+        else:
+            ai_response = responder(messages, obtener_pasarela_llm())
+        
+        if llave is not None and ai_response:
+            guardar_respuesta(llave, ai_response)
+        st.session_state.ai_assistant_messages.append({"role": "assistant", "content": ai_response})
+        return ai_response
+        
+    except Exception as e:
+        # Manejar error
+        error_msg = f"Lo siento, tuve un problema al generar una respuesta. Error: {str(e)}"
+        st.session_state.ai_assistant_messages.append({"role": "assistant", "content": error_msg})
+        return error_msg
+
+def render_ai_assistant():
+    # Inicializar estados de sesión para el asistente si no existen
+    if 'ai_assistant_messages' not in st.session_state:
+        st.session_state.ai_assistant_messages = [
+            {"role": "assistant", "content": "¡Hola! Soy tu Asesor de Contenido Inteligente del EPIC Lab. ¿En qué puedo ayudarte hoy? 👋"}
+        ]
+        
+    if 'ai_assistant_tone' not in st.session_state:
+        st.session_state.ai_assistant_tone = "profesional"
+    
+    # Crear un contenedor expandible para el asistente
+    with st.expander("💬 Asesor de Contenido Inteligente", expanded=False):
+        # Mostrar mensajes existentes
+        for msg in st.session_state.ai_assistant_messages:
+            if msg["role"] == "assistant":
+                st.markdown(f'<div class="epic-chat epic-chat-asesor"><strong>Asesor:</strong> {msg["content"]}</div>', unsafe_allow_html=True)
+            else:
+                st.markdown(f'<div class="epic-chat"><strong>Tú:</strong> {msg["content"]}</div>', unsafe_allow_html=True)
+        
+        # Selector de tono
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            if st.button("😊 Profesional", use_container_width=True, 
+                          type="primary" if st.session_state.ai_assistant_tone == "profesional" else "secondary"):
+                st.session_state.ai_assistant_tone = "profesional"
+                st.rerun()
+        with col2:
+            if st.button("🔥 Inspirador", use_container_width=True,
+                          type="primary" if st.session_state.ai_assistant_tone == "inspirador" else "secondary"):
+                st.session_state.ai_assistant_tone = "inspirador"
+                st.rerun()
+        with col3:
+            if st.button("👋 Casual", use_container_width=True,
+                          type="primary" if st.session_state.ai_assistant_tone == "casual" else "secondary"):
+                st.session_state.ai_assistant_tone = "casual"
+                st.rerun()
+        
+        # Sugerencias rápidas
+        st.markdown("**Sugerencias rápidas:**")
+        col1, col2 = st.columns(2)
+        with col1:
+            if st.button("¿Cómo mejorar viralidad?", use_container_width=True):
+                generate_ai_response("¿Cómo mejorar viralidad?", cache=True)
+                st.rerun()
+        with col2:
+            if st.button("Idea para post", use_container_width=True):
+                generate_ai_response("Dame una idea para un post sobre innovación", cache=True)
+                st.rerun()
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            if st.button("¿Qué es inclusividad?", use_container_width=True):
+                generate_ai_response("¿Qué significa el score de inclusividad?", cache=True)
+                st.rerun()
+        with col2:
+            if st.button("Ayuda con app", use_container_width=True):
+                generate_ai_response("¿Cómo usar esta plataforma?", cache=True)
+                st.rerun()
+        
+        # Input para mensaje personalizado
+        user_message = st.chat_input("Escribe tu mensaje aquí...")
+        if user_message:
+            generate_ai_response(user_message)
+            st.rerun()
+
+
+# Función para renderizar el asistente
+def render_assistant():
+    st.markdown("""
+    <div class="epic-header">
+        <h1 class="epic-title">Asistente Inteligente</h1>
+        <p class="epic-subtitle">Tu asesor de contenido personalizado</p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    st.markdown("""<div class="ai-assistant-container">""", unsafe_allow_html=True)
+    
+    # Mostrar mensajes existentes con diseño moderno
+    for msg in st.session_state.ai_assistant_messages:
+        if msg["role"] == "assistant":
+            st.markdown(f"""
+            <div class="assistant-message">
+                <strong>Asesor:</strong> {msg["content"]}
+            </div>
+            """, unsafe_allow_html=True)
+        else:
+            st.markdown(f"""
+            <div class="user-message">
+                <strong>Tú:</strong> {msg["content"]}
+            </div>
+            """, unsafe_allow_html=True)
+    
+    # Selector de tono con diseño moderno
+    st.markdown("### Ajustar tono de respuesta")
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        if st.button("😊 Profesional", use_container_width=True, 
+                     type="primary" if st.session_state.ai_assistant_tone == "profesional" else "secondary"):
+            st.session_state.ai_assistant_tone = "profesional"
+            st.rerun()
+    with col2:
+        if st.button("🔥 Inspirador", use_container_width=True,
+                     type="primary" if st.session_state.ai_assistant_tone == "inspirador" else "secondary"):
+            st.session_state.ai_assistant_tone = "inspirador"
+            st.rerun()
+    with col3:
+        if st.button("👋 Casual", use_container_width=True,
+                     type="primary" if st.session_state.ai_assistant_tone == "casual" else "secondary"):
+            st.session_state.ai_assistant_tone = "casual"
+            st.rerun()
+    
+    # Sugerencias rápidas con diseño moderno
+    st.markdown("### Preguntas frecuentes")
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        if st.button("¿Cómo mejorar viralidad?", use_container_width=True, key="btn_viralidad"):
+            generate_ai_response("¿Cómo mejorar viralidad?", cache=True)
+            st.rerun()
+    with col2:
+        if st.button("Dame ideas para post", use_container_width=True, key="btn_ideas"):
+            generate_ai_response("Dame ideas para un post sobre innovación", cache=True)
+            st.rerun()
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        if st.button("¿Qué es inclusividad?", use_container_width=True, key="btn_inclusividad"):
+            generate_ai_response("¿Qué significa el score de inclusividad?", cache=True)
+            st.rerun()
+    with col2:
+        if st.button("Ayuda con la plataforma", use_container_width=True, key="btn_ayuda"):
+            generate_ai_response("¿Cómo usar esta plataforma?", cache=True)
+            st.rerun()
+    
+    # Input para mensaje personalizado
+    st.markdown("### Pregunta personalizada")
+    user_message = st.text_input("Escribe tu pregunta al asesor...", key="texto_asistente")
+    
+    if st.button("Enviar", type="primary", key="btn_enviar_pregunta"):
+        if user_message:
+            generate_ai_response(user_message)
+            st.rerun()
+    
+    st.markdown("""</div>""", unsafe_allow_html=True)
@@ -0,0 +1,15 @@
+"""
+Componentes de interfaz compartidos por varias páginas.
+"""
+
+import streamlit as st
+
+from epiclab.assets import variante_imagen
+
+
+# Función auxiliar para mostrar imágenes de assets (variante reducida y en caché)
+def mostrar_asset(ruta, caption):
+    try:
+        st.image(variante_imagen(ruta), caption=caption, use_container_width=True)
+    except Exception as e:
+        st.error(f"Error al cargar la imagen: {e}")
@@ -0,0 +1,70 @@
+"""
+Página de Configuración: perfil, notificaciones e integraciones.
+"""
+
+import streamlit as st
+
+
+# Función de Configuración
+def render_settings():
+    st.markdown("""
+    <div class="epic-header">
+        <h1 class="epic-title">Configuración</h1>
+        <p class="epic-subtitle">Personaliza tu experiencia</p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    st.markdown("""<div class="epic-card">""", unsafe_allow_html=True)
+    
+    # Configuración de perfil
+    st.subheader("Perfil de Usuario")
+    
+    col1, col2 = st.columns([1, 3])
+    
+    with col1:
+        st.markdown('<div class="epic-avatar">👤</div>', unsafe_allow_html=True)
+    
+    with col2:
+        st.text_input("Nombre", value="Usuario EPIC")
+        st.text_input("Email", value="usuario@epic.itam.mx")
+        st.selectbox("Rol", ["Administrador", "Editor", "Visualizador"])
+    
+    # Configuración de notificaciones
+    st.subheader("Notificaciones")
+    
+    st.checkbox("Recibir notificaciones por email", value=True)
+    st.checkbox("Notificaciones diarias de rendimiento", value=False)
+    st.checkbox("Alertas de tendencias", value=True)
+    st.checkbox("Sugerencias de contenido", value=True)
+    
+    # Preferencias de visualización
+    st.subheader("Preferencias de Visualización")
+    
+    st.radio("Tema", ["Claro", "Oscuro"], index=0)
+    st.selectbox("Densidad de información", ["Alta", "Media", "Baja"], index=1)
+    
+    # Integración con plataformas
+    st.subheader("Integraciones")
+    
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        st.markdown('<div class="epic-integracion epic-integracion-twitter"><strong>Twitter</strong><br><small>No conectado</small></div>', unsafe_allow_html=True)
+    
+    with col2:
+        st.markdown('<div class="epic-integracion epic-integracion-linkedin"><strong>LinkedIn</strong><br><small>Conectado</small></div>', unsafe_allow_html=True)
+    
+    with col3:
+        st.markdown('<div class="epic-integracion epic-integracion-instagram"><strong>Instagram</strong><br><small>No conectado</small></div>', unsafe_allow_html=True)
+    
+    # Botones de acción
+    st.markdown("<br>", unsafe_allow_html=True)
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.button("Guardar Configuración", type="primary", use_container_width=True)
+    
+    with col2:
+        st.button("Restablecer Valores", use_container_width=True)
+    
+    st.markdown("""</div>""", unsafe_allow_html=True)
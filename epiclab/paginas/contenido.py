@@ -0,0 +1,449 @@
+"""
+Página Contenido: recomendador, medidor de impacto social, hashtags y horarios.
+El radar de impacto viene de la caché de figuras de epiclab.graficas.
+"""
+
+import random
+
+import streamlit as st
+
+from epiclab.compartido import obtener_puntuador_impacto
+from epiclab.contenido import recomendar_horarios
+from epiclab.graficas import grafica_radar_impacto
+from epiclab.impacto import analizar_impacto_social
+from epiclab.impacto_llm import IMPACTO_LLM
+from epiclab.paginas.tema import EPIC_COLORS
+
+
+# Función para generar recomendación de contenido (simulada)
+def generar_recomendacion(publico, genero, tipo_contenido, formato, plataforma):
+    # Simulamos la respuesta para la demo
+    recomendaciones = {
+        'Estudiantes': {
+            'Instagram': "Crea contenido visual con infografías que expliquen conceptos de {tipo} de forma sencilla. Usa un lenguaje cercano y directo, con ejemplos relevantes para estudiantes. Incluye llamados a la acción para participar en los programas del EPIC Lab.",
+            'Twitter/X': "Publica hilos cortos sobre tendencias en {tipo} con datos interesantes. Usa un tono informativo pero casual y menciona cómo el EPIC Lab puede ayudarles a desarrollar habilidades en esta área.",
+            'TikTok': "Desarrolla videos cortos y dinámicos con explicaciones rápidas sobre {tipo}. Usa música de tendencia y un formato de preguntas y respuestas. Finaliza con invitación a conocer más en el EPIC Lab.",
+            'LinkedIn': "Comparte artículos sobre oportunidades en {tipo} para estudiantes que buscan desarrollar su carrera. Incluye testimonios de participantes del EPIC Lab y estadísticas sobre el impacto en su desarrollo profesional."
+        },
+        'Profesionales': {
+            'Instagram': "Publica casos de éxito en formato carrusel sobre profesionales que han transformado su carrera gracias a conocimientos en {tipo}. Destaca el networking y las oportunidades que ofrece el EPIC Lab.",
+            'Twitter/X': "Comparte insights de industria y análisis de tendencias en {tipo} con un enfoque profesional. Menciona eventos exclusivos del EPIC Lab donde pueden profundizar estos temas.",
+            'TikTok': "Crea videos con formato 'day in the life' de profesionales exitosos en {tipo}, mostrando cómo aplican lo aprendido en el EPIC Lab. Usa un tono aspiracional pero auténtico.",
+            'LinkedIn': "Publica artículos detallados sobre innovaciones en {tipo} y cómo están transformando la industria. Invita a profesionales a participar como mentores o asistentes en los programas del EPIC Lab."
+        },
+        'Emprendedores': {
+            'Instagram': "Desarrolla historias visuales sobre el journey emprendedor en {tipo}, destacando los desafíos y victorias. Muestra cómo el EPIC Lab puede ser un aliado en cada etapa del proceso.",
+            'Twitter/X': "Comparte consejos prácticos y recursos para emprendedores en {tipo}. Usa hashtags relevantes del ecosistema emprendedor y menciona las herramientas que ofrece el EPIC Lab.",
+            'TikTok': "Crea videos con formato 'antes/después' mostrando la evolución de startups exitosas en {tipo}. Destaca el papel del EPIC Lab como catalizador de estos proyectos.",
+            'LinkedIn': "Publica casos de estudio detallados sobre startups que han escalado en {tipo} con apoyo del EPIC Lab. Incluye métricas concretas de crecimiento y lecciones aprendidas."
+        }
+    }
+    
+    base_recomendacion = recomendaciones[publico][plataforma].replace("{tipo}", tipo_contenido.lower())
+    
+    # Añadir recomendación específica según formato
+    formato_recomendacion = {
+        'Texto': f"\n\nPara el formato de texto, utiliza párrafos cortos y concisos, con títulos llamativos. La longitud ideal es de 150-200 palabras para {plataforma}.",
+        'Imagen': f"\n\nPara el formato de imagen, utiliza colores vibrantes que reflejen la identidad del EPIC Lab. Incluye texto superpuesto con datos impactantes sobre {tipo_contenido}.",
+        'Video': f"\n\nPara el formato de video, mantén una duración de 30-60 segundos con edición dinámica. Incluye subtítulos y asegúrate de mencionar al EPIC Lab en los primeros 5 segundos.",
+        'Infografía': f"\n\nPara el formato de infografía, estructura la información en 3-5 secciones clave. Usa iconos modernos y datos visuales que destaquen el valor del EPIC Lab en el ecosistema de {tipo_contenido}."
+    }
+    
+    recomendacion_completa = base_recomendacion + formato_recomendacion[formato]
+    
+    # Añadir consideración de género si se seleccionó específicamente
+    if genero != "Otro":
+        recomendacion_completa += f"\n\nConsidera usar un lenguaje inclusivo y representativo, con ejemplos y testimonios que resuenen especialmente con audiencia de género {genero.lower()}."
+    else:
+        recomendacion_completa += "\n\nUtiliza lenguaje inclusivo y diverso, con ejemplos que representen a personas de todos los géneros y backgrounds."
+    
+    
+    return recomendacion_completa
+
+
+# Paneles interactivos de Contenido y Predicciones
+@st.fragment
+def panel_impacto_social():
+    # Fragmento: escribir y analizar un post solo vuelve a ejecutar este panel
+    st.markdown('<div class="epic-card">', unsafe_allow_html=True)
+    # Input de texto en diseño más limpio
+    st.markdown("**Escribe tu idea de post para el EPIC Lab:**")
+    texto_post = st.text_area(
+        "",
+        height=120,
+        key="texto_impacto",
+        placeholder="Ejemplo: El EPIC Lab lanza su nuevo programa de mentoría para emprendedores tecnológicos. Únete a nuestra comunidad y transforma tus ideas en proyectos de impacto real."
+    )
+    
+    if st.button("Analizar Impacto", type="primary", key="btn_analizar_impacto"):
+        if not texto_post or len(texto_post.strip()) < 10:
+            st.warning("Por favor, escribe un texto más extenso para poder analizarlo correctamente.")
+        else:
+            with st.spinner("Analizando el impacto social de tu contenido..."):
+                # Llamar a la función de análisis (modelo de lenguaje si está habilitado, con la heurística de respaldo)
+                if IMPACTO_LLM:
+                    resultado = obtener_puntuador_impacto().analizar(texto_post)
+                else:
+                    resultado = analizar_impacto_social(texto_post)
+                
+                # Guardar en session state para usar en otras tabs
+                st.session_state.ultimo_texto = texto_post
+                st.session_state.ultimo_score = resultado
+                
+                # Mejorar visualización con dos columnas
+                col1, col2 = st.columns([3, 2])
+                
+                with col1:
+                    # Crear gráfico de radar con estilo mejorado
+                    categorias = ['Viralidad', 'Relevancia Social', 'Inclusividad', 'Claridad', 'Tono Positivo']
+                    valores = [
+                        resultado['viralidad'],
+                        resultado['relevancia_social'],
+                        resultado['inclusividad'],
+                        resultado['claridad'],
+                        resultado['tono_positivo']
+                    ]
+                    
+                    st.plotly_chart(grafica_radar_impacto(categorias, valores, EPIC_COLORS), use_container_width=True)
+                    
+                    # Mostrar score promedio en formato más limpio
+                    score_promedio = sum(valores) / len(valores)
+                    
+                    st.markdown(
+                        f'<div class="epic-cifra"><div class="epic-cifra-valor">{score_promedio:.1f}</div>'
+                        '<div class="epic-cifra-etiqueta">Score Global de Impacto</div></div>',
+                        unsafe_allow_html=True
+                    )
+                
+                with col2:
+                    st.markdown("### Desglose de puntajes")
+                    
+                    # Mostrar puntajes individuales en forma de barras horizontales (un solo bloque)
+                    st.markdown("".join(
+                        f'<div class="epic-barra"><div class="epic-barra-cabecera"><div>{cat}</div>'
+                        f'<div class="epic-barra-valor">{val}/100</div></div>'
+                        f'<div class="epic-barra-fondo"><div class="epic-barra-relleno" style="width: {val}%;"></div></div></div>'
+                        for cat, val in zip(categorias, valores)
+                    ), unsafe_allow_html=True)
+                    
+                    # Sugerencias de mejora
+                    st.markdown("### Sugerencias de mejora")
+                    st.markdown('<div class="epic-insight">', unsafe_allow_html=True)
+                    st.markdown(f"{resultado['sugerencias']}")
+                    st.markdown('</div>', unsafe_allow_html=True)
+    else:
+        st.info("Escribe tu idea de post y haz clic en 'Analizar Impacto' para evaluarlo.")
+        
+    st.markdown('</div>', unsafe_allow_html=True)
+
+
+@st.fragment
+def panel_hashtags():
+    # Fragmento: las opciones y el slider de cantidad solo vuelven a ejecutar este panel
+    st.markdown('<div class="epic-card">', unsafe_allow_html=True)
+    # Usar el texto del post de la pestaña anterior o permitir uno nuevo
+    if 'ultimo_texto' in st.session_state:
+        texto_default = st.session_state.ultimo_texto
+    else:
+        texto_default = ""
+    
+    st.markdown("**Texto del post:**")
+    texto_hashtags = st.text_area(
+        "",
+        value=texto_default,
+        height=120,
+        key="texto_hashtags_input",
+        placeholder="Escribe o pega el texto de tu post aquí para generar hashtags relevantes..."
+    )
+    
+    # Opciones adicionales para personalizar los hashtags
+    st.markdown("**Personaliza tus hashtags:**")
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        incluir_itam = st.checkbox("Incluir ITAM", value=True, key="check_itam")
+        incluir_epiclab = st.checkbox("Incluir EPIC Lab", value=True, key="check_epiclab")
+        incluir_mad = st.checkbox("Incluir MAD Fellows", value=True, key="check_mad")
+    
+    with col2:
+        tema_principal = st.selectbox(
+            "Tema principal:",
+            ["Emprendimiento", "Innovación", "Tecnología", "Educación", "Impacto Social"],
+            key="select_tema"
+        )
+        
+        cantidad = st.slider("Cantidad de hashtags:", min_value=5, max_value=12, value=8, key="slider_cantidad")
+    
+    if st.button("Generar Hashtags", type="primary", key="btn_generar_hashtags"):
+        if not texto_hashtags or len(texto_hashtags.strip()) < 10:
+            st.warning("Por favor, escribe un texto más extenso para generar hashtags relevantes.")
+        else:
+            # Generar hashtags base para asegurarnos que siempre haya algo
+            hashtags_base = []
+            if incluir_epiclab:
+                hashtags_base.append("#EPICLab")
+            if incluir_itam:
+                hashtags_base.append("#ITAM")
+            if incluir_mad:
+                hashtags_base.append("#MADFellows")
+            
+            # Hashtags según tema
+            tema_hashtags = {
+                "Emprendimiento": ["#Emprendimiento", "#Startup", "#Business", "#Entrepreneur"],
+                "Innovación": ["#Innovación", "#Innovation", "#Creatividad", "#Disruptive"],
+                "Tecnología": ["#Tech", "#Tecnología", "#Digital", "#FutureTech"],
+                "Educación": ["#Educación", "#Learning", "#Estudiantes", "#Skills"],
+                "Impacto Social": ["#ImpactoSocial", "#Sostenibilidad", "#Comunidad", "#ChangeAgent"]
+            }
+            
+            # Añadir hashtags del tema seleccionado
+            hashtags_tema = tema_hashtags.get(tema_principal, [])
+            
+            # Extraer hashtags del texto (palabras clave simples)
+            palabras_clave = {
+                "emprendimiento": "#Emprendimiento",
+                "startup": "#Startup",
+                "tecnología": "#Tech",
+                "digital": "#Digital",
+                "innovación": "#Innovación",
+                "futuro": "#FuturoDigital",
+                "méxico": "#México",
+                "desafío": "#Challenge",
+                "impacto": "#ImpactoSocial",
+                "comunidad": "#Comunidad",
+                "desarrollo": "#Desarrollo",
+                "talento": "#Talento",
+                "creatividad": "#Creatividad",
+                "colaboración": "#Collaboration",
+                "fellows": "#MADFellows",
+                "challenge": "#EPICChallenge",
+                "estudiantes": "#Estudiantes",
+                "educación": "#Educación",
+                "transformación": "#Transformación",
+                "negocios": "#Business",
+                "fintech": "#Fintech",
+                "ai": "#AI",
+                "inteligencia": "#IA"
+            }
+            
+            hashtags_del_texto = []
+            if texto_hashtags:
+                palabras = texto_hashtags.lower().split()
+                for palabra in palabras:
+                    palabra_limpia = ''.join(c for c in palabra if c.isalnum())
+                    if palabra_limpia in palabras_clave and palabras_clave[palabra_limpia] not in hashtags_del_texto:
+                        hashtags_del_texto.append(palabras_clave[palabra_limpia])
+            
+            # Combinar todas las fuentes de hashtags
+            todos_hashtags = list(set(hashtags_base + hashtags_tema + hashtags_del_texto))
+            
+            # Si faltan para llegar a la cantidad solicitada, añadir genéricos
+            hashtags_genericos = ["#Innovation", "#DigitalTransformation", "#Growth", "#Community", "#Success", "#Collaboration", "#Future", "#Leadership", "#Networking"]
+            
+            while len(todos_hashtags) < cantidad:
+                hashtag_generico = random.choice(hashtags_genericos)
+                if hashtag_generico not in todos_hashtags:
+                    todos_hashtags.append(hashtag_generico)
+                # Evitar bucle infinito
+                if len(todos_hashtags) >= min(cantidad, len(set(hashtags_base + hashtags_tema + hashtags_del_texto + hashtags_genericos))):
+                    break
+            
+            # Limitar a la cantidad solicitada
+            todos_hashtags = todos_hashtags[:cantidad]
+            
+            # Guardar en el estado de la sesión
+            st.session_state.ultimo_hashtags = todos_hashtags
+            
+            # Mostrar hashtags en formato visual atractivo (un solo bloque)
+            etiquetas = []
+            for hashtag in todos_hashtags:
+                # Color basado en categoría (la clase base usa el secundario)
+                clase = "epic-hashtag epic-hashtag-primario"
+                if hashtag in ["#EPICLab", "#ITAM", "#MADFellows"]:
+                    clase = "epic-hashtag epic-hashtag-primario"
+                elif hashtag in hashtags_tema:
+                    clase = "epic-hashtag"
+                etiquetas.append(f'<span class="{clase}">{hashtag}</span>')
+            
+            st.markdown(f'<div class="epic-hashtags">{"".join(etiquetas)}</div>', unsafe_allow_html=True)
+            
+            # Texto para copiar
+            st.markdown("### Copiar todos los hashtags")
+            hashtags_texto = " ".join(todos_hashtags)
+            st.code(hashtags_texto)
+            
+            # Insight personalizado según tema
+            st.markdown('<div class="epic-insight">', unsafe_allow_html=True)
+            if tema_principal == "Emprendimiento":
+                insight_texto = "Los hashtags de emprendimiento tienen mayor alcance cuando se combinan con hashtags específicos de industria. Úsalos para conectar con inversores y mentores potenciales."
+            elif tema_principal == "Innovación":
+                insight_texto = "Los hashtags de innovación son muy seguidos por tomadores de decisiones en grandes empresas. Perfectos para posicionar al EPIC Lab como líder de pensamiento en transformación."
+            elif tema_principal == "Tecnología":
+                insight_texto = "Los hashtags de tecnología alcanzan a una audiencia muy comprometida. Combina hashtags generales con términos más específicos para maximizar tu alcance."
+            elif tema_principal == "Educación":
+                insight_texto = "Los hashtags educativos son especialmente efectivos entre semana en horario laboral. Perfecto para atraer a estudiantes y profesionales buscando desarrollo."
+            else:
+                insight_texto = "Los hashtags de impacto social tienen alto engagement y permanencia. Ideal para construir una comunidad comprometida alrededor del EPIC Lab."
+            
+            st.markdown(f"""
+            <div class="epic-insight-title">📌 Tip para hashtags de {tema_principal}</div>
+            <p>{insight_texto}</p>
+            <p>Los hashtags específicos de nicho tienen hasta un 70% más de engagement que los hashtags genéricos muy populares.</p>
+            """, unsafe_allow_html=True)
+            st.markdown('</div>', unsafe_allow_html=True)
+    else:
+        st.info("Escribe o pega el texto de tu post y haz clic en 'Generar Hashtags'.")
+    
+    st.markdown('</div>', unsafe_allow_html=True)
+
+
+# Función para Contenido
+def render_content():
+    st.markdown("""
+    <div class="epic-header">
+        <h1 class="epic-title">Creación de Contenido</h1>
+        <p class="epic-subtitle">Optimiza tu contenido con análisis inteligente y recomendaciones</p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # Crear tabs para las diferentes herramientas
+    tab1, tab2, tab3, tab4 = st.tabs([
+        "🚀 Recomendador", 
+        "📈 Impacto Social", 
+        "#️⃣ Hashtags", 
+        "⏰ Horarios"
+    ])
+    
+    # Tab Recomendador
+    with tab1:
+        st.markdown("### Recomendador de Contenido")
+        
+        col1, col2 = st.columns([1, 1])
+        
+        with col1:
+            st.markdown('<div class="epic-card">', unsafe_allow_html=True)
+            st.subheader("Define tu audiencia")
+            
+            publico = st.radio(
+                "Público objetivo:",
+                ["Estudiantes", "Profesionales", "Emprendedores"]
+            )
+            
+            genero = st.radio(
+                "Enfoque de género:",
+                ["Todos", "Mujer", "Hombre"]
+            )
+            
+            tipo_contenido = st.selectbox(
+                "Temática:",
+                ["Emprendimiento", "Innovación", "Tecnología", "Finanzas", "Negocios"]
+            )
+            
+            formato = st.selectbox(
+                "Formato:",
+                ["Texto", "Imagen", "Video", "Infografía"]
+            )
+            
+            plataforma = st.selectbox(
+                "Plataforma:",
+                ["Instagram", "Twitter/X", "LinkedIn", "TikTok"]
+            )
+            
+            st.markdown('</div>', unsafe_allow_html=True)
+        
+        with col2:
+            st.markdown('<div class="epic-card">', unsafe_allow_html=True)
+            st.subheader("Recomendación personalizada")
+            
+            if st.button("Generar Recomendación", type="primary"):
+                with st.spinner("Analizando datos y generando recomendación..."):
+                    # Ajustar valores para compatibilidad con la función
+                    publico_map = publico
+                    genero_map = "Otro" if genero == "Todos" else genero
+                    
+                    recomendacion = generar_recomendacion(
+                        publico_map, 
+                        genero_map, 
+                        tipo_contenido, 
+                        formato, 
+                        plataforma
+                    )
+                    
+                    st.markdown(
+                        f'<div class="epic-etiquetas"><span class="epic-etiqueta">{publico}</span>'
+                        f'<span class="epic-etiqueta epic-etiqueta-secundaria">{plataforma}</span></div>',
+                        unsafe_allow_html=True
+                    )
+                    
+                    st.markdown('<div class="epic-premium">', unsafe_allow_html=True)
+                    st.markdown(recomendacion)
+                    st.markdown('</div>', unsafe_allow_html=True)
+            else:
+                st.info("Selecciona los parámetros y presiona 'Generar Recomendación' para recibir estrategias personalizadas.")
+                
+                st.markdown("""
+                ### ¿Por qué personalizar?
+                
+                El contenido adaptado a tu audiencia específica tiene **hasta 3 veces más engagement** que el contenido genérico. 
+                
+                Nuestro algoritmo analiza patrones de éxito en cada plataforma para maximizar el alcance del EPIC Lab.
+                """)
+            
+            st.markdown('</div>', unsafe_allow_html=True)
+    
+    # Tab Impacto Social
+    with tab2:
+        st.markdown("### Medidor de Impacto Social")
+        
+        panel_impacto_social()
+
+    # Tab Hashtags
+    # Tab Hashtags
+    # Tab Hashtags
+    with tab3:
+        st.markdown("### Generador de Hashtags")
+        
+        panel_hashtags()
+
+    # Tab Horarios
+    with tab4:
+        st.markdown("### Horarios Óptimos")
+        
+        st.markdown('<div class="epic-card">', unsafe_allow_html=True)
+        # Diseño más limpio para selección de plataforma
+        col1, col2 = st.columns([1, 3])
+        
+        with col1:
+            st.subheader("Plataforma")
+            plataforma_horario = st.radio(
+                "",
+                ["Instagram", "Twitter/X", "LinkedIn", "TikTok"]
+            )
+            
+            st.button("Analizar Horarios", type="primary")
+        
+        with col2:
+            # Siempre mostrar resultados para mejor experiencia de usuario
+            # En app real, esto estaría condicionado al botón
+            horarios = recomendar_horarios(plataforma_horario)
+            
+            st.subheader(f"Mejores horarios para {plataforma_horario}")
+            
+            # Diseño visual mejorado para los horarios; el color se va degradando según la posición
+            st.markdown("".join(
+                f'<div class="epic-horario epic-horario-{min(i, 2) + 1}"><div class="epic-horario-cabecera">'
+                f'<span class="epic-horario-hora">🕒 {horario["hora"]}</span>'
+                f'<div class="epic-horario-efectividad">{horario["efectividad"]}% efectividad</div></div>'
+                f'<p>{horario["razon"]}</p></div>'
+                for i, horario in enumerate(horarios)
+            ), unsafe_allow_html=True)
+            
+            # Insight sobre horarios
+            st.markdown('<div class="epic-insight">', unsafe_allow_html=True)
+            st.markdown(f"""
+            <div class="epic-insight-title">📌 Insight sobre horarios</div>
+            <p>Para {plataforma_horario}, programar publicaciones en estos horarios óptimos puede aumentar tu alcance orgánico hasta en un 25-30%. Mantén consistencia en tus publicaciones para mejorar el rendimiento del algoritmo.</p>
+            """, unsafe_allow_html=True)
+            st.markdown('</div>', unsafe_allow_html=True)
+        
+        st.markdown('</div>', unsafe_allow_html=True)
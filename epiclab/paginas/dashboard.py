@@ -0,0 +1,196 @@
+"""
+Página Dashboard: KPIs, sentimiento, nube de palabras y resumen de la conversación.
+"""
+
+import streamlit as st
+
+from epiclab.graficas import grafica_plataforma_sentimiento, grafica_sentimiento
+from epiclab.kpis import calcular_kpis, formatear_fecha, formatear_numero
+from epiclab.paginas.componentes import mostrar_asset
+from epiclab.paginas.tema import EPIC_COLORS
+
+
+# Función para el Dashboard
+def render_dashboard(df, cubo, motor):
+    # Encabezado principal con diseño moderno
+    st.markdown("""
+    <div class="epic-header">
+        <h1 class="epic-title">Conversación Digital sobre Emprendimiento</h1>
+        <p class="epic-subtitle">Optimiza el alcance del EPIC Lab con análisis de datos de emprendimiento</p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # SECCIÓN 1: MÉTRICAS CLAVE DE SENTIMIENTO
+    st.markdown("### Sentimiento sobre Emprendimiento")
+    
+    # KPIs calculados del dataset cargado (memoizados por versión del dataset)
+    kpis = calcular_kpis(cubo, comparar=False)
+    actual = kpis['actual']
+    
+    # Mostrar métricas en formato moderno
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        st.markdown(f"""
+        <div class="epic-metric">
+            <div class="epic-metric-value">{formatear_numero(actual['total'])}</div>
+            <div class="epic-metric-label">Total Menciones</div>
+            <div class="epic-nota">(Del {formatear_fecha(kpis['inicio'])} al {formatear_fecha(kpis['fin'])})</div>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col2:
+        st.markdown(f"""
+        <div class="epic-metric">
+            <div class="epic-metric-value">{actual['pct_positivo']:.1f}%</div>
+            <div class="epic-metric-label">Sentimiento Positivo</div>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col3:
+        st.markdown(f"""
+        <div class="epic-metric">
+            <div class="epic-metric-value">{actual['pct_negativo']:.1f}%</div>
+            <div class="epic-metric-label">Sentimiento Negativo</div>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col4:
+        st.markdown(f"""
+        <div class="epic-metric">
+            <div class="epic-metric-value">{actual['sentimiento_neto']:.1f}%</div>
+            <div class="epic-metric-label">Sentimiento Neto</div>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    # SECCIÓN 2: ANÁLISIS VISUAL DE SENTIMIENTO - IMAGEN A PANTALLA COMPLETA
+    st.markdown("### Distribución de Sentimiento")
+    
+    # Gráfica generada con los datos vigentes (en caché mientras los datos no cambien)
+    st.plotly_chart(grafica_sentimiento(cubo, EPIC_COLORS), use_container_width=True)
+    st.caption("Distribución del sentimiento en las menciones")
+    
+    st.markdown(f'<div class="epic-destacado">Sentimiento Neto: {actual["sentimiento_neto"]:.1f}%</div>', unsafe_allow_html=True)
+    
+    # SECCIÓN 3: PALABRAS QUE POTENCIAN ENGAGEMENT - PANTALLA COMPLETA
+    st.markdown("### Palabras que Potencian Engagement")
+    
+    # Nubes del motor de términos: solo se regeneran cuando cambia el top-K
+    nube = motor.nube_png('Positivo', colormap='Greens')
+    if nube is None:
+        st.info("Aún no hay términos positivos para dibujar la nube.")
+    else:
+        st.image(nube, caption="Términos positivos relacionados con emprendimiento", use_container_width=True)
+    
+    st.markdown('<div class="epic-insight">', unsafe_allow_html=True)
+    st.markdown(f"""
+    <div class="epic-insight-title">📌 Estrategia de Comunicación Positiva</div>
+    <p>Utiliza términos como "oportunidad", "desarrollo", "crecimiento" y "apoyo" para maximizar el engagement. Evita transmitir mensajes en negativo y asegúrate de que todas tus comunicaciones mantengan un tono positivo y constructivo.</p>
+    <p>Ejemplos prácticos:</p>
+    <ul>
+        <li>En lugar de "Encarrila tu nuevo emprendimiento", usar "Dale vida a tu emprendimiento"</li>
+        <li>En vez de "Evita fracasar en tu startup", mejor "Construye el éxito de tu startup"</li>
+        <li>La mención de "mujeres" puede contribuir al objetivo de aumentar la participación femenina en el EPIC Lab.</li>
+    </ul>
+    """, unsafe_allow_html=True)
+    st.markdown('</div>', unsafe_allow_html=True)
+    
+    # SECCIÓN 4: PALABRAS A EVITAR - PANTALLA COMPLETA
+    st.markdown("### Palabras a Evitar")
+    
+    nube = motor.nube_png('Negativo', colormap='Reds')
+    if nube is None:
+        st.info("Aún no hay términos negativos para dibujar la nube.")
+    else:
+        st.image(nube, caption="Términos con connotación negativa a evitar", use_container_width=True)
+    
+    st.markdown('<div class="epic-insight">', unsafe_allow_html=True)
+    st.markdown("""
+    <div class="epic-insight-title">📌 Precaución en Comunicación</div>
+    <p>Evita términos como "crisis", "problemas" y "riesgos" que generan sentimientos negativos. El contenido negativo tiene menor alcance y compromete la imagen positiva que el EPIC Lab busca proyectar.</p>
+    <p>Cuando tengas algún convenio con alguna entidad gubernamental, evita meterte en temas políticos que puedan generar controversia. Mantén la comunicación enfocada en los objetivos educativos y de emprendimiento.</p>
+    """, unsafe_allow_html=True)
+    st.markdown('</div>', unsafe_allow_html=True)
+    
+    # SECCIÓN 5: PUBLICADORES MÁS INFLUYENTES - PANTALLA COMPLETA
+    st.markdown("### Publicadores Más Influyentes")
+    
+    mostrar_asset("assets/publicadoresmasinflu.png", "Distribución de impresiones por publicador")
+    
+    st.markdown('<div class="epic-insight">', unsafe_allow_html=True)
+    st.markdown("""
+    <div class="epic-insight-title">📌 Oportunidades de Colaboración</div>
+    <p>Establecer un convenio con emprendedor.com sería altamente beneficioso dada su gran influencia y alcance positivo en el ecosistema emprendedor. Esta alianza estratégica aumentaría significativamente la visibilidad del EPIC Lab entre audiencias relevantes y comprometidas.</p>
+    <p>Considera también colaboraciones con otros publicadores influyentes y positivos para maximizar el impacto de tus campañas.</p>
+    """, unsafe_allow_html=True)
+    st.markdown('</div>', unsafe_allow_html=True)
+    
+    # SECCIÓN 6: ANÁLISIS DE FUENTES - PANTALLA COMPLETA
+    st.markdown("### Análisis de Fuentes de Difusión")
+    
+    st.plotly_chart(grafica_plataforma_sentimiento(cubo, EPIC_COLORS), use_container_width=True)
+    st.caption("Distribución de menciones por fuente y sentimiento")
+    
+    # Insight sobre fuentes
+    st.markdown('<div class="epic-insight">', unsafe_allow_html=True)
+    st.markdown(f"""
+    <div class="epic-insight-title">📌 Estrategia de Canales</div>
+    <p>El EPIC Lab debería priorizar su presencia en Instagram, ya que la conversación digital sobre emprendimiento está fuertemente concentrada en esta plataforma. También Facebook y TikTok muestran resultados positivos.</p>
+    <p>Recomendaciones específicas:</p>
+    <ul>
+        <li><strong>Instagram:</strong> Desarrollar una estrategia robusta con publicaciones visuales frecuentes y stories interactivas.</li>
+        <li><strong>Facebook:</strong> Enfocarse en contenido de comunidad y eventos.</li>
+        <li><strong>TikTok:</strong> Crear contenido breve y dinámico para atraer a audiencias más jóvenes.</li>
+        <li><strong>Twitter:</strong> Utilizarlo principalmente para conexiones profesionales y difusión de eventos.</li>
+    </ul>
+    <p>Esta estrategia multicanal, con énfasis en Instagram, permitirá amplificar el impacto del contenido del EPIC Lab.</p>
+    """, unsafe_allow_html=True)
+    st.markdown('</div>', unsafe_allow_html=True)
+    
+    # SECCIÓN 7: RECOMENDACIONES PARA EPIC LAB
+    st.markdown("### Recomendaciones Estratégicas")
+    
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        st.markdown("""
+        <div class="epic-recomendacion">
+            <h4><i class="fas fa-bullhorn"></i> Contenido</h4>
+            <ul>
+                <li>Usar términos positivos como "oportunidad" y "desarrollo"</li>
+                <li>Evitar palabras negativas como "crisis" y "problemas"</li>
+                <li>Destacar historias de éxito de mujeres emprendedoras</li>
+                <li>Crear contenido educativo sobre emprendimiento</li>
+            </ul>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col2:
+        st.markdown("""
+        <div class="epic-recomendacion epic-recomendacion-canales">
+            <h4><i class="fas fa-users"></i> Canales</h4>
+            <ul>
+                <li>Priorizar Instagram como canal principal</li>
+                <li>Complementar con Facebook y TikTok</li>
+                <li>Desarrollar estrategias específicas para cada plataforma</li>
+                <li>Establecer alianza con emprendedor.com</li>
+            </ul>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col3:
+        st.markdown("""
+        <div class="epic-recomendacion epic-recomendacion-medicion">
+            <h4><i class="fas fa-chart-line"></i> Medición</h4>
+            <ul>
+                <li>Monitorear el sentimiento de las menciones semanalmente</li>
+                <li>Seguir la evolución del alcance por plataforma</li>
+                <li>Medir el incremento en participación femenina</li>
+                <li>Evaluar el impacto de colaboraciones con influencers</li>
+            </ul>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    # Botón para descargar reporte completo (simulado)
+    st.markdown("<br>", unsafe_allow_html=True)
+    col1, col2, col3 = st.columns([1, 2, 1])
@@ -0,0 +1,59 @@
+"""
+Página de Instrucciones: guía de uso de la plataforma.
+"""
+
+import streamlit as st
+
+
+# Función para mostrar las instrucciones del sitio web
+def render_instrucciones():
+    st.markdown("""
+    <div class="epic-header">
+        <h1 class="epic-title">Instrucciones del Sitio Web</h1>
+        <p class="epic-subtitle">Guía de uso para EPIC Lab Amplificador de Impacto</p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    st.markdown('<div class="epic-card">', unsafe_allow_html=True)
+    
+    st.markdown("""
+    ## Cómo usar esta plataforma
+    
+    El **EPIC Lab Amplificador de Impacto** es una herramienta diseñada para optimizar y amplificar el alcance del contenido del EPIC Lab. A continuación, encontrarás instrucciones sobre cómo sacar el máximo provecho de cada sección:
+    
+    ### 📊 Dashboard
+    El panel principal te muestra un resumen de las métricas clave de la conversación digital sobre emprendimiento.
+    
+    ### 📈 Epic Lab Analytics
+    Explora análisis detallados sobre las menciones, sentimiento y temas relacionados con la conversación digital sobre el EPIC Lab.
+    
+    ### 🚀 Contenido
+    Esta sección te ofrece herramientas para optimizar tu contenido:
+    
+    - **Recomendador**: Obtén sugerencias personalizadas según tu audiencia y plataforma.
+    - **Impacto Social**: Analiza el potencial de viralidad e impacto de tus publicaciones.
+    - **Hashtags**: Genera hashtags relevantes para maximizar el alcance.
+    - **Horarios**: Descubre los mejores momentos para publicar en cada plataforma.
+    
+    ### 🔮 Predicciones
+    Visualiza proyecciones sobre el crecimiento futuro de menciones y alcance para planificar mejor tus estrategias.
+    
+    ### 📰 Noticias
+    Mantente al día con las últimas tendencias del ecosistema emprendedor y de innovación relevantes para el EPIC Lab.
+    
+    ### 💬 Asistente
+    Consulta al asistente inteligente para obtener ideas, sugerencias y responder preguntas sobre estrategias de contenido.
+    
+    ## Objetivos principales
+    
+    Esta plataforma fue diseñada para resolver el reto de **"Cómo hacer que el contenido del EPIC Lab llegue a más personas"** a través de:
+    
+    1. Análisis de datos para entender patrones de éxito
+    2. Recomendaciones personalizadas basadas en audiencia y formato
+    3. Optimización de contenido para mayor impacto social
+    4. Herramientas para maximizar el alcance orgánico
+    
+    Si tienes alguna duda adicional, puedes consultar al Asistente Inteligente en la sección correspondiente.
+    """, unsafe_allow_html=True)
+    
+    st.markdown('</div>', unsafe_allow_html=True)
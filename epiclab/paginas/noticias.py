@@ -0,0 +1,171 @@
+"""
+Página Noticias: artículos de NewsAPI por tema, con noticias simuladas de respaldo.
+"""
+
+import streamlit as st
+
+from epiclab.compartido import obtener_agregador_noticias, obtener_cache_miniaturas
+from epiclab.noticias import CONSULTAS_TEMAS
+
+
+# Función para obtener noticias de emprendimiento
+
+def obtener_noticias_emprendimiento(tema=None, cantidad=8):
+    """
+    Obtiene noticias de emprendimiento usando NewsAPI.
+    Las consultas por tema se lanzan en paralelo y se combinan en un almacén local
+    sin duplicados; la página lee de ese almacén y se actualiza en segundo plano.
+    """
+    agregador = obtener_agregador_noticias()
+    articulos = agregador.articulos(cantidad, tema)
+    if not articulos and agregador.ultimo_error:
+        return {"error": agregador.ultimo_error}
+    return {"articles": articulos}
+
+# Tab de Noticias
+def tab_noticias():
+    st.markdown('<h2 class="epic-section-title">Noticias de Emprendimiento e Innovación</h2>', unsafe_allow_html=True)
+    
+    st.markdown('<div class="epic-card">', unsafe_allow_html=True)
+    st.subheader("Últimas noticias relevantes para el ecosistema EPIC Lab")
+    
+    # Variable para controlar si queremos usar API real o simulación
+    uso_api = True
+    
+    if uso_api:
+        tema = st.selectbox("Tema", ["Todos"] + list(CONSULTAS_TEMAS), key="tema_noticias")
+        with st.spinner("Obteniendo las últimas noticias..."):
+            noticias = obtener_noticias_emprendimiento(None if tema == "Todos" else tema)
+            
+            if "error" in noticias:
+                st.error(f"No se pudieron cargar las noticias: {noticias['error']}")
+                # Si hay error, mostrar noticias simuladas como respaldo
+                usar_simuladas = True
+            else:
+                # Verificar que hay artículos disponibles
+                if not noticias.get("articles"):
+                    st.warning("No se encontraron noticias recientes. Mostrando noticias simuladas.")
+                    usar_simuladas = True
+                else:
+                    usar_simuladas = False
+                    
+                    # Miniaturas locales de 150px (cada imagen remota se descarga una sola vez)
+                    miniaturas = obtener_cache_miniaturas().obtener(
+                        [articulo.get("urlToImage") for articulo in noticias["articles"]]
+                    )
+                    
+                    for articulo in noticias.get("articles", []):
+                        with st.container():
+                            col1, col2 = st.columns([1, 3])
+                            
+                            # Imagen (si está disponible)
+                            with col1:
+                                if miniaturas.get(articulo.get("urlToImage")):
+                                    st.image(miniaturas[articulo["urlToImage"]], width=150)
+                                else:
+                                    # Usar un placeholder si no hay imagen
+                                    st.markdown('<div class="epic-noticia-imagen">EPIC News</div>', unsafe_allow_html=True)
+                            
+                            # Información del artículo
+                            with col2:
+                                titulo = articulo.get('title', 'Sin título')
+                                url = articulo.get('url', '#')
+                                fuente = articulo.get('source', {}).get('name', 'Fuente desconocida')
+                                fecha = articulo.get('publishedAt', '')[:10] if articulo.get('publishedAt') else ''
+                                descripcion = articulo.get('description', 'Sin descripción disponible')
+                                
+                                st.markdown(f"#### [{titulo}]({url})")
+                                st.markdown(f"*{fuente} | {fecha}*")
+                                st.markdown(f"{descripcion}")
+                            
+                            st.markdown("<hr class='epic-separador'>", unsafe_allow_html=True)
+    
+        # Si no pudimos obtener noticias reales, mostrar simuladas
+        if uso_api and usar_simuladas:
+            # Código para noticias simuladas (como respaldo)
+            mostrar_noticias_simuladas()
+    else:
+        # Si decidimos no usar la API, mostrar simuladas
+        mostrar_noticias_simuladas()
+    
+    # Insight sobre noticias y tendencias
+    st.markdown('<div class="epic-insight">', unsafe_allow_html=True)
+    st.markdown("""
+    <div class="epic-insight-title">📌 Insight sobre tendencias</div>
+    <p>Mantenerse al día con las últimas noticias del ecosistema emprendedor permite identificar oportunidades y tendencias emergentes.
+    Los participantes del EPIC Lab que siguen activamente las noticias del sector tienen un 40% más de probabilidades de conseguir inversión.</p>
+    """, unsafe_allow_html=True)
+    st.markdown('</div>', unsafe_allow_html=True)
+    
+    st.markdown('</div>', unsafe_allow_html=True)
+
+# Función auxiliar para mostrar noticias simuladas
+def mostrar_noticias_simuladas():
+    # Noticias simuladas
+    noticias_simuladas = [
+        {
+            "title": "Startups mexicanas atraen inversión récord en 2025",
+            "source": "El Economista",
+            "date": "2025-03-15",
+            "description": "El ecosistema emprendedor mexicano recibió más de $1,200 millones USD en inversiones durante el primer trimestre, mostrando un crecimiento del 45% respecto al año anterior.",
+            "relevancia": "Alta"
+        },
+        {
+            "title": "EPIC Lab del ITAM lanza nueva incubadora especializada en fintech",
+            "source": "Expansión",
+            "date": "2025-03-10",
+            "description": "El laboratorio de emprendimiento e innovación del ITAM anuncia un programa especializado para startups fintech con mentores internacionales y acceso a capital semilla.",
+            "relevancia": "Muy alta"
+        },
+        {
+            "title": "La inteligencia artificial transforma los modelos de negocio tradicionales",
+            "source": "Forbes México",
+            "date": "2025-03-08",
+            "description": "Un estudio revela que el 65% de las empresas establecidas están adoptando tecnologías de IA para reinventar sus operaciones y competir con startups tecnológicas.",
+            "relevancia": "Media"
+        },
+        {
+            "title": "MAD Fellows presenta resultados impactantes en Demo Day 2025",
+            "source": "Entrepreneur",
+            "date": "2025-03-05",
+            "description": "Los proyectos presentados por la nueva generación de MAD Fellows muestran soluciones innovadoras en sectores como salud, educación y sustentabilidad.",
+            "relevancia": "Alta"
+        },
+        {
+            "title": "Gobierno mexicano anuncia nuevo fondo para emprendedores",
+            "source": "El Universal",
+            "date": "2025-02-28",
+            "description": "La Secretaría de Economía destinará $500 millones de pesos para apoyar a emprendedores en etapas tempranas, con énfasis en proyectos de impacto social.",
+            "relevancia": "Media"
+        }
+    ]
+    
+    # Mostrar noticias simuladas
+    for noticia in noticias_simuladas:
+        with st.container():
+            col1, col2 = st.columns([3, 1])
+            
+            with col1:
+                st.markdown(f"### {noticia['title']}")
+                st.markdown(f"*{noticia['source']} | {noticia['date']}*")
+                st.markdown(f"{noticia['description']}")
+            
+            with col2:
+                relevancia = noticia['relevancia']
+                clase = "epic-relevancia-alta" if relevancia == "Alta" else ("epic-relevancia-media" if relevancia == "Media" else "")
+                st.markdown(f'<div class="epic-relevancia {clase}">Relevancia: {relevancia}</div>', unsafe_allow_html=True)
+            
+            st.markdown("<hr class='epic-separador'>", unsafe_allow_html=True)
+
+
+# Función para Noticias
+def render_noticias():
+    st.markdown("""
+    <div class="epic-header">
+        <h1 class="epic-title">Noticias & Tendencias</h1>
+        <p class="epic-subtitle">Mantente al día con el ecosistema emprendedor</p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # Usar la función existente para mostrar noticias
+    tab_noticias()
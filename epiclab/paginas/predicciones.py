@@ -0,0 +1,170 @@
+"""
+Página Predicciones: pronóstico de menciones e impacto esperado de un contenido.
+Las gráficas vienen de la caché de figuras de epiclab.graficas.
+"""
+
+import streamlit as st
+
+from epiclab.aleatorio import semilla_efectiva
+from epiclab.compartido import obtener_forecast_impacto
+from epiclab.graficas import grafica_alcance_impacto, grafica_forecast_menciones
+from epiclab.paginas.tema import EPIC_COLORS
+from epiclab.pronostico import generar_forecast_menciones
+
+
+@st.fragment
+def panel_impacto_contenido():
+    # Fragmento: mover el slider de viralidad solo vuelve a simular y dibujar este panel
+    st.markdown('<div class="epic-card">', unsafe_allow_html=True)
+    st.subheader("Predicción de Impacto de Contenido")
+    
+    # Usar el score de viralidad de la pestaña de Medidor de Impacto Social si está disponible
+    if 'ultimo_score' in st.session_state:
+        score_viralidad = st.session_state.ultimo_score['viralidad']
+        st.markdown(
+            f'<div class="epic-etiquetas"><span class="epic-etiqueta epic-etiqueta-score">Score de Viralidad: {score_viralidad}/100</span>'
+            '<span class="epic-cifra-etiqueta">(Del último análisis de impacto social)</span></div>',
+            unsafe_allow_html=True
+        )
+    else:
+        # Slider más bonito usando el estilo de la aplicación
+        st.markdown("**Selecciona el Score de Viralidad para la Simulación:**")
+        score_viralidad = st.slider("", 0, 100, 50, key="slider_viralidad")
+    
+    with st.spinner("Simulando curva de crecimiento..."):
+        # Forecast de impacto; en modo determinista se memoiza por (score, día) y volver a un
+        # score ya visto no vuelve a simular ni a dibujar
+        impacto_df = obtener_forecast_impacto(score_viralidad)
+        
+        # Gráfico del alcance con su banda p10-p90 (memoizado por datos y colores si la curva se repite)
+        st.plotly_chart(
+            grafica_alcance_impacto(impacto_df, EPIC_COLORS, memoizar=semilla_efectiva() is not None),
+            use_container_width=True
+        )
+        
+        # Calcular crecimiento total y métricas
+        crecimiento_total = ((impacto_df['alcance'].iloc[-1] / impacto_df['alcance'].iloc[0]) - 1) * 100
+        alcance_total = int(round(impacto_df['media'].iloc[-1]))
+        
+        # Mostrar métricas en contenedor atractivo
+        st.markdown('<div class="epic-metric-container">', unsafe_allow_html=True)
+        
+        st.markdown(f"""
+        <div class="epic-metric">
+            <div class="epic-metric-value">+{crecimiento_total:.1f}%</div>
+            <div class="epic-metric-label">Crecimiento Total</div>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        st.markdown(f"""
+        <div class="epic-metric">
+            <div class="epic-metric-value">{alcance_total:,}</div>
+            <div class="epic-metric-label">Alcance Total Esperado (p10-p90: {impacto_df['p10'].iloc[-1]:,}-{impacto_df['p90'].iloc[-1]:,})</div>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        st.markdown('</div>', unsafe_allow_html=True)
+        
+        # Recomendaciones personalizadas según score de viralidad
+        st.markdown('<div class="epic-insight">', unsafe_allow_html=True)
+        
+        if score_viralidad >= 80:
+            st.markdown("""
+            <div class="epic-insight-title">📌 Estrategia de Alto Impacto</div>
+            <p>Tu contenido tiene potencial viral excepcional:</p>
+            <ul>
+                <li>Programa publicaciones en horarios de máxima actividad</li>
+                <li>Invierte en promoción para amplificar el alcance inicial</li>
+                <li>Prepara contenido de seguimiento para mantener el momentum</li>
+            </ul>
+            """, unsafe_allow_html=True)
+        elif score_viralidad >= 60:
+            st.markdown("""
+            <div class="epic-insight-title">📌 Estrategia de Crecimiento</div>
+            <p>Tu contenido tiene buen potencial de crecimiento:</p>
+            <ul>
+                <li>Incluye llamados a la acción claros para aumentar compartidos</li>
+                <li>Etiqueta a personas o instituciones relevantes</li>
+                <li>Responde rápidamente a los comentarios para aumentar el engagement</li>
+            </ul>
+            """, unsafe_allow_html=True)
+        else:
+            st.markdown("""
+            <div class="epic-insight-title">📌 Estrategia de Optimización</div>
+            <p>Tu contenido tiene potencial de mejora:</p>
+            <ul>
+                <li>Revisa las sugerencias del Medidor de Impacto Social</li>
+                <li>Añade elementos visuales o datos impactantes</li>
+                <li>Prueba diferentes formatos para el mismo mensaje</li>
+            </ul>
+            """, unsafe_allow_html=True)
+        
+        st.markdown('</div>', unsafe_allow_html=True)
+    
+    st.markdown('</div>', unsafe_allow_html=True)
+
+
+# Función para Predicciones
+def render_predictions(cubo):
+    st.markdown("""
+    <div class="epic-header">
+        <h1 class="epic-title">Predicciones & Análisis</h1>
+        <p class="epic-subtitle">Anticipa tendencias y optimiza tu estrategia</p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # Crear subtabs más limpios
+    subtab1, subtab2 = st.tabs(["Forecast de Menciones", "Impacto de Contenido"])
+    
+    # Subtab 1: Forecast de menciones
+    with subtab1:
+        st.markdown('<div class="epic-card">', unsafe_allow_html=True)
+        st.subheader("Predicción de Menciones")
+        st.markdown("Proyección de menciones del EPIC Lab para los próximos 7 días")
+        
+        # Serie a pronosticar: total, una plataforma o un tema (todas se ajustan juntas y se memoizan)
+        opciones_serie = {"Todas las menciones": ('total', None)}
+        opciones_serie.update({f"Plataforma: {p}": ('plataforma', p) for p in cubo.categorias['plataforma']})
+        opciones_serie.update({f"Tema: {t}": ('tema', t) for t in cubo.categorias['tema']})
+        serie = st.selectbox("Serie", list(opciones_serie), key="serie_forecast")
+        dimension_serie, valor_serie = opciones_serie[serie]
+        
+        with st.spinner("Analizando datos históricos..."):
+            # Generar forecast con su intervalo de predicción
+            forecast_df = generar_forecast_menciones(cubo, dimension_serie, valor_serie)
+            
+            # Gráfico del histórico, la predicción y su intervalo (memoizado por datos y colores)
+            st.plotly_chart(grafica_forecast_menciones(forecast_df, EPIC_COLORS), use_container_width=True)
+            
+            # Calcular crecimiento proyectado
+            ultimo_historico = forecast_df[forecast_df['tipo'] == 'Histórico']['menciones'].iloc[-1]
+            ultimo_prediccion = forecast_df[forecast_df['tipo'] == 'Predicción']['menciones'].iloc[-1]
+            # Sin menciones el último día (p. ej. una plataforma o tema poco activo) no hay base para la variación
+            crecimiento = "n/d" if ultimo_historico == 0 else f"{((ultimo_prediccion / ultimo_historico) - 1) * 100:+.1f}%"
+            
+            # Mostrar métrica de manera más atractiva
+            st.markdown(
+                f'<div class="epic-cifra epic-cifra-resaltada"><div class="epic-cifra-valor">{crecimiento}</div>'
+                '<div class="epic-cifra-etiqueta">Crecimiento Proyectado</div></div>',
+                unsafe_allow_html=True
+            )
+            
+            # Insight sobre las predicciones
+            menciones_tema = cubo.por('tema')
+            st.markdown('<div class="epic-insight">', unsafe_allow_html=True)
+            st.markdown(f"""
+            <div class="epic-insight-title">📌 Estrategias recomendadas</div>
+            <p>Basado en la proyección de crecimiento, recomendamos:</p>
+            <ul>
+                <li>Aumentar la frecuencia de publicación en {cubo.por('plataforma').idxmax()}</li>
+                <li>Crear contenido sobre los temas de mayor interés: {menciones_tema.idxmax()} {" y " + menciones_tema.nlargest(2).index[1] if len(menciones_tema) > 1 else ""}</li>
+                <li>Mantener el tono positivo que ha funcionado bien</li>
+            </ul>
+            """, unsafe_allow_html=True)
+            st.markdown('</div>', unsafe_allow_html=True)
+        
+        st.markdown('</div>', unsafe_allow_html=True)
+    
+    # Subtab 2: Forecast de impacto de contenido
+    with subtab2:
+        panel_impacto_contenido()
@@ -0,0 +1,626 @@
+"""
+Paleta de colores y hoja de estilos de la aplicación.
+Los componentes RGB de la paleta y la hoja de estilos se calculan una sola vez
+al importar el módulo. Las páginas usan las clases de la hoja en lugar de
+estilos en línea, y el texto de la hoja es idéntico en cada rerun, así que
+Streamlit la envía completa una vez por sesión y después solo su hash.
+"""
+
+import re
+from functools import lru_cache
+
+import streamlit as st
+
+# Paleta de colores del EPIC Lab con estilo moderno
+EPIC_COLORS = {
+    'primary': '#2E8B57',       # Verde oscuro (del logo EPIC Lab)
+    'secondary': '#8BC34A',     # Verde claro (del logo EPIC Lab)
+    'accent': '#66BB6A',        # Verde medio para acentos
+    'light_bg': '#F8F9FC',      # Fondo claro
+    'dark_bg': '#E8E8E8',       # Fondo oscuro (derivado del verde primario)
+    'card_bg': '#FFFFFF',       # Fondo de tarjeta
+    'text_primary': '#2E3B33',  # Texto principal (derivado del verde)
+    'text_secondary': '#637B64', # Texto secundario (derivado del verde)
+    'success': '#4CAF50',       # Verde éxito
+    'warning': '#FFC107',       # Amarillo advertencia
+    'danger': '#F44336',        # Rojo peligro
+    'chart1': '#2E8B57',        # Verde principal para gráficos
+    'chart2': '#8BC34A',        # Verde secundario para gráficos
+    'chart3': '#CDDC39',        # Verde-amarillo para gráficos
+    'chart4': '#66BB6A',        # Verde medio para gráficos
+    'chart5': '#81C784',        # Verde pálido para gráficos
+    'gradient_start': '#2E8B57', # Inicio de gradiente (verde oscuro)
+    'gradient_end': '#8BC34A',   # Fin de gradiente (verde claro)
+}
+
+
+@lru_cache(maxsize=None)
+def hex_rgba(color, alfa):
+    """Color hexadecimal '#rrggbb' como 'rgba(r, g, b, alfa)'; cada combinación se convierte una vez."""
+    r, g, b = (int(color[i:i + 2], 16) for i in (1, 3, 5))
+    return f'rgba({r}, {g}, {b}, {alfa})'
+
+
+def rgba(nombre, alfa):
+    """Color `nombre` de la paleta como 'rgba(r, g, b, alfa)'."""
+    return hex_rgba(EPIC_COLORS[nombre], alfa)
+
+
+def _minificar(css):
+    # Sin comentarios ni espacios de sobra: menos bytes por sesión
+    css = re.sub(r'/\*.*?\*/', '', css, flags=re.DOTALL)
+    css = re.sub(r'\s+', ' ', css)
+    return re.sub(r'\s*([{}:;,>])\s*', r'\1', css).replace(';}', '}').strip()
+
+
+# Estilos CSS modernos
+HOJA_ESTILOS = _minificar(f"""
+<style>
+    /* Estilo general */
+    .main {{
+        background-color: {EPIC_COLORS['light_bg']};
+        padding: 0rem;
+    }}
+    
+    /* Contenedor principal */
+    .block-container {{
+        padding-top: 1rem;
+        padding-bottom: 1rem;
+        max-width: 100%;
+    }}
+    
+    /* Header principal */
+    .epic-header {{
+        background: linear-gradient(120deg, {EPIC_COLORS['gradient_start']}, {EPIC_COLORS['gradient_end']});
+        border-radius: 16px;
+        padding: 1.5rem 2rem;
+        margin-bottom: 1.5rem;
+        color: white;
+        box-shadow: 0 8px 20px rgba(46, 139, 87, 0.2);
+    }}
+    
+    .epic-title {{
+        font-weight: 700;
+        font-size: 2.2rem;
+        margin: 0;
+        line-height: 1.2;
+    }}
+    
+    .epic-subtitle {{
+        font-size: 1.1rem;
+        font-weight: 400;
+        margin-top: 0.5rem;
+        opacity: 0.9;
+    }}
+    
+    /* Tarjetas */
+    .epic-card {{
+        background-color: {EPIC_COLORS['card_bg']};
+        border-radius: 12px;
+        padding: 1.5rem;
+        box-shadow: 0 4px 16px rgba(29, 43, 76, 0.06);
+        margin-bottom: 1.25rem;
+    }}
+    
+    /* Tarjetas métricas */
+    .epic-metric-container {{
+        display: flex;
+        flex-wrap: wrap;
+        gap: 1rem;
+        margin-bottom: 1.5rem;
+    }}
+    
+    .epic-metric {{
+        background-color: {EPIC_COLORS['card_bg']};
+        border-radius: 12px;
+        padding: 1.25rem;
+        flex: 1;
+        min-width: 200px;
+        box-shadow: 0 4px 12px rgba(46, 139, 87, 0.08);
+        text-align: center;
+        border-bottom: 3px solid {EPIC_COLORS['primary']};
+        transition: transform 0.3s ease;
+    }}
+    
+    .epic-metric:hover {{
+        transform: translateY(-5px);
+    }}
+    
+    .epic-metric-value {{
+        font-size: 2.2rem;
+        font-weight: 700;
+        color: {EPIC_COLORS['primary']};
+        margin-bottom: 0.25rem;
+    }}
+    
+    .epic-metric-label {{
+        color: {EPIC_COLORS['text_secondary']};
+        font-weight: 500;
+    }}
+    
+    /* Insights */
+    .epic-insight {{
+        background-color: rgba(46, 139, 87, 0.06);
+        border-left: 4px solid {EPIC_COLORS['primary']};
+        padding: 1rem 1.5rem;
+        border-radius: 0 12px 12px 0;
+        margin-top: 1rem;
+    }}
+    
+    .epic-insight-title {{
+        font-weight: 600;
+        color: {EPIC_COLORS['primary']};
+        font-size: 1.1rem;
+        margin-bottom: 0.5rem;
+    }}
+    
+    /* Botones y acciones */
+    .stButton > button {{
+        border-radius: 8px;
+        font-weight: 600;
+        padding: 0.5rem 1.25rem;
+        border: none;
+        background-color: {EPIC_COLORS['primary']};
+        color: white;
+        transition: all 0.3s ease;
+    }}
+    
+    .stButton > button:hover {{
+        background-color: {EPIC_COLORS['accent']};
+        box-shadow: 0 4px 12px rgba(46, 139, 87, 0.15);
+    }}
+    
+    /* Input fields */
+    .stTextInput > div > div > input,
+    .stTextArea > div > div > textarea {{
+        border-radius: 8px;
+        border: 1px solid #E0E0E0;
+        padding: 0.75rem;
+    }}
+    
+    .stTextInput > div > div > input:focus,
+    .stTextArea > div > div > textarea:focus {{
+        border-color: {EPIC_COLORS['primary']};
+        box-shadow: 0 0 0 2px rgba(46, 139, 87, 0.1);
+    }}
+    
+    /* Selectbox */
+    .stSelectbox > div > div {{
+        border-radius: 8px;
+    }}
+    
+    /* Tabs modernos */
+    .stTabs [data-baseweb="tab-list"] {{
+        gap: 0.5rem;
+        border-radius: 10px;
+        background-color: {EPIC_COLORS['light_bg']};
+        padding: 0.25rem;
+    }}
+    
+    .stTabs [data-baseweb="tab"] {{
+        border-radius: 8px;
+        padding: 0.75rem 1.5rem;
+        font-weight: 500;
+        color: {EPIC_COLORS['text_primary']};
+    }}
+    
+    .stTabs [aria-selected="true"] {{
+        background-color: {EPIC_COLORS['primary']};
+        color: white !important;
+    }}
+    
+    /* Sidebar */
+    [data-testid="stSidebar"] {{
+        background-color: {EPIC_COLORS['dark_bg']};
+        padding-top: 2rem;
+    }}
+    
+    [data-testid="stSidebar"] [data-testid="stVerticalBlock"] {{
+        padding-top: 0;
+    }}
+    
+    /* Sombras y elevación */
+    .epic-elevated {{
+        box-shadow: 0 8px 26px rgba(0, 0, 0, 0.08);
+        transition: all 0.3s ease;
+    }}
+    
+    .epic-elevated:hover {{
+        box-shadow: 0 12px 36px rgba(0, 0, 0, 0.12);
+        transform: translateY(-5px);
+    }}
+    
+    /* Hashtags */
+    .epic-hashtag {{
+        display: inline-block;
+        background-color: rgba(139, 195, 74, 0.15);
+        color: {EPIC_COLORS['primary']};
+        padding: 0.5rem 1rem;
+        border-radius: 8px;
+        margin: 0.5rem 0.5rem 0.5rem 0;
+        font-weight: 500;
+        transition: all 0.3s ease;
+    }}
+    
+    .epic-hashtag:hover {{
+        background-color: rgba(139, 195, 74, 0.25);
+        transform: translateY(-2px);
+    }}
+    
+    /* Contenedores de estadísticas */
+    .stat-container {{
+        background: white;
+        border-radius: 12px;
+        padding: 1.25rem;
+        box-shadow: 0 4px 16px rgba(0, 0, 0, 0.06);
+        margin-bottom: 1rem;
+        transition: transform 0.3s ease;
+    }}
+    
+    .stat-container:hover {{
+        transform: translateY(-5px);
+    }}
+    
+    /* Contenedor AI Assistant */
+    .ai-assistant-container {{
+        background: linear-gradient(120deg, rgba(46, 139, 87, 0.03), rgba(139, 195, 74, 0.06));
+        border-radius: 12px;
+        padding: 1.25rem;
+        box-shadow: 0 4px 12px rgba(46, 139, 87, 0.1);
+        margin-top: 1.5rem;
+    }}
+    
+    /* Mensaje del asistente */
+    .assistant-message {{
+        background-color: white;
+        padding: 12px 16px;
+        border-radius: 10px;
+        margin-bottom: 12px;
+        box-shadow: 0 2px 10px rgba(0,0,0,0.04);
+        border-left: 3px solid {EPIC_COLORS['primary']};
+    }}
+    
+    /* Mensaje del usuario */
+    .user-message {{
+        background-color: rgba(46, 139, 87, 0.08);
+        padding: 12px 16px;
+        border-radius: 10px;
+        margin-bottom: 12px;
+        border-right: 3px solid {EPIC_COLORS['secondary']};
+    }}
+    
+    /* Barra lateral: usuario y notificaciones */
+    .epic-usuario {{
+        background-color: {rgba('primary', 0.1)};
+        border-radius: 10px;
+        padding: 10px;
+        margin-bottom: 20px;
+        display: flex;
+        align-items: center;
+        gap: 10px;
+    }}
+    
+    .epic-usuario img {{
+        width: 50px;
+        height: 50px;
+        border-radius: 25px;
+    }}
+    
+    .epic-usuario-nombre {{
+        font-size: 16px;
+        font-weight: 600;
+    }}
+    
+    .epic-usuario-rol {{
+        font-size: 12px;
+        color: {EPIC_COLORS['primary']};
+    }}
+    
+    .epic-notificacion {{
+        background-color: {rgba('primary', 0.1)};
+        border-radius: 8px;
+        padding: 8px;
+        margin-bottom: 8px;
+    }}
+    
+    .epic-notificacion-nueva {{
+        background-color: {rgba('secondary', 0.1)};
+    }}
+    
+    .epic-notificacion-titulo {{
+        font-size: 13px;
+        font-weight: 600;
+    }}
+    
+    .epic-notificacion-texto {{
+        font-size: 11px;
+        color: {EPIC_COLORS['text_secondary']};
+    }}
+    
+    /* Notas y cifras destacadas */
+    .epic-nota {{
+        font-size: 0.8rem;
+        color: #777;
+    }}
+    
+    .epic-metric-detalle {{
+        font-size: 0.7rem;
+    }}
+    
+    .epic-periodo {{
+        font-size: 0.9rem;
+        color: #666;
+    }}
+    
+    .epic-destacado {{
+        text-align: center;
+        margin: 20px 0;
+        font-size: 1.2rem;
+        font-weight: 600;
+    }}
+    
+    .epic-cifra {{
+        text-align: center;
+        margin-bottom: 20px;
+    }}
+    
+    .epic-cifra-valor {{
+        font-size: 2rem;
+        font-weight: 700;
+        color: {EPIC_COLORS['primary']};
+    }}
+    
+    .epic-cifra-etiqueta {{
+        font-size: 0.9rem;
+        color: {EPIC_COLORS['text_secondary']};
+    }}
+    
+    .epic-cifra-resaltada {{
+        background-color: {rgba('primary', 0.063)};
+        padding: 15px;
+        border-radius: 10px;
+        margin: 20px 0;
+    }}
+    
+    .epic-cifra-resaltada .epic-cifra-valor {{
+        font-size: 1.8rem;
+    }}
+    
+    /* Tarjetas de recomendaciones del dashboard */
+    .epic-recomendacion {{
+        background-color: {rgba('primary', 0.1)};
+        border-radius: 12px;
+        padding: 15px;
+        height: 100%;
+    }}
+    
+    .epic-recomendacion h4 {{
+        color: {EPIC_COLORS['primary']};
+        margin-top: 0;
+    }}
+    
+    .epic-recomendacion ul {{
+        padding-left: 20px;
+        margin-bottom: 0;
+    }}
+    
+    .epic-recomendacion-canales {{
+        background-color: {rgba('secondary', 0.1)};
+    }}
+    
+    .epic-recomendacion-canales h4 {{
+        color: {EPIC_COLORS['secondary']};
+    }}
+    
+    .epic-recomendacion-medicion {{
+        background-color: rgba(66, 133, 244, 0.1);
+    }}
+    
+    .epic-recomendacion-medicion h4 {{
+        color: #4285F4;
+    }}
+    
+    /* Etiquetas (público, plataforma, score) */
+    .epic-etiquetas {{
+        display: flex;
+        align-items: center;
+        gap: 5px;
+        margin-bottom: 15px;
+    }}
+    
+    .epic-etiqueta {{
+        background-color: {EPIC_COLORS['primary']};
+        color: white;
+        padding: 5px 10px;
+        border-radius: 20px;
+        font-size: 0.9rem;
+    }}
+    
+    .epic-etiqueta-secundaria {{
+        background-color: {EPIC_COLORS['secondary']};
+    }}
+    
+    .epic-etiqueta-score {{
+        padding: 8px 15px;
+        font-size: 1rem;
+        font-weight: 500;
+        margin-right: 5px;
+    }}
+    
+    /* Barras de puntaje del medidor de impacto */
+    .epic-barra {{
+        margin-bottom: 15px;
+    }}
+    
+    .epic-barra-cabecera {{
+        display: flex;
+        justify-content: space-between;
+        margin-bottom: 5px;
+    }}
+    
+    .epic-barra-valor {{
+        font-weight: 600;
+    }}
+    
+    .epic-barra-fondo {{
+        height: 8px;
+        background-color: #E0E0E0;
+        border-radius: 4px;
+    }}
+    
+    .epic-barra-relleno {{
+        height: 100%;
+        background-color: {EPIC_COLORS['primary']};
+        border-radius: 4px;
+    }}
+    
+    /* Hashtags agrupados; los de marca usan el color primario */
+    .epic-hashtags {{
+        margin-top: 20px;
+    }}
+    
+    .epic-hashtag-primario {{
+        background-color: {rgba('primary', 0.15)};
+    }}
+    
+    /* Horarios óptimos, del más efectivo al menos efectivo */
+    .epic-horario {{
+        background-color: {rgba('secondary', 0.15)};
+        padding: 15px;
+        border-radius: 10px;
+        margin-bottom: 10px;
+        border-left: 4px solid {EPIC_COLORS['primary']};
+    }}
+    
+    .epic-horario-2 {{
+        background-color: {rgba('secondary', 0.135)};
+    }}
+    
+    .epic-horario-3 {{
+        background-color: {rgba('secondary', 0.12)};
+    }}
+    
+    .epic-horario-cabecera {{
+        display: flex;
+        justify-content: space-between;
+        align-items: center;
+    }}
+    
+    .epic-horario-hora {{
+        font-size: 1.2rem;
+        font-weight: 600;
+        color: {EPIC_COLORS['primary']};
+    }}
+    
+    .epic-horario-efectividad {{
+        background-color: {EPIC_COLORS['primary']};
+        color: white;
+        padding: 5px 10px;
+        border-radius: 15px;
+        font-weight: 500;
+    }}
+    
+    .epic-horario p {{
+        margin-top: 8px;
+        margin-bottom: 0;
+    }}
+    
+    /* Noticias */
+    .epic-noticia-imagen {{
+        width: 150px;
+        height: 100px;
+        background-color: {rgba('secondary', 0.25)};
+        display: flex;
+        align-items: center;
+        justify-content: center;
+        color: {EPIC_COLORS['primary']};
+        font-weight: bold;
+        border-radius: 5px;
+    }}
+    
+    .epic-separador {{
+        margin: 15px 0;
+        opacity: 0.3;
+    }}
+    
+    .epic-relevancia {{
+        background-color: {rgba('success', 0.145)};
+        padding: 10px;
+        border-radius: 5px;
+        text-align: center;
+        border-left: 3px solid {EPIC_COLORS['success']};
+        color: {EPIC_COLORS['success']};
+        font-weight: 500;
+    }}
+    
+    .epic-relevancia-alta {{
+        background-color: {rgba('primary', 0.145)};
+        border-left-color: {EPIC_COLORS['primary']};
+        color: {EPIC_COLORS['primary']};
+    }}
+    
+    .epic-relevancia-media {{
+        background-color: {rgba('secondary', 0.145)};
+        border-left-color: {EPIC_COLORS['secondary']};
+        color: {EPIC_COLORS['secondary']};
+    }}
+    
+    /* Mensajes del asesor en el panel desplegable */
+    .epic-chat {{
+        background-color: #f0f2f5;
+        padding: 10px;
+        border-radius: 10px;
+        margin-bottom: 10px;
+    }}
+    
+    .epic-chat-asesor {{
+        background-color: #e9f5ef;
+    }}
+    
+    /* Configuración */
+    .epic-avatar {{
+        width: 100px;
+        height: 100px;
+        border-radius: 50%;
+        background-color: #E0E0E0;
+        display: flex;
+        align-items: center;
+        justify-content: center;
+        margin: 0 auto;
+        font-size: 2.5rem;
+        color: #9E9E9E;
+    }}
+    
+    .epic-integracion {{
+        color: white;
+        padding: 10px;
+        border-radius: 5px;
+        text-align: center;
+    }}
+    
+    .epic-integracion strong {{
+        font-weight: 500;
+    }}
+    
+    .epic-integracion small {{
+        font-size: 0.8rem;
+    }}
+    
+    .epic-integracion-twitter {{
+        background-color: #1DA1F2;
+    }}
+    
+    .epic-integracion-linkedin {{
+        background-color: #0A66C2;
+    }}
+    
+    .epic-integracion-instagram {{
+        background-color: #C13584;
+    }}
+</style>
+""")
+
+
+def aplicar_estilos():
+    """Inyecta la hoja de estilos; al tener solo <style>, st.html no ocupa espacio en la página."""
+    st.html(HOJA_ESTILOS)
@@ -0,0 +1,252 @@
+"""
+Pasarela compartida para las llamadas al modelo de lenguaje.
+Todas las sesiones pasan por un mismo cliente de OpenAI que limita cuántas
+peticiones corren a la vez (semáforo y pool de trabajadores), cuántas salen por
+minuto y cuántos tokens consumen (cubetas de tokens), reintenta los errores
+transitorios con backoff exponencial y jitter, y junta las peticiones idénticas
+que están en vuelo en una sola. Con la cola llena rechaza de inmediato en lugar
+de acumular esperas.
+
+Es compatible con `cliente.chat.completions.create(...)`, así que se puede pasar
+como `cliente` a `asistente.responder` y `asistente.responder_stream`.
+"""
+
+import hashlib
+import json
+import os
+import random
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from types import SimpleNamespace
+
+import numpy as np
+
+LLM_CONCURRENCIA = int(os.environ.get("EPICLAB_LLM_CONCURRENCIA", 4))  # peticiones simultáneas al proveedor
+LLM_PETICIONES_MINUTO = int(os.environ.get("EPICLAB_LLM_RPM", 300))
+LLM_TOKENS_MINUTO = int(os.environ.get("EPICLAB_LLM_TPM", 150000))
+LLM_MAX_COLA = int(os.environ.get("EPICLAB_LLM_MAX_COLA", 32))  # peticiones esperando turno antes de rechazar
+LLM_REINTENTOS = 3
+LLM_BACKOFF_BASE = 0.5  # segundos
+LLM_BACKOFF_TOPE = 8.0
+LLM_ESPERA_MAXIMA = 30.0  # segundos que una petición puede esperar turno
+LLM_TIMEOUT = float(os.environ.get("EPICLAB_LLM_TIMEOUT", 60))
+MAX_METRICAS = 500
+
+
+class PasarelaSaturada(RuntimeError):
+    """La cola de la pasarela está llena o la petición esperó demasiado su turno."""
+
+
+class CubetaTokens:
+    """Cubeta de tokens: `capacidad` de ráfaga que se rellena a `tasa` por segundo."""
+
+    def __init__(self, tasa, capacidad):
+        self.tasa = tasa
+        self.capacidad = capacidad
+        self._disponibles = float(capacidad)
+        self._actualizado = time.monotonic()
+        self._lock = threading.Lock()
+
+    def tomar(self, costo=1, limite=None):
+        """Espera hasta poder tomar `costo` tokens. Regresa False si la espera pasaría de `limite` segundos."""
+        costo = min(costo, self.capacidad)
+        fin = None if limite is None else time.monotonic() + limite
+        while True:
+            with self._lock:
+                ahora = time.monotonic()
+                self._disponibles = min(self.capacidad, self._disponibles + (ahora - self._actualizado) * self.tasa)
+                self._actualizado = ahora
+                if self._disponibles >= costo:
+                    self._disponibles -= costo
+                    return True
+                espera = (costo - self._disponibles) / self.tasa
+            if fin is not None and ahora + espera > fin:
+                return False
+            time.sleep(min(espera, 0.25))
+
+
+def _llave(parametros):
+    crudo = json.dumps(parametros, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha1(crudo.encode("utf-8")).hexdigest()
+
+
+def _es_transitorio(error):
+    import openai
+
+    return isinstance(error, (openai.RateLimitError, openai.APIConnectionError, openai.InternalServerError))
+
+
+def _espera_backoff(intento, error=None):
+    # Full jitter: uniforme entre 0 y el tope exponencial; si el proveedor manda Retry-After se respeta
+    espera = random.uniform(0, min(LLM_BACKOFF_TOPE, LLM_BACKOFF_BASE * 2 ** intento))
+    respuesta = getattr(error, "response", None)
+    try:
+        espera = max(espera, float(respuesta.headers.get("retry-after")))
+    except (AttributeError, TypeError, ValueError):
+        pass
+    return min(espera, LLM_BACKOFF_TOPE)
+
+
+class PasarelaLLM:
+    """
+    `chat.completions.create(...)` con los mismos argumentos que el cliente de OpenAI.
+    Sin streaming la petición corre en el pool y las idénticas en vuelo comparten
+    resultado; con streaming corre en el hilo que la pide y ocupa un lugar del
+    semáforo hasta que termina de leerse.
+    """
+
+    def __init__(self, api_key=None, base_url=None, concurrencia=LLM_CONCURRENCIA,
+                 peticiones_minuto=LLM_PETICIONES_MINUTO, tokens_minuto=LLM_TOKENS_MINUTO,
+                 max_cola=LLM_MAX_COLA, reintentos=LLM_REINTENTOS, timeout=LLM_TIMEOUT, cliente=None):
+        import openai
+
+        # Los reintentos los hace la pasarela (coordinados entre sesiones), no el SDK
+        self._cliente = cliente or openai.OpenAI(api_key=api_key, base_url=base_url, max_retries=0, timeout=timeout)
+        self.max_cola = max_cola
+        self.reintentos = reintentos
+        self._semaforo = threading.BoundedSemaphore(concurrencia)
+        self._pool = ThreadPoolExecutor(max_workers=concurrencia, thread_name_prefix="llm")
+        self._peticiones = CubetaTokens(peticiones_minuto / 60, max(1, peticiones_minuto // 6))
+        self._tokens = CubetaTokens(tokens_minuto / 60, max(1, tokens_minuto // 6))
+        self._lock = threading.Lock()
+        self._en_vuelo = {}  # llave -> Future
+        self._en_cola = 0
+        self._activas = 0
+        self._metricas = deque(maxlen=MAX_METRICAS)  # (espera en cola, latencia del proveedor)
+        self._estadisticas = {"peticiones": 0, "deduplicadas": 0, "reintentos": 0, "errores": 0, "rechazadas": 0}
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self.crear))
+
+    def _contar(self, clave):
+        with self._lock:
+            self._estadisticas[clave] += 1
+
+    def _costo(self, parametros):
+        from epiclab.asistente import contar_mensajes
+
+        return contar_mensajes(parametros.get("messages", [])) + int(parametros.get("max_tokens") or 0)
+
+    def _admitir(self):
+        # Con el lock tomado: backpressure si ya hay demasiadas peticiones esperando turno
+        if self._en_cola >= self.max_cola:
+            self._estadisticas["rechazadas"] += 1
+            raise PasarelaSaturada("El asistente está atendiendo muchas peticiones; intenta de nuevo en unos segundos.")
+        self._en_cola += 1
+        self._estadisticas["peticiones"] += 1
+
+    def _rechazar(self, mensaje):
+        with self._lock:
+            self._en_cola -= 1
+            self._estadisticas["rechazadas"] += 1
+        raise PasarelaSaturada(mensaje)
+
+    def _turno(self, parametros, inicio):
+        # Espera lugar en el semáforo y en las cubetas; el tiempo total cuenta contra LLM_ESPERA_MAXIMA
+        if not self._semaforo.acquire(timeout=LLM_ESPERA_MAXIMA):
+            self._rechazar("Se agotó la espera de turno para el asistente.")
+        restante = max(0.0, LLM_ESPERA_MAXIMA - (time.perf_counter() - inicio))
+        if not (self._peticiones.tomar(1, restante) and self._tokens.tomar(self._costo(parametros), restante)):
+            self._semaforo.release()
+            self._rechazar("Se alcanzó el límite de uso del asistente; intenta de nuevo en unos segundos.")
+        with self._lock:
+            self._en_cola -= 1
+            self._activas += 1
+        return time.perf_counter() - inicio
+
+    def _liberar(self, espera, comienzo):
+        with self._lock:
+            self._activas -= 1
+            self._metricas.append((espera, time.perf_counter() - comienzo))
+        self._semaforo.release()
+
+    def _llamar(self, parametros):
+        # Una llamada al proveedor con reintentos; se ejecuta ya con turno asignado
+        for intento in range(self.reintentos + 1):
+            try:
+                return self._cliente.chat.completions.create(**parametros)
+            except Exception as e:
+                if intento == self.reintentos or not _es_transitorio(e):
+                    self._contar("errores")
+                    raise
+                self._contar("reintentos")
+                time.sleep(_espera_backoff(intento, e))
+
+    def _ejecutar(self, parametros, inicio):
+        espera = self._turno(parametros, inicio)
+        comienzo = time.perf_counter()
+        try:
+            return self._llamar(parametros)
+        finally:
+            self._liberar(espera, comienzo)
+
+    def _terminar(self, llave, futuro):
+        with self._lock:
+            if self._en_vuelo.get(llave) is futuro:
+                del self._en_vuelo[llave]
+
+    def crear(self, **parametros):
+        """Equivalente a `chat.completions.create` del SDK de OpenAI."""
+        if parametros.get("stream"):
+            return self._crear_stream(parametros)
+
+        llave = _llave(parametros)
+        with self._lock:
+            futuro = self._en_vuelo.get(llave)
+            nueva = futuro is None
+            if nueva:
+                self._admitir()
+                futuro = self._en_vuelo[llave] = Future()
+            else:
+                self._estadisticas["deduplicadas"] += 1
+        if nueva:
+            futuro.add_done_callback(lambda f: self._terminar(llave, f))
+            interno = self._pool.submit(self._ejecutar, parametros, time.perf_counter())
+            interno.add_done_callback(lambda f: _propagar(f, futuro))
+        return futuro.result()
+
+    def _crear_stream(self, parametros):
+        with self._lock:
+            self._admitir()
+        espera = self._turno(parametros, time.perf_counter())
+        comienzo = time.perf_counter()
+        try:
+            flujo = self._llamar(parametros)
+        except Exception:
+            self._liberar(espera, comienzo)
+            raise
+        return self._leer_stream(flujo, espera, comienzo)
+
+    def _leer_stream(self, flujo, espera, comienzo):
+        try:
+            yield from flujo
+        finally:
+            self._liberar(espera, comienzo)
+
+    def estadisticas(self):
+        """Contadores, profundidad de la cola y p50/p95 (segundos) de la espera en cola y de la latencia del proveedor."""
+        with self._lock:
+            metricas = list(self._metricas)
+            resultado = dict(self._estadisticas, en_cola=self._en_cola, activas=self._activas, en_vuelo=len(self._en_vuelo))
+        if metricas:
+            esperas, latencias = np.array(metricas).T
+            resultado.update(
+                espera_p50=float(np.percentile(esperas, 50)),
+                espera_p95=float(np.percentile(esperas, 95)),
+                latencia_p50=float(np.percentile(latencias, 50)),
+                latencia_p95=float(np.percentile(latencias, 95)),
+            )
+        return resultado
+
+    def cerrar(self):
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        self._cliente.close()
+
+
+def _propagar(origen, destino):
+    if origen.cancelled():
+        destino.cancel()
+    elif origen.exception() is not None:
+        destino.set_exception(origen.exception())
+    else:
+        destino.set_result(origen.result())
@@ -0,0 +1,221 @@
+"""
+Pronóstico de menciones a partir del cubo de agregados.
+Ajusta en una sola pasada vectorizada un Holt-Winters aditivo con tendencia
+amortiguada (ETS(A,Ad,A), estacionalidad semanal) y un naive estacional para
+la serie total y para cada plataforma y tema, y elige por serie el de menor
+error un paso adelante. Los parámetros ajustados se memoizan por versión del
+cubo, así que los reruns de la página solo evalúan el pronóstico.
+"""
+
+import itertools
+import threading
+from collections import OrderedDict
+from statistics import NormalDist
+
+import numpy as np
+import pandas as pd
+
+HORIZONTE = 7  # días
+ESTACION = 7  # estacionalidad semanal
+NIVEL_INTERVALO = 0.8
+MAX_MEMO = 32
+
+# Malla de parámetros del Holt-Winters: todas las combinaciones se evalúan a la vez
+ALFAS = (0.05, 0.1, 0.2, 0.3, 0.5, 0.7)
+BETAS = (0.01, 0.05, 0.1, 0.2)
+GAMMAS = (0.05, 0.1, 0.2, 0.3)
+PHIS = (0.8, 0.9, 0.98)
+
+_memo = OrderedDict()
+_memo_lock = threading.Lock()
+
+
+class NaiveEstacional:
+    """Repite la última estación observada. `ajustar(Y)` recibe un arreglo (series, días)."""
+
+    nombre = 'naive_estacional'
+
+    def __init__(self, estacion=ESTACION):
+        self.estacion = estacion
+
+    def ajustar(self, Y):
+        Y = np.asarray(Y, dtype=np.float64)
+        m = max(1, min(self.estacion, Y.shape[1] - 1))
+        self.m = m
+        self.ultima = Y[:, -m:]
+        errores = Y[:, m:] - Y[:, :-m]
+        self.sigma = np.sqrt((errores ** 2).mean(axis=1)) if errores.shape[1] else np.zeros(len(Y))
+        self.error = self.sigma if errores.shape[1] else np.full(len(Y), np.inf)  # RMSE un paso adelante
+        return self
+
+    def predecir(self, horizonte=HORIZONTE, nivel=NIVEL_INTERVALO):
+        """(media, inferior, superior), cada uno de forma (series, horizonte)."""
+        pasos = np.arange(horizonte)
+        media = self.ultima[:, pasos % self.m]
+        ancho = NormalDist().inv_cdf(0.5 + nivel / 2) * self.sigma[:, None] * np.sqrt(pasos // self.m + 1)
+        return media, media - ancho, media + ancho
+
+
+class HoltWinters:
+    """
+    Holt-Winters aditivo con tendencia amortiguada, ajustado por mínimos cuadrados
+    sobre la malla ALFAS × BETAS × GAMMAS × PHIS para todas las series a la vez.
+    """
+
+    nombre = 'holt_winters'
+
+    def __init__(self, estacion=ESTACION):
+        self.estacion = estacion
+
+    def ajustar(self, Y):
+        Y = np.asarray(Y, dtype=np.float64)
+        n, dias = Y.shape
+        m = self.estacion
+        if dias < 2 * m:
+            raise ValueError(f"Holt-Winters necesita al menos {2 * m} días de historia")
+        malla = np.array(list(itertools.product(ALFAS, BETAS, GAMMAS, PHIS)))  # (G, 4)
+        alfa, beta, gamma, phi = (malla[:, i, None] for i in range(4))  # (G, 1)
+
+        # Estado inicial a partir de las dos primeras estaciones
+        nivel = np.broadcast_to(Y[:, :m].mean(axis=1), (len(malla), n)).copy()
+        tendencia = np.broadcast_to((Y[:, m:2 * m].mean(axis=1) - Y[:, :m].mean(axis=1)) / m, (len(malla), n)).copy()
+        estacional = np.broadcast_to(Y[:, :m] - Y[:, :m].mean(axis=1, keepdims=True), (len(malla), n, m)).copy()
+
+        # Recursión en el tiempo, vectorizada sobre (parámetros, series)
+        sse = np.zeros((len(malla), n))
+        for t in range(dias):
+            s = estacional[:, :, t % m]
+            error = Y[:, t] - (nivel + phi * tendencia + s)
+            if t >= m:
+                sse += error ** 2
+            nivel_nuevo = alfa * (Y[:, t] - s) + (1 - alfa) * (nivel + phi * tendencia)
+            tendencia = beta * (nivel_nuevo - nivel) + (1 - beta) * phi * tendencia
+            estacional[:, :, t % m] = gamma * (Y[:, t] - nivel_nuevo) + (1 - gamma) * s
+            nivel = nivel_nuevo
+
+        mejor = sse.argmin(axis=0)  # (n,)
+        series = np.arange(n)
+        self.parametros = malla[mejor]
+        self.nivel = nivel[mejor, series]
+        self.tendencia = tendencia[mejor, series]
+        # Estacionalidad alineada para que el índice 0 corresponda al primer día pronosticado
+        self.estacional = np.roll(estacional[mejor, series], -(dias % m), axis=1)
+        self.sigma = np.sqrt(sse[mejor, series] / (dias - m))
+        self.error = self.sigma  # RMSE un paso adelante
+        return self
+
+    def predecir(self, horizonte=HORIZONTE, nivel=NIVEL_INTERVALO):
+        """(media, inferior, superior), cada uno de forma (series, horizonte)."""
+        alfa, beta, gamma, phi = (self.parametros[:, i, None] for i in range(4))
+        pasos = np.arange(1, horizonte + 1)
+        amortiguado = np.cumsum(phi ** pasos, axis=1)  # phi + phi² + ... + phi^h
+        media = self.nivel[:, None] + amortiguado * self.tendencia[:, None] + self.estacional[:, (pasos - 1) % self.estacion]
+
+        # Varianza del error a h pasos: sigma² (1 + Σ_{j<h} c_j²) con c_j = α(1 + β Σ phi^i) + γ(1 - α) [j múltiplo de m]
+        # (β y γ de la forma por componentes; en espacio de estados son αβ y (1 - α)γ)
+        c = alfa * (1 + beta * amortiguado[:, :-1]) + gamma * (1 - alfa) * (pasos[:-1] % self.estacion == 0)
+        varianza = np.concatenate([np.ones((len(c), 1)), 1 + np.cumsum(c ** 2, axis=1)], axis=1)
+        ancho = NormalDist().inv_cdf(0.5 + nivel / 2) * self.sigma[:, None] * np.sqrt(varianza)
+        return media, media - ancho, media + ancho
+
+
+MODELOS = {'holt_winters': HoltWinters, 'naive_estacional': NaiveEstacional}
+
+
+def series_cubo(cubo):
+    """Series diarias del cubo: total, cada plataforma y cada tema. Regresa (etiquetas, arreglo (series, días))."""
+    conteos = cubo.conteos.astype(np.int64)
+    por_plataforma = conteos.sum(axis=(2, 3)).T
+    por_tema = conteos.sum(axis=(1, 2)).T
+    etiquetas = ([('total', None)] + [('plataforma', p) for p in cubo.categorias['plataforma']]
+                 + [('tema', t) for t in cubo.categorias['tema']])
+    return etiquetas, np.vstack([por_plataforma.sum(axis=0), por_plataforma, por_tema])
+
+
+def ajustar_cubo(cubo, modelo='auto'):
+    """
+    Modelos ajustados para todas las series del cubo, memoizados por versión del cubo.
+    Con modelo='auto' cada serie usa el de menor error un paso adelante.
+    """
+    llave = (cubo.clave, modelo)
+    with _memo_lock:
+        if llave in _memo:
+            _memo.move_to_end(llave)
+            return _memo[llave]
+
+    etiquetas, Y = series_cubo(cubo)
+    nombres = list(MODELOS) if modelo == 'auto' else [modelo]
+    ajustados = {}
+    for nombre in nombres:
+        try:
+            ajustados[nombre] = MODELOS[nombre]().ajustar(Y)
+        except ValueError:
+            continue  # historia insuficiente para este modelo
+    if not ajustados:
+        ajustados['naive_estacional'] = NaiveEstacional().ajustar(Y)
+    errores = np.vstack([m.error for m in ajustados.values()])
+    ajuste = {
+        'etiquetas': etiquetas,
+        'indices': {etiqueta: i for i, etiqueta in enumerate(etiquetas)},
+        'modelos': ajustados,
+        'eleccion': np.array(list(ajustados))[errores.argmin(axis=0)],
+        'fecha_fin': cubo.fecha_fin,
+        'historico': Y,
+    }
+    with _memo_lock:
+        _memo[llave] = ajuste
+        while len(_memo) > MAX_MEMO:
+            _memo.popitem(last=False)
+    return ajuste
+
+
+def pronosticar_cubo(cubo, horizonte=HORIZONTE, nivel=NIVEL_INTERVALO, modelo='auto'):
+    """
+    Pronóstico de todas las series del cubo (total, plataformas y temas).
+    Regresa un DataFrame con dimension, valor, modelo, fecha, menciones, inferior y superior.
+    """
+    ajuste = ajustar_cubo(cubo, modelo)
+    n = len(ajuste['etiquetas'])
+    media, inferior, superior = (np.zeros((n, horizonte)) for _ in range(3))
+    for nombre, ajustado in ajuste['modelos'].items():
+        filas = ajuste['eleccion'] == nombre
+        if filas.any():
+            prediccion = ajustado.predecir(horizonte, nivel)
+            for destino, origen in zip((media, inferior, superior), prediccion):
+                destino[filas] = origen[filas]
+
+    fechas = pd.date_range(ajuste['fecha_fin'] + pd.Timedelta(days=1), periods=horizonte, freq='D')
+    dimension, valor = zip(*ajuste['etiquetas'])
+    return pd.DataFrame({
+        'dimension': np.repeat(dimension, horizonte),
+        'valor': np.repeat(np.array(valor, dtype=object), horizonte),
+        'modelo': np.repeat(ajuste['eleccion'], horizonte),
+        'fecha': np.tile(fechas, n),
+        'menciones': np.clip(np.rint(media), 0, None).astype(np.int64).ravel(),
+        'inferior': np.clip(inferior, 0, None).ravel(),
+        'superior': np.clip(superior, 0, None).ravel(),
+    })
+
+
+def generar_forecast_menciones(cubo, dimension='total', valor=None, horizonte=HORIZONTE, nivel=NIVEL_INTERVALO):
+    """
+    Histórico de menciones diarias más una predicción de `horizonte` días para la
+    serie total o para una plataforma o tema. Regresa un DataFrame con columnas
+    fecha, menciones, tipo ('Histórico' o 'Predicción') e intervalo de predicción
+    (inferior, superior; vacíos en el histórico).
+    """
+    ajuste = ajustar_cubo(cubo)
+    i = ajuste['indices'][(dimension, valor)]
+    historico = ajuste['historico'][i].astype(np.int64)
+    ajustado = ajuste['modelos'][ajuste['eleccion'][i]]
+    media, inferior, superior = (p[i] for p in ajustado.predecir(horizonte, nivel))
+
+    fechas_futuras = pd.date_range(ajuste['fecha_fin'] + pd.Timedelta(days=1), periods=horizonte, freq='D')
+    vacio = np.full(len(historico), np.nan)
+    return pd.DataFrame({
+        'fecha': cubo.fechas.append(fechas_futuras),
+        'menciones': np.concatenate([historico, np.clip(np.rint(media), 0, None).astype(np.int64)]),
+        'tipo': ['Histórico'] * len(historico) + ['Predicción'] * horizonte,
+        'inferior': np.concatenate([vacio, np.clip(inferior, 0, None)]),
+        'superior': np.concatenate([vacio, np.clip(superior, 0, None)]),
+    })